@@ -697,15 +697,20 @@ def _run_problem(
     problem.setup()
 
     start_time = time()
-    if mode == "run_model":
-        problem.run_model()
-        problem.optim_failed = False  # Actually, we don't know
-    else:
-        result = problem.run_driver()
-        if isinstance(result, bool):
-            problem.optim_failed = problem.run_driver()
-        else:  # Since OpenMDAO 3.33, a DriverResult instance is returned
-            problem.optim_failed = not result.success
+    try:
+        if mode == "run_model":
+            problem.run_model()
+            problem.optim_failed = False  # Actually, we don't know
+        else:
+            result = problem.run_driver()
+            if isinstance(result, bool):
+                problem.optim_failed = problem.run_driver()
+            else:  # Since OpenMDAO 3.33, a DriverResult instance is returned
+                problem.optim_failed = not result.success
+    finally:
+        # Lets components release their resources, e.g. flight point files that are
+        # written when computation ends.
+        problem.cleanup()
     end_time = time()
     computation_time = round(end_time - start_time, 2)
 
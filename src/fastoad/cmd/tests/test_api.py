@@ -23,6 +23,7 @@ import pytest
 
 import fastoad.models
 from fastoad.io import DataFile
+from fastoad.openmdao.problem import FASTOADProblem
 from fastoad.openmdao.variables import Variable
 
 from .. import api
@@ -454,6 +455,26 @@ def test_optimize_problem(cleanup):
     assert problem["f"] == pytest.approx(3.18339395, abs=1e-8)
 
 
+def test_run_problem_cleanup(cleanup, monkeypatch):
+    # Problem cleanup is needed to have components that write their results when
+    # computation ends (e.g. flight points of missions) actually write them.
+    cleaned_problems = []
+    original_cleanup = FASTOADProblem.cleanup
+
+    def cleanup_spy(problem):
+        cleaned_problems.append(problem)
+        original_cleanup(problem)
+
+    monkeypatch.setattr(FASTOADProblem, "cleanup", cleanup_spy)
+
+    api.generate_inputs(CONFIGURATION_FILE_PATH, DATA_FOLDER_PATH / "inputs.xml", overwrite=True)
+    problem = api.evaluate_problem(CONFIGURATION_FILE_PATH, overwrite=True)
+    assert cleaned_problems == [problem]
+
+    problem = api.optimize_problem(CONFIGURATION_FILE_PATH, overwrite=True)
+    assert cleaned_problems[1:] == [problem]
+
+
 def test_optimization_viewer(cleanup):
     api.generate_inputs(CONFIGURATION_FILE_PATH, DATA_FOLDER_PATH / "inputs.xml", overwrite=True)
 
@@ -16,5 +16,6 @@ Base features for FAST-OAD models
 
 from .atmosphere import Atmosphere, AtmosphereSI
 from .flight_point import FlightPoint
+from .flight_point_buffer import FlightPointBuffer
 
-__all__ = ["Atmosphere", "AtmosphereSI", "FlightPoint"]
+__all__ = ["Atmosphere", "AtmosphereSI", "FlightPoint", "FlightPointBuffer"]
@@ -17,11 +17,12 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Mapping, Sequence
-from copy import deepcopy
-from dataclasses import asdict, dataclass, field, fields
+from dataclasses import dataclass, field, fields
 from numbers import Number
+from operator import attrgetter
 from typing import Any, ClassVar
 
+import numpy as np
 import pandas as pd
 
 from fastoad._utils.arrays import scalarize
@@ -31,6 +32,12 @@ FIELD_DESCRIPTOR = "field_descriptor"
 
 _LOGGER = logging.getLogger(__name__)  # Logger for this module
 
+# Fields that are relative by default. Instances share this frozenset until they are modified.
+_DEFAULT_RELATIVE_PARAMETERS = frozenset({"ground_distance", "time"})
+
+# Value types that do not need to be processed by scalarize()
+_SCALAR_TYPES = {float, int, str, bool, type(None)}
+
 
 @dataclass
 class _FieldDescriptor:
@@ -45,6 +52,71 @@ class _FieldDescriptor:
     unit: str | None = None
 
 
+class _TimeIntegrationTable:
+    """
+    Compiled description of the time integration of cumulative fields.
+
+    Built from the integrable quantities of :class:`FlightPoint`.
+    """
+
+    def __init__(self, integrable_quantities: Mapping[str, str]):
+        """
+        :param integrable_quantities: names of integrand fields, by names of integrable fields
+        """
+        #: Names of fields that are integrated along time.
+        self.integrable_names = tuple(integrable_quantities.keys())
+        #: Names of fields that are time derivatives of integrable fields, in the same order.
+        self.integrand_names = tuple(integrable_quantities.values())
+
+        self._get_integrable_values = self._get_values_getter(self.integrable_names)
+        self._get_integrand_values = self._get_values_getter(self.integrand_names)
+
+    def integrate(self, next_point: FlightPoint, previous_point: FlightPoint, time_step):
+        """
+        Sets integrable fields of `next_point` by incrementing values of `previous_point`
+        by the product of their time derivative and `time_step`.
+
+        :param next_point: modified in place
+        :param previous_point:
+        :param time_step: scalar, or array for flight points with array values
+        """
+        if not self.integrable_names:
+            return
+
+        previous_values = self._get_integrable_values(previous_point)
+        rates = self._get_integrand_values(previous_point)
+        new_values = None
+        if np.ndim(time_step) == 0:
+            try:
+                previous_values = np.asarray(previous_values, dtype=float)
+                rates = np.asarray(rates, dtype=float)
+            except (TypeError, ValueError):
+                pass
+            else:
+                if previous_values.ndim == rates.ndim == 1:
+                    # All values are scalars: all fields are processed in one operation.
+                    new_values = previous_values + rates * time_step
+
+        if new_values is None:
+            new_values = [value + rate * time_step for value, rate in zip(previous_values, rates)]
+
+        for name, value in zip(self.integrable_names, new_values):
+            setattr(next_point, name, value)
+
+    @staticmethod
+    def _get_values_getter(names: tuple[str, ...]):
+        """
+        :param names: field names
+        :return: a function that provides the tuple of values of named fields of a flight point
+        """
+        if not names:
+            return lambda flight_point: ()
+        if len(names) == 1:
+            getter = attrgetter(names[0])
+            return lambda flight_point: (getter(flight_point),)
+        return attrgetter(*names)
+
+
 @dataclass
 class FlightPoint:
     """
@@ -235,9 +307,26 @@ class FlightPoint:
     # Will store field metadata when needed. Must be accessed through _get_field_descriptors()
     __field_descriptors: ClassVar[dict] = {}
     __time_integrable_quantities: ClassVar[dict] = {}
+    # Names of public fields. Must be accessed through _get_field_name_tuple()
+    __field_names: ClassVar[tuple] = ()
+    # Must be accessed through get_time_integration_table()
+    __time_integration_table: ClassVar[_TimeIntegrationTable | None] = None
 
     def __post_init__(self):
-        self._relative_parameters = {"ground_distance", "time"}
+        self._relative_parameters = _DEFAULT_RELATIVE_PARAMETERS
+
+    def copy(self) -> FlightPoint:
+        """
+        Provides a shallow copy of the flight point.
+
+        Field values are not copied, which is enough as long as they are replaced rather than
+        modified in place (e.g. for numpy arrays).
+
+        :return: the copied flight point
+        """
+        new_point = object.__new__(type(self))
+        new_point.__dict__.update(self.__dict__)
+        return new_point
 
     def set_as_relative(self, field_names: Sequence[str] | str):
         """
@@ -247,9 +336,8 @@ class FlightPoint:
         :param field_names:
         """
         if isinstance(field_names, str):
-            self._relative_parameters.add(field_names)
-        else:
-            self._relative_parameters |= set(field_names)
+            field_names = [field_names]
+        self._relative_parameters = self._relative_parameters.union(field_names)
 
     def set_as_absolute(self, field_names: Sequence[str] | str):
         """
@@ -259,9 +347,10 @@ class FlightPoint:
         :param field_names:
         """
         if isinstance(field_names, str):
-            self._relative_parameters.remove(field_names)
-        else:
-            self._relative_parameters -= set(field_names)
+            if field_names not in self._relative_parameters:
+                raise KeyError(field_names)
+            field_names = [field_names]
+        self._relative_parameters = self._relative_parameters.difference(field_names)
 
     def is_relative(self, field_name) -> bool:
         """
@@ -279,13 +368,16 @@ class FlightPoint:
         :param reference_point: relative fields will be made absolute using this point.
         :return: the copied flight point with no relative field.
         """
-        new_point = deepcopy(self)
-        for cls_field in fields(new_point):
-            reference_value = getattr(reference_point, cls_field.name)
-            target_value = getattr(new_point, cls_field.name)
-            if isinstance(target_value, Number) and new_point.is_relative(cls_field.name):
-                setattr(new_point, cls_field.name, reference_value + target_value)
-                new_point.set_as_absolute(cls_field.name)
+        new_point = self.copy()
+        field_names = self._get_field_name_tuple()
+        absolute_field_names = [
+            name
+            for name in self._relative_parameters
+            if name in field_names and isinstance(getattr(new_point, name), Number)
+        ]
+        for name in absolute_field_names:
+            setattr(new_point, name, getattr(reference_point, name) + getattr(new_point, name))
+        new_point._relative_parameters = self._relative_parameters.difference(absolute_field_names)
         new_point.scalarize()
         return new_point
 
@@ -294,16 +386,29 @@ class FlightPoint:
         Convenience method for converting to scalars all fields that have a
         one-item array-like value.
         """
-        self_as_dict = asdict(self)
-        for field_name, value in self_as_dict.items():
-            setattr(self, field_name, scalarize(value))
+        for field_name in self._get_field_name_tuple():
+            value = getattr(self, field_name)
+            if type(value) not in _SCALAR_TYPES:
+                setattr(self, field_name, scalarize(value))
 
     @classmethod
     def get_field_names(cls):
         """
         :return: names of all fields of the flight point.
         """
-        return [cls_field.name for cls_field in fields(cls) if not cls_field.name.startswith("_")]
+        return list(cls._get_field_name_tuple())
+
+    @classmethod
+    def _get_field_name_tuple(cls) -> tuple[str, ...]:
+        """
+        Uses this method instead of accessing cls.__field_names to ensure it
+        will always be correctly populated.
+        """
+        if not cls.__field_names:
+            cls.__field_names = tuple(
+                cls_field.name for cls_field in fields(cls) if not cls_field.name.startswith("_")
+            )
+        return cls.__field_names
 
     @classmethod
     def get_units(cls) -> dict:
@@ -474,6 +579,20 @@ class FlightPoint:
 
         return cls.__time_integrable_quantities
 
+    @classmethod
+    def get_time_integration_table(cls) -> _TimeIntegrationTable:
+        """
+        Provides the object that does the time integration of integrable quantities (see
+        :meth:`get_time_integrable_quantities`).
+
+        It is built at first call after any field has been added or removed.
+        """
+        if cls.__time_integration_table is None:
+            cls.__time_integration_table = _TimeIntegrationTable(
+                cls.get_time_integrable_quantities()
+            )
+        return cls.__time_integration_table
+
     @classmethod
     def get_time_integrand(cls, field_name) -> str:
         """
@@ -495,4 +614,6 @@ class FlightPoint:
             )
 
         cls.__field_descriptors = {}  # Will need to rebuild this dict on next usage.
+        cls.__field_names = ()  # Will need to rebuild this tuple on next usage.
+        cls.__time_integration_table = None  # Will need to rebuild this table on next usage.
         cls.__time_integrable_quantities = {}  # Will need to rebuild this dict on next usage.
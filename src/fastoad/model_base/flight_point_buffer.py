@@ -0,0 +1,263 @@
+"""Column-oriented storage of flight points."""
+
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from collections.abc import Iterable, MutableSequence, Sequence
+from operator import attrgetter
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .flight_point import FlightPoint
+
+DEFAULT_CAPACITY = 256
+
+# Number of last flight points that are kept as FlightPoint instances.
+LIVE_POINT_COUNT = 3
+
+# Number of released flight points that are written in columns at once.
+WRITE_CHUNK_SIZE = 64
+
+
+class FlightPointBuffer(MutableSequence):
+    """
+    Growable, column-oriented storage of flight points.
+
+    It behaves like a list of :class:`~fastoad.model_base.flight_point.FlightPoint` instances,
+    but data are stored as one NumPy array per FlightPoint field, so that a pandas DataFrame
+    can be obtained without converting each flight point.
+
+    Columns are float arrays. A column is turned into an object array only when it receives
+    a value that is not a float (e.g. None, engine setting or name).
+
+    The first flight point and the last ones are kept as FlightPoint instances, so that accessing
+    them is immediate and modifying them is taken into account, as for a list. Other flight points
+    are rebuilt from stored data when accessed: modifying them has no effect on the buffer (use
+    item assignment instead).
+
+        >>> buffer = FlightPointBuffer([FlightPoint(time=0.0, mass=70000.0)])
+        >>> buffer.append(FlightPoint(time=1.0, mass=69999.0))
+        >>> buffer[-1].mass
+        69999.0
+        >>> df = buffer.to_dataframe()
+    """
+
+    def __init__(self, flight_points: Iterable[FlightPoint] = (), capacity: int = DEFAULT_CAPACITY):
+        """
+        :param flight_points: initial content
+        :param capacity: initial number of flight points that can be stored before the
+                         columns have to be enlarged.
+        """
+        self._field_names = FlightPoint.get_field_names()
+        self._get_row = attrgetter(*self._field_names)
+        if len(self._field_names) == 1:
+            get_value = self._get_row
+            self._get_row = lambda flight_point: (get_value(flight_point),)
+
+        self._capacity = max(1, capacity)
+        self._columns = {name: np.empty(self._capacity) for name in self._field_names}
+        self._length = 0
+
+        # FlightPoint instances that have not been written in columns yet, by index.
+        self._live_points: dict[int, FlightPoint] = {}
+
+        # Values of released flight points, that will be written in columns by chunks.
+        self._pending_rows: list[tuple] = []
+        self._pending_start = 0
+
+        for flight_point in flight_points:
+            self.append(flight_point)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int | slice) -> FlightPoint | list[FlightPoint]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+
+        index = self._get_positive_index(index)
+        flight_point = self._live_points.get(index)
+        if flight_point is None:
+            pending_index = index - self._pending_start
+            if 0 <= pending_index < len(self._pending_rows):
+                values = self._pending_rows[pending_index]
+            else:
+                values = self._read_row(index)
+            flight_point = FlightPoint(**dict(zip(self._field_names, values)))
+        return flight_point
+
+    def __setitem__(self, index: int, flight_point: FlightPoint):
+        index = self._get_positive_index(index)
+        if self._is_live(index):
+            self._live_points[index] = flight_point
+        else:
+            self._write_pending_rows()
+            self._live_points.pop(index, None)
+            self._write_rows(index, [self._get_row(flight_point)])
+
+    def __delitem__(self, index: int):
+        index = self._get_positive_index(index)
+        self._flush()
+        if index < self._length - 1:
+            for column in self._columns.values():
+                column[index : self._length - 1] = column[index + 1 : self._length]
+        self._live_points = {
+            i - (i > index): flight_point
+            for i, flight_point in self._live_points.items()
+            if i != index
+        }
+
+        self._length -= 1
+        self._update_live_points()
+
+    def insert(self, index: int, flight_point: FlightPoint):
+        index = min(max(index + self._length if index < 0 else index, 0), self._length)
+        if index < self._length:
+            self._flush()
+            self._reserve(self._length + 1)
+            for column in self._columns.values():
+                column[index + 1 : self._length + 1] = column[index : self._length]
+            self._write_rows(index, [self._get_row(flight_point)])
+            self._live_points = {
+                i + (i >= index): live_point for i, live_point in self._live_points.items()
+            }
+            self._live_points[index] = flight_point
+            self._length += 1
+            self._update_live_points()
+        else:
+            self.append(flight_point)
+
+    def append(self, flight_point: FlightPoint):
+        """Appends provided flight point to the end of the buffer."""
+        self._reserve(self._length + 1)
+        self._live_points[self._length] = flight_point
+        self._length += 1
+
+        # The flight point that is no more among last ones will be written in columns.
+        released_index = self._length - 1 - LIVE_POINT_COUNT
+        if released_index > 0 and released_index in self._live_points:
+            if released_index != self._pending_start + len(self._pending_rows):
+                self._write_pending_rows()
+                self._pending_start = released_index
+            self._pending_rows.append(self._get_row(self._live_points.pop(released_index)))
+            if len(self._pending_rows) >= WRITE_CHUNK_SIZE:
+                self._write_pending_rows()
+
+    def clear(self):
+        self._live_points.clear()
+        self._pending_rows.clear()
+        self._length = 0
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        :return: a pandas DataFrame where column names match fields of
+                 :class:`~fastoad.model_base.flight_point.FlightPoint`, identical to the one
+                 that would be obtained from a list of FlightPoint instances.
+        """
+        if self._length == 0:
+            return pd.DataFrame()
+
+        self._flush()
+        # Object columns are provided as lists to let pandas infer column types as it does
+        # with a list of FlightPoint instances.
+        return pd.DataFrame(
+            {
+                name: column[: self._length].tolist()
+                if column.dtype == object
+                else column[: self._length].copy()
+                for name, column in self._columns.items()
+            }
+        )
+
+    def _get_positive_index(self, index: int) -> int:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("FlightPointBuffer index out of range")
+        return index
+
+    def _is_live(self, index: int) -> bool:
+        return index == 0 or index >= self._length - LIVE_POINT_COUNT
+
+    def _reserve(self, length: int):
+        """Ensures columns can store provided number of flight points."""
+        if length > self._capacity:
+            self._capacity = max(length, 2 * self._capacity)
+            for name, column in self._columns.items():
+                new_column = np.empty(self._capacity, dtype=column.dtype)
+                new_column[: self._length] = column[: self._length]
+                self._columns[name] = new_column
+
+    def _read_row(self, index: int) -> list:
+        # item() provides Python floats from float columns, and stored objects otherwise.
+        return [column.item(index) for column in self._columns.values()]
+
+    def _write_rows(self, start: int, rows: Sequence[tuple]):
+        """Writes values of consecutive flight points in columns, from provided index."""
+        for name, values in zip(self._field_names, zip(*rows)):
+            self._write_values(name, start, values)
+
+    def _write_values(self, name: str, start: int, values: Sequence[Any]):
+        column = self._columns[name]
+        stop = start + len(values)
+        if column.dtype != object:
+            try:
+                float_values = np.array(values)
+            except ValueError:  # e.g. arrays of different sizes
+                float_values = None
+            if (
+                float_values is not None
+                and float_values.ndim == 1
+                and float_values.dtype.kind == "f"
+            ):
+                column[start:stop] = float_values
+                return
+
+            # Non-float value: column falls back to object type.
+            column = column.astype(object)
+            self._columns[name] = column
+
+        column[start:stop] = np.fromiter(values, dtype=object, count=len(values))
+
+    def _write_pending_rows(self):
+        if self._pending_rows:
+            self._write_rows(self._pending_start, self._pending_rows)
+            self._pending_rows.clear()
+
+    def _flush(self):
+        """Writes all flight points in columns. Live flight points are kept."""
+        self._write_pending_rows()
+        for index, flight_point in self._live_points.items():
+            self._write_rows(index, [self._get_row(flight_point)])
+
+    def _update_live_points(self):
+        """
+        Ensures live flight points are the first and last ones, as expected by
+        :meth:`_is_live`.
+
+        Columns are expected to be up-to-date (see :meth:`_flush`).
+        """
+        self._live_points = {
+            index: flight_point
+            for index, flight_point in self._live_points.items()
+            if self._is_live(index)
+        }
+        for index in {0, *range(max(self._length - LIVE_POINT_COUNT, 0), self._length)}:
+            if index < self._length and index not in self._live_points:
+                self._live_points[index] = FlightPoint(
+                    **dict(zip(self._field_names, self._read_row(index)))
+                )
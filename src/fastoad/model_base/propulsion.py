@@ -15,14 +15,24 @@ Base classes for propulsion components.
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import logging
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import ClassVar
 
 import numpy as np
 import pandas as pd
 from openmdao import api as om
 from openmdao.core.component import Component
+from scipy.interpolate import RegularGridInterpolator
 
+from fastoad.constants import EngineSetting
 from fastoad.model_base import FlightPoint
+from fastoad.model_base.atmosphere import AtmosphereSI
+
+_LOGGER = logging.getLogger(__name__)  # Logger for this module
 
 
 class IPropulsion(ABC):
@@ -234,3 +244,350 @@ class FuelEngineSet(AbstractFuelPropulsion):
 
         self.engine.compute_flight_points(flight_points)
         flight_points.thrust = flight_points.thrust * self.engine_count
+
+
+class CachedPropulsion(IPropulsion):
+    """
+    Wraps a propulsion model so that results are reused for near-identical conditions.
+
+    Results are stored for flight conditions that are defined by altitude, Mach number,
+    engine setting, ISA temperature offset and, according to `thrust_is_regulated`,
+    thrust or thrust rate. These values are quantized according to :attr:`steps` before
+    being used as key. Therefore, the wrapped model is expected to depend only on these
+    values (and on speed values that are deduced from them).
+
+    Only flight points with scalar values are cached. Flight points with array values and
+    DataFrame instances are directly computed by the wrapped model.
+
+    The least recently used results are discarded when :attr:`cache_size` is exceeded.
+    """
+
+    #: Default quantization steps of key values.
+    DEFAULT_STEPS: ClassVar[Mapping[str, float]] = MappingProxyType(
+        {
+            "altitude": 1.0e-2,
+            "mach": 1.0e-6,
+            "isa_offset": 1.0e-3,
+            "thrust": 1.0e-2,
+            "thrust_rate": 1.0e-7,
+        }
+    )
+
+    #: Fields that are copied from the computed flight point to the wrapped model.
+    _INPUT_FIELDS = (
+        "altitude",
+        "mach",
+        "true_airspeed",
+        "equivalent_airspeed",
+        "isa_offset",
+        "engine_setting",
+    )
+
+    def __init__(self, propulsion: IPropulsion, cache_size: int = 10000, steps: dict | None = None):
+        """
+        :param propulsion: the wrapped propulsion model
+        :param cache_size: maximum number of stored results
+        :param steps: quantization steps of key values, that will update :attr:`DEFAULT_STEPS`
+        """
+        self.propulsion = propulsion
+        self.cache_size = cache_size
+        self.steps = dict(self.DEFAULT_STEPS, **(steps or {}))
+
+        #: Number of calls where results have been retrieved from cache.
+        self.hit_count = 0
+        #: Number of calls where wrapped model has been used.
+        self.miss_count = 0
+        self._cache = OrderedDict()
+
+    def __getattr__(self, name):
+        # Other attributes are provided by the wrapped model. Guard is for unpickling,
+        # where __getattr__ is called before __init__.
+        if name == "propulsion":
+            raise AttributeError(name)
+        return getattr(self.propulsion, name)
+
+    def compute_flight_points(self, flight_points: FlightPoint | pd.DataFrame):
+        key_and_input = self._get_key_and_thrust_input(flight_points)
+        if key_and_input is None:
+            self.propulsion.compute_flight_points(flight_points)
+            return
+
+        key, thrust_input = key_and_input
+        results = self._cache.get(key)
+        if results is None:
+            self.miss_count += 1
+            results = self._compute_results(flight_points, thrust_input)
+            self._cache[key] = results
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self.hit_count += 1
+            self._cache.move_to_end(key)
+
+        for name, value in results.items():
+            setattr(flight_points, name, value)
+
+    def get_consumed_mass(self, flight_point: FlightPoint, time_step: float) -> float:
+        return self.propulsion.get_consumed_mass(flight_point, time_step)
+
+    def clear(self):
+        """Removes all stored results and resets counters."""
+        self._cache.clear()
+        self.hit_count = 0
+        self.miss_count = 0
+
+    def _get_key_and_thrust_input(self, flight_point: FlightPoint | pd.DataFrame):
+        """
+        :param flight_point:
+        :return: None if flight point cannot be cached, or the cache key and the name of
+                 the field that is used as thrust input
+        """
+        if not isinstance(flight_point, FlightPoint):
+            return None
+
+        thrust_is_regulated = flight_point.thrust_is_regulated
+        if thrust_is_regulated is None:
+            thrust_is_regulated = flight_point.thrust_rate is None
+        if np.ndim(thrust_is_regulated) > 0:
+            return None
+        thrust_input = "thrust" if thrust_is_regulated else "thrust_rate"
+
+        key = [flight_point.engine_setting, thrust_input]
+        for name in ["altitude", "mach", "isa_offset", thrust_input]:
+            value = getattr(flight_point, name)
+            if value is None:
+                key.append(None)
+            elif np.ndim(value) > 0:
+                return None
+            else:
+                key.append(round(float(value) / self.steps[name]))
+        if np.ndim(key[0]) > 0:
+            return None
+
+        return tuple(key), thrust_input
+
+    def _compute_results(self, flight_point: FlightPoint, thrust_input: str) -> dict:
+        """
+        Computes propulsion data with wrapped model, using only key values of flight point.
+
+        :param flight_point:
+        :param thrust_input: "thrust" or "thrust_rate"
+        :return: values that have been modified by the wrapped model
+        """
+        input_names = (*self._INPUT_FIELDS, thrust_input)
+        computed_point = FlightPoint(
+            thrust_is_regulated=thrust_input == "thrust",
+            **{name: getattr(flight_point, name) for name in input_names},
+        )
+        initial_values = {
+            name: getattr(computed_point, name)
+            for name in FlightPoint.get_field_names()
+            if name not in input_names
+        }
+        self.propulsion.compute_flight_points(computed_point)
+
+        results = {}
+        for name, initial_value in initial_values.items():
+            value = getattr(computed_point, name)
+            if value is initial_value:
+                continue
+            if value is None or initial_value is None or np.any(value != initial_value):
+                results[name] = value
+        return results
+
+
+class GridPropulsion(IPropulsion):
+    """
+    Surrogate of a propulsion model, using interpolation tables.
+
+    For each engine setting and ISA temperature offset that is queried, the wrapped model is
+    computed once, in one vectorized call, on a grid of altitude, Mach number and thrust rate.
+    Thrust and SFC are then linearly interpolated (and extrapolated outside of the grid).
+    When thrust is regulated, thrust rate is interpolated in an inverted table, where thrust
+    is normalized by thrust at maximum thrust rate of the grid. Where this maximum thrust is
+    not positive or not defined, thrust is assumed proportional to thrust rate.
+
+    Only thrust, thrust_rate and sfc are provided by the surrogate. Therefore, the wrapped
+    model is expected to depend only on altitude, speed, thrust rate, engine setting and
+    ISA temperature offset.
+    """
+
+    #: Default altitude values of the grid, in meters.
+    DEFAULT_ALTITUDES = np.arange(0.0, 15001.0, 500.0)
+
+    #: Default Mach values of the grid.
+    DEFAULT_MACHS = np.arange(0.0, 0.951, 0.05)
+
+    #: Default thrust rate values of the grid.
+    DEFAULT_THRUST_RATES = np.linspace(0.0, 1.0, 11)
+
+    def __init__(
+        self,
+        propulsion: IPropulsion,
+        altitudes: np.ndarray | None = None,
+        machs: np.ndarray | None = None,
+        thrust_rates: np.ndarray | None = None,
+    ):
+        """
+        :param propulsion: the wrapped propulsion model
+        :param altitudes: altitude values of the grid, in meters, in increasing order
+        :param machs: Mach values of the grid, in increasing order
+        :param thrust_rates: thrust rate values of the grid, in increasing order
+        """
+        self.propulsion = propulsion
+        self.altitudes = np.asarray(
+            self.DEFAULT_ALTITUDES if altitudes is None else altitudes, dtype=float
+        )
+        self.machs = np.asarray(self.DEFAULT_MACHS if machs is None else machs, dtype=float)
+        self.thrust_rates = np.asarray(
+            self.DEFAULT_THRUST_RATES if thrust_rates is None else thrust_rates, dtype=float
+        )
+        self._tables = {}
+
+    def __getattr__(self, name):
+        # Other attributes are provided by the wrapped model. Guard is for unpickling,
+        # where __getattr__ is called before __init__.
+        if name == "propulsion":
+            raise AttributeError(name)
+        return getattr(self.propulsion, name)
+
+    def compute_flight_points(self, flight_points: FlightPoint | pd.DataFrame):
+        thrust_is_regulated = flight_points.thrust_is_regulated
+        if thrust_is_regulated is None:
+            thrust_is_regulated = flight_points.thrust_rate is None
+
+        values = np.broadcast_arrays(
+            *[
+                np.asarray(np.nan if value is None else value, dtype=float)
+                for value in [
+                    flight_points.altitude,
+                    flight_points.mach,
+                    flight_points.engine_setting,
+                    flight_points.isa_offset,
+                    thrust_is_regulated,
+                    flight_points.thrust_rate,
+                    flight_points.thrust,
+                ]
+            ]
+        )
+        shape = values[0].shape
+        altitude, mach, engine_setting, isa_offset, regulated, thrust_rate, thrust = [
+            value.ravel() for value in values
+        ]
+        regulated = regulated.astype(bool)
+        isa_offset = np.nan_to_num(isa_offset)
+        thrust_rate = thrust_rate.copy()
+        thrust = thrust.copy()
+        sfc = np.empty_like(altitude)
+
+        # NaN is not equal to itself, so undefined engine setting gets a dedicated value.
+        engine_setting = np.where(np.isnan(engine_setting), -1.0, engine_setting)
+        for setting, offset in np.unique(np.column_stack([engine_setting, isa_offset]), axis=0):
+            idx = np.flatnonzero((engine_setting == setting) & (isa_offset == offset))
+            tables = self._get_tables(setting, offset)
+
+            idx_regulated = idx[regulated[idx]]
+            if idx_regulated.size > 0:
+                max_thrust = tables["max_thrust"]((altitude[idx_regulated], mach[idx_regulated]))
+                thrust_rate[idx_regulated] = tables["thrust_rate"](
+                    (
+                        altitude[idx_regulated],
+                        mach[idx_regulated],
+                        thrust[idx_regulated] / max_thrust,
+                    )
+                )
+
+            idx_manual = idx[~regulated[idx]]
+            if idx_manual.size > 0:
+                thrust[idx_manual] = tables["thrust"](
+                    (altitude[idx_manual], mach[idx_manual], thrust_rate[idx_manual])
+                )
+
+            sfc[idx] = tables["sfc"]((altitude[idx], mach[idx], thrust_rate[idx]))
+
+        if shape:
+            flight_points.thrust_rate = thrust_rate.reshape(shape)
+            flight_points.thrust = thrust.reshape(shape)
+            flight_points.sfc = sfc.reshape(shape)
+        else:
+            flight_points.thrust_rate = thrust_rate.item()
+            flight_points.thrust = thrust.item()
+            flight_points.sfc = sfc.item()
+
+    def get_consumed_mass(self, flight_point: FlightPoint, time_step: float) -> float:
+        return self.propulsion.get_consumed_mass(flight_point, time_step)
+
+    def _get_tables(self, engine_setting: float, isa_offset: float) -> dict:
+        """
+        Provides interpolation tables for given engine setting and ISA temperature offset.
+
+        Tables are computed at first call.
+
+        :param engine_setting: engine setting value, or -1 if undefined
+        :param isa_offset:
+        :return: dictionary of interpolators for "thrust", "sfc", "max_thrust" (from altitude
+                 and Mach) and "thrust_rate" (from altitude, Mach and thrust divided by
+                 maximum thrust)
+        """
+        key = (engine_setting, isa_offset)
+        if key in self._tables:
+            return self._tables[key]
+
+        altitude, mach, thrust_rate = np.meshgrid(
+            self.altitudes, self.machs, self.thrust_rates, indexing="ij"
+        )
+        atm = AtmosphereSI(altitude.ravel(), isa_offset)
+        atm.mach = mach.ravel()
+        flight_points = FlightPoint(
+            altitude=altitude.ravel(),
+            mach=mach.ravel(),
+            true_airspeed=atm.true_airspeed,
+            engine_setting=None if engine_setting < 0 else EngineSetting(int(engine_setting)),
+            isa_offset=isa_offset,
+            thrust_is_regulated=False,
+            thrust_rate=thrust_rate.ravel(),
+        )
+        self.propulsion.compute_flight_points(flight_points)
+        thrust = np.reshape(flight_points.thrust, altitude.shape)
+        sfc = np.reshape(flight_points.sfc, altitude.shape)
+
+        # Where maximum thrust is not positive or not defined, thrust is assumed to be
+        # proportional to thrust rate, so that NaN values are not spread to neighbour cells
+        # by interpolation.
+        max_thrust = thrust[:, :, -1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            normalized_thrust = thrust / max_thrust[:, :, np.newaxis]
+        is_invalid = ~(max_thrust > 0.0) | ~np.all(np.isfinite(normalized_thrust), axis=2)
+        if np.any(is_invalid):
+            _LOGGER.warning(
+                "Propulsion surrogate: maximum thrust is not positive or thrust is not defined "
+                "for %d couples of altitude and Mach number (engine setting %s, ISA offset %s). "
+                "Thrust is assumed proportional to thrust rate there.",
+                np.count_nonzero(is_invalid),
+                engine_setting,
+                isa_offset,
+            )
+            normalized_thrust[is_invalid] = self.thrust_rates
+            max_thrust = np.where(np.isfinite(max_thrust), max_thrust, 0.0)
+
+        # Inverted table: for each altitude and Mach, thrust rate is given for values of
+        # thrust divided by maximum thrust that are the thrust rate values of the grid.
+        # Interpolation needs normalized thrust to increase with thrust rate.
+        normalized_thrust = np.maximum.accumulate(normalized_thrust, axis=2)
+        inverted_thrust_rate = np.empty_like(thrust)
+        for i, j in np.ndindex(thrust.shape[:2]):
+            inverted_thrust_rate[i, j, :] = np.interp(
+                self.thrust_rates, normalized_thrust[i, j, :], self.thrust_rates
+            )
+
+        grid = (self.altitudes, self.machs, self.thrust_rates)
+        interpolation_kwargs = {"bounds_error": False, "fill_value": None}
+        self._tables[key] = {
+            "thrust": RegularGridInterpolator(grid, thrust, **interpolation_kwargs),
+            "sfc": RegularGridInterpolator(grid, sfc, **interpolation_kwargs),
+            "max_thrust": RegularGridInterpolator(grid[:2], max_thrust, **interpolation_kwargs),
+            "thrust_rate": RegularGridInterpolator(
+                grid, inverted_thrust_rate, **interpolation_kwargs
+            ),
+        }
+        return self._tables[key]
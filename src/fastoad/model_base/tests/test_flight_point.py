@@ -82,6 +82,37 @@ def test_scalarize():
     assert_allclose(fp.mach, [0.7, 0.8])
 
 
+def test_copy_and_make_absolute():
+    fp = FlightPoint(time=100.0, ground_distance=1000.0, mass=70000.0)
+    fp.set_as_relative("mass")
+    other_fp = FlightPoint(time=100.0, ground_distance=1000.0, mass=70000.0)
+    assert fp.is_relative("mass")
+    assert not other_fp.is_relative("mass")
+
+    fp_copy = fp.copy()
+    assert fp_copy == fp
+    assert fp_copy is not fp
+    assert fp_copy.is_relative("mass")
+    fp_copy.set_as_absolute("mass")
+    fp_copy.mass = 60000.0
+    assert fp.is_relative("mass")
+    assert fp.mass == 70000.0
+
+    reference = FlightPoint(time=10.0, ground_distance=20.0, mass=np.array([1000.0]))
+    absolute_fp = fp.make_absolute(reference)
+    assert absolute_fp.time == 110.0
+    assert absolute_fp.ground_distance == 1020.0
+    assert isinstance(absolute_fp.mass, float)
+    assert absolute_fp.mass == 71000.0
+    assert not absolute_fp.is_relative("time")
+    assert not absolute_fp.is_relative("mass")
+    assert fp.is_relative("time")
+    assert fp.time == 100.0
+
+    with pytest.raises(KeyError):
+        absolute_fp.set_as_absolute("mass")
+
+
 def test_descriptors():
     try:
         FlightPoint.add_field(
@@ -181,3 +212,43 @@ def test_time_integrable_quantities():
         # Free the fields we added to ensure that there is no interference with other tests.
         FlightPoint.remove_field("foo")
         FlightPoint.remove_field("bar")
+
+
+def test_time_integration_table():
+    # No time integrable quantity by default
+    assert FlightPoint.get_time_integration_table().integrable_names == ()
+
+    try:
+        FlightPoint.add_field("power", default_value=0.0, unit="W")
+        FlightPoint.add_field(
+            "energy", default_value=0.0, unit="J", is_cumulative=True, integrates_from="power"
+        )
+        FlightPoint.add_field("flow", default_value=0.0, unit="kg/s")
+        FlightPoint.add_field(
+            "water", default_value=0.0, unit="kg", is_cumulative=True, integrates_from="flow"
+        )
+        table = FlightPoint.get_time_integration_table()
+        assert set(table.integrable_names) == {"energy", "water"}
+
+        previous_point = FlightPoint(energy=10.0, power=2.0, water=1.0, flow=0.5)
+        next_point = FlightPoint()
+        table.integrate(next_point, previous_point, 3.0)
+        assert_allclose(next_point.energy, 16.0)
+        assert_allclose(next_point.water, 2.5)
+
+        # Flight points with array values
+        previous_point = FlightPoint(
+            energy=np.array([10.0, 20.0]), power=np.array([2.0, 1.0]), water=1.0, flow=0.5
+        )
+        table.integrate(next_point, previous_point, np.array([3.0, 4.0]))
+        assert_allclose(next_point.energy, [16.0, 24.0])
+        assert_allclose(next_point.water, [2.5, 3.0])
+
+        # Table is rebuilt when fields are modified
+        FlightPoint.remove_field("water")
+        assert FlightPoint.get_time_integration_table().integrable_names == ("energy",)
+
+    finally:
+        # Free the fields we added to ensure that there is no interference with other tests.
+        for field_name in ["power", "energy", "flow", "water"]:
+            FlightPoint.remove_field(field_name)
@@ -0,0 +1,146 @@
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from fastoad.constants import EngineSetting
+
+from ..flight_point import FlightPoint
+from ..flight_point_buffer import FlightPointBuffer
+
+
+def _get_flight_points(count):
+    return [
+        FlightPoint(
+            time=float(i),
+            mass=70000.0 - i,
+            altitude=10.0 * i,
+            engine_setting=EngineSetting.CRUISE,
+            name="segment",
+        )
+        for i in range(count)
+    ]
+
+
+def test_flight_point_buffer_as_list():
+    flight_points = _get_flight_points(10)
+    buffer = FlightPointBuffer(flight_points[:2], capacity=2)
+    for flight_point in flight_points[2:]:
+        buffer.append(flight_point)
+
+    # Capacity has been exceeded
+    assert len(buffer) == 10
+    assert list(buffer) == flight_points
+    assert buffer[2:5] == flight_points[2:5]
+
+    # First and last flight points are the stored instances
+    assert buffer[0] is flight_points[0]
+    assert buffer[-1] is flight_points[-1]
+    buffer[-1].mass = 0.0
+    assert buffer[-1].mass == 0.0
+
+    # Other flight points are rebuilt
+    assert buffer[4] == flight_points[4]
+    assert buffer[4] is not flight_points[4]
+    buffer[4] = FlightPoint(time=42.0)
+    assert buffer[4] == FlightPoint(time=42.0)
+
+    del buffer[-1]
+    del flight_points[-1]
+    assert len(buffer) == 9
+    assert buffer[-1] == flight_points[-1]
+
+    del buffer[4]
+    del flight_points[4]
+    assert list(buffer) == flight_points
+
+    buffer.insert(2, FlightPoint(time=3.14))
+    flight_points.insert(2, FlightPoint(time=3.14))
+    assert list(buffer) == flight_points
+
+    with pytest.raises(IndexError):
+        _ = buffer[len(buffer)]
+
+    buffer.clear()
+    assert len(buffer) == 0
+
+
+def test_flight_point_buffer_to_dataframe():
+    assert_frame_equal(FlightPointBuffer().to_dataframe(), pd.DataFrame())
+
+    flight_points = _get_flight_points(1000)
+    buffer = FlightPointBuffer(flight_points)
+    assert_frame_equal(buffer.to_dataframe(), pd.DataFrame(flight_points))
+
+    # Same when some flight points have been deleted
+    del buffer[-1]
+    del buffer[-1]
+    buffer.append(flight_points[-2])
+    assert_frame_equal(buffer.to_dataframe(), pd.DataFrame(flight_points[:-1]))
+
+
+def test_flight_point_buffer_column_types():
+    flight_points = _get_flight_points(100)
+    flight_points[50].CL = 0.5
+    buffer = FlightPointBuffer(flight_points)
+    buffer._flush()
+
+    # Float fields are stored as float arrays, other ones fall back to object arrays.
+    assert buffer._columns["mass"].dtype == float
+    assert buffer._columns["engine_setting"].dtype == object
+    assert buffer._columns["name"].dtype == object
+    assert buffer._columns["CL"].dtype == object
+
+    # Rebuilt flight points get back original values, including None
+    assert buffer[50] == flight_points[50]
+    assert isinstance(buffer[50].mass, float)
+    assert buffer[49].CL is None
+    assert_frame_equal(buffer.to_dataframe(), pd.DataFrame(flight_points))
+
+
+def test_flight_point_buffer_live_points():
+    flight_points = _get_flight_points(20)
+    buffer = FlightPointBuffer(flight_points)
+
+    # Last flight point can still be modified after a conversion to DataFrame
+    buffer.to_dataframe()
+    assert buffer[-1] is flight_points[-1]
+    buffer[-1].mass = 5.0
+    assert buffer[-1].mass == 5.0
+    assert buffer.to_dataframe().mass.iloc[-1] == 5.0
+
+    # Live flight points are still the first and last ones after deletion or insertion
+    # in the middle
+    del buffer[5]
+    del flight_points[5]
+    new_flight_point = FlightPoint(time=3.14)
+    buffer.insert(7, new_flight_point)
+    flight_points.insert(7, new_flight_point)
+    for index in [0, -3, -2, -1]:
+        assert buffer[index] is flight_points[index]
+    buffer[-2].mass = 6.0
+    assert buffer[-2].mass == 6.0
+
+    new_flight_point = FlightPoint(time=-1.0)
+    buffer.insert(0, new_flight_point)
+    flight_points.insert(0, new_flight_point)
+    assert buffer[0] is flight_points[0]
+    assert list(buffer) == flight_points
+    assert_frame_equal(buffer.to_dataframe(), pd.DataFrame(flight_points))
+
+    while len(buffer) > 0:
+        del buffer[0]
+        del flight_points[0]
+        assert list(buffer) == flight_points
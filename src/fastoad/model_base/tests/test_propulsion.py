@@ -0,0 +1,168 @@
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+import pandas as pd
+from numpy.testing import assert_allclose
+
+from fastoad.constants import EngineSetting
+
+from ..flight_point import FlightPoint
+from ..propulsion import (
+    AbstractFuelPropulsion,
+    CachedPropulsion,
+    FuelEngineSet,
+    GridPropulsion,
+)
+
+
+class _DummyEngine(AbstractFuelPropulsion):
+    def __init__(self):
+        self.call_count = 0
+
+    def compute_flight_points(self, flight_points: FlightPoint | pd.DataFrame):
+        self.call_count += 1
+        max_thrust = 1.0e5 * np.exp(-flight_points.altitude / 1.0e4)
+        if flight_points.thrust_is_regulated:
+            flight_points.thrust_rate = flight_points.thrust / max_thrust
+        else:
+            flight_points.thrust = flight_points.thrust_rate * max_thrust
+        flight_points.sfc = 1.0e-5 * (1.0 + flight_points.mach)
+
+
+def test_cached_propulsion():
+    engine = _DummyEngine()
+    propulsion = CachedPropulsion(FuelEngineSet(engine, 2), cache_size=2)
+
+    def compute(**kwargs):
+        flight_point = FlightPoint(
+            altitude=1000.0, mach=0.5, engine_setting=EngineSetting.CRUISE, mass=7.0e4, **kwargs
+        )
+        propulsion.compute_flight_points(flight_point)
+        return flight_point
+
+    reference = compute(thrust_rate=0.5)
+    assert propulsion.miss_count == 1
+
+    # Near-identical conditions
+    flight_point = compute(thrust_rate=0.5 + 1.0e-9, time=100.0)
+    assert propulsion.hit_count == 1
+    assert engine.call_count == 1
+    assert_allclose(flight_point.thrust, reference.thrust)
+    assert_allclose(flight_point.sfc, reference.sfc)
+    # Values that are not related to propulsion are unchanged
+    assert_allclose(flight_point.time, 100.0)
+    assert_allclose(flight_point.mass, 7.0e4)
+    assert_allclose(flight_point.thrust_rate, 0.5 + 1.0e-9)
+
+    # Regulated thrust uses a different key
+    flight_point = compute(thrust=reference.thrust, thrust_is_regulated=True)
+    assert propulsion.miss_count == 2
+    assert_allclose(flight_point.thrust_rate, 0.5)
+
+    # Least recently used result is discarded
+    compute(thrust_rate=0.8)
+    compute(thrust_rate=0.5)
+    assert propulsion.miss_count == 4
+    assert propulsion.hit_count == 1
+
+    # Array values are not cached
+    flight_point = FlightPoint(
+        altitude=np.array([0.0, 1000.0]), mach=0.5, thrust_rate=np.array([0.5, 0.5])
+    )
+    propulsion.compute_flight_points(flight_point)
+    assert propulsion.miss_count == 4
+    assert_allclose(flight_point.thrust[1], reference.thrust)
+
+    # Attributes of wrapped model are available
+    assert propulsion.engine_count == 2
+    assert_allclose(
+        propulsion.get_consumed_mass(reference, 10.0), 10.0 * reference.sfc * reference.thrust
+    )
+
+    propulsion.clear()
+    assert propulsion.hit_count == propulsion.miss_count == 0
+
+
+def test_grid_propulsion():
+    engine = _DummyEngine()
+    propulsion = GridPropulsion(FuelEngineSet(engine, 2))
+
+    altitude = np.array([0.0, 3210.0, 10500.0, 11000.0])
+    mach = np.array([0.2, 0.45, 0.78, 0.82])
+    max_thrust = 2.0e5 * np.exp(-altitude / 1.0e4)
+    expected_thrust_rate = np.array([0.3, 0.75, 0.6, 0.9])
+    expected_thrust = expected_thrust_rate * max_thrust
+
+    flight_points = FlightPoint(
+        altitude=altitude,
+        mach=mach,
+        engine_setting=EngineSetting.CRUISE,
+        thrust_is_regulated=np.array([False, False, True, True]),
+        thrust_rate=np.array([0.3, 0.75, 0.0, 0.0]),
+        thrust=np.array([0.0, 0.0, expected_thrust[2], expected_thrust[3]]),
+    )
+    propulsion.compute_flight_points(flight_points)
+    assert engine.call_count == 1
+
+    assert_allclose(flight_points.thrust, expected_thrust, rtol=1.0e-3)
+    assert_allclose(flight_points.thrust_rate, expected_thrust_rate, rtol=1.0e-3)
+    assert_allclose(flight_points.sfc, 1.0e-5 * (1.0 + mach), rtol=1.0e-6)
+
+    # Scalar values, with same engine setting, do not need new computation of the grid
+    flight_point = FlightPoint(
+        altitude=3210.0, mach=0.45, engine_setting=EngineSetting.CRUISE, thrust_rate=0.75
+    )
+    propulsion.compute_flight_points(flight_point)
+    assert engine.call_count == 1
+    assert_allclose(flight_point.thrust, expected_thrust[1], rtol=1.0e-3)
+
+    # New engine setting leads to new computation of the grid
+    flight_point.engine_setting = EngineSetting.CLIMB
+    propulsion.compute_flight_points(flight_point)
+    assert engine.call_count == 2
+
+
+class _CeilingEngine(AbstractFuelPropulsion):
+    """Provides no thrust above 12000m, and thrust decreases near max thrust rate at Mach 0.9."""
+
+    def compute_flight_points(self, flight_points: FlightPoint | pd.DataFrame):
+        max_thrust = np.where(flight_points.altitude > 12000.0, 0.0, 1.0e5)
+        thrust_rate = flight_points.thrust_rate
+        factor = np.where(flight_points.mach >= 0.9, thrust_rate * (1.8 - thrust_rate) / 0.8, 1.0)
+        flight_points.thrust = thrust_rate * max_thrust * np.where(thrust_rate > 0.0, factor, 1.0)
+        flight_points.sfc = np.full_like(flight_points.altitude, 1.0e-5)
+
+
+def test_grid_propulsion_with_zero_max_thrust():
+    propulsion = GridPropulsion(
+        _CeilingEngine(), altitudes=np.array([0.0, 5000.0, 10000.0, 15000.0])
+    )
+
+    flight_points = FlightPoint(
+        altitude=np.array([5000.0, 11000.0, 14000.0]),
+        mach=np.array([0.5, 0.5, 0.5]),
+        engine_setting=EngineSetting.CRUISE,
+        thrust_is_regulated=True,
+        thrust=np.array([5.0e4, 5.0e4, 1.0e4]),
+    )
+    propulsion.compute_flight_points(flight_points)
+
+    # Zero thrust at 15000m does not lead to NaN values in neighbour cells.
+    assert np.all(np.isfinite(flight_points.thrust_rate))
+    assert_allclose(flight_points.thrust_rate[0], 0.5, rtol=1.0e-6)
+
+    # Inverted table is finite and increasing, including where thrust is not monotonic
+    inverted_table = propulsion._get_tables(EngineSetting.CRUISE, 0.0)["thrust_rate"]
+    assert np.all(np.isfinite(inverted_table.values))
+    assert np.all(np.diff(inverted_table.values, axis=2) >= 0.0)
@@ -13,7 +13,7 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from abc import ABC, abstractmethod
-from copy import deepcopy
+from collections.abc import Generator, Sequence
 from dataclasses import dataclass, field
 from typing import ClassVar
 
@@ -46,6 +46,42 @@ class IFlightPart(ABC, BaseDataClass):
                  :class:`~fastoad.model_base.flight_point.FlightPoint`
         """
 
+    def compute_batch_from(self, starts: Sequence[FlightPoint]) -> list[pd.DataFrame]:
+        """
+        Computes the flight part from each provided start point.
+
+        By default, :meth:`compute_from` is called for each start point. Subclasses may
+        overload this method for computing all start points at once.
+
+        :param starts: the initial flight points (see :meth:`compute_from`)
+        :return: a list of pandas DataFrame instances, one per start point
+        """
+        return [self.compute_from(start) for start in starts]
+
+    def iter_compute_from(
+        self, start: FlightPoint
+    ) -> Generator[pd.DataFrame, None, pd.DataFrame | None]:
+        """
+        Computes the flight part from provided start point, and yields flight points as soon
+        as they are computed, as one DataFrame per computed segment.
+
+        Computation is aborted if iteration is stopped (e.g. by using `break` in a `for` loop,
+        or by calling `close()` on the generator).
+
+        Yielded flight points are the ones provided by each segment. Complete flight points
+        of the part are the return value of the generator, that is also the result of
+        :meth:`compute_from`. They can be different, especially for mass if a later segment
+        has a target mass, or for the first point of each segment.
+
+        By default, flight points of the whole part are yielded once computed.
+
+        :param start: the initial flight point (see :meth:`compute_from`)
+        :return: a generator of pandas DataFrame instances
+        """
+        flight_points = self.compute_from(start)
+        yield flight_points
+        return flight_points
+
 
 @dataclass
 class FlightSequence(IFlightPart):
@@ -67,11 +103,35 @@ class FlightSequence(IFlightPart):
     _target: FlightPoint = None
 
     def compute_from(self, start: FlightPoint) -> pd.DataFrame:
+        return _run_to_end(self._iter_compute_from(start))
+
+    def iter_compute_from(
+        self, start: FlightPoint
+    ) -> Generator[pd.DataFrame, None, pd.DataFrame | None]:
+        """
+        Computes the flight sequence from provided start point, and yields flight points of
+        each segment as soon as they are computed (see :meth:`IFlightPart.iter_compute_from`).
+
+        Subclasses that overload :meth:`compute_from` yield flight points of the whole
+        sequence once computed.
+
+        :param start: the initial flight point (see :meth:`compute_from`)
+        :return: a generator of pandas DataFrame instances
+        """
+        if type(self).compute_from is not FlightSequence.compute_from:
+            return (yield from super().iter_compute_from(start))
+
+        return (yield from self._iter_compute_from(start))
+
+    def _iter_compute_from(
+        self, start: FlightPoint
+    ) -> Generator[pd.DataFrame, None, pd.DataFrame | None]:
+        """Generator that does the actual computation of :meth:`compute_from`."""
         if self._target is not None:
             self._sequence[-1].target = self._target
 
         self.part_flight_points = []
-        part_start = deepcopy(start)
+        part_start = start.copy()
         part_start.scalarize()
 
         self.consumed_mass_before_input_weight = 0.0
@@ -80,46 +140,163 @@ class FlightSequence(IFlightPart):
             # will be made absolute during compute_from()
             part_has_target_mass = not (part.target.mass is None or part.target.is_relative("mass"))
 
-            flight_points = part.compute_from(part_start)
+            flight_points = yield from self._iter_compute_part(part, part_start)
 
             if isinstance(part, FlightSequence):
                 self.consumed_mass_before_input_weight += part.consumed_mass_before_input_weight
 
-            # If a part has a target mass, computed mass of all previous part must be
-            # offset so this target will be reached.
-            # (mass consumption of previous parts is assumed independent of aircraft mass)
-            if part_has_target_mass:
-                mass_offset = flight_points.iloc[0].mass - part_start.mass
-                for previous_flight_points in self.part_flight_points:
-                    previous_flight_points.mass += mass_offset
-                self.consumed_mass_before_input_weight = flight_points.iloc[-1].consumed_fuel
-
-            if len(self.part_flight_points) > 0 and len(flight_points) > 1:
-                # First point of the segment is omitted, as it is the last of previous segment.
-                #
-                # But sometimes (especially in the case of simplistic segments), the new first
-                # point may contain more information than the previous last one. In such case,
-                # it is interesting to complete the previous last one.
-                last_flight_points = self.part_flight_points[-1]
-                last_index = last_flight_points.index[-1]
-                for name in flight_points.columns:
-                    value = last_flight_points.loc[last_index, name]
-                    if not value:
-                        last_flight_points.loc[last_index, name] = flight_points.loc[0, name]
-
-                self.part_flight_points.append(flight_points.iloc[1:])
-
-            else:
-                # But it is kept if the computed segment is the first one.
-                self.part_flight_points.append(flight_points)
+            self.consumed_mass_before_input_weight = self._add_part_flight_points(
+                self.part_flight_points,
+                flight_points,
+                part_start,
+                part_has_target_mass=part_has_target_mass,
+                consumed_mass_before_input_weight=self.consumed_mass_before_input_weight,
+            )
 
-            part_start = FlightPoint.create(flight_points.iloc[-1])
-            part_start.scalarize()
+            part_start = _get_last_flight_point(flight_points)
 
         if self.part_flight_points:
-            return pd.concat(self.part_flight_points).reset_index(drop=True)
+            return pd.concat(self.part_flight_points, ignore_index=True)
         return None
 
+    def compute_batch_from(self, starts: Sequence[FlightPoint]) -> list[pd.DataFrame]:
+        """
+        Computes the flight sequence from each provided start point.
+
+        Each part of the sequence is computed for all start points at once, using its
+        :meth:`~IFlightPart.compute_batch_from` method.
+
+        Unlike :meth:`compute_from`, :attr:`part_flight_points` and
+        :attr:`consumed_mass_before_input_weight` are not updated.
+
+        :param starts: the initial flight points (see :meth:`compute_from`)
+        :return: a list of pandas DataFrame instances, one per start point
+        """
+        return [flight_points for flight_points, _ in self._compute_batch(starts)]
+
+    def _compute_batch(self, starts: Sequence[FlightPoint]) -> list[tuple[pd.DataFrame, float]]:
+        """
+        Batch computation of the sequence.
+
+        Subclasses that overload :meth:`compute_from` are computed one start point at a time.
+
+        :param starts: the initial flight points
+        :return: for each start point, computed flight points and consumed mass before
+                 input weight
+        """
+        if type(self).compute_from is not FlightSequence.compute_from:
+            results = []
+            for start in starts:
+                flight_points = self.compute_from(start)
+                results.append((flight_points, self.consumed_mass_before_input_weight))
+            return results
+
+        if self._target is not None:
+            self._sequence[-1].target = self._target
+
+        part_starts = []
+        for start in starts:
+            part_start = start.copy()
+            part_start.scalarize()
+            part_starts.append(part_start)
+
+        all_part_flight_points = [[] for _ in starts]
+        consumed_masses = [0.0] * len(starts)
+        for part in self._sequence:
+            part_has_target_mass = not (part.target.mass is None or part.target.is_relative("mass"))
+
+            if isinstance(part, FlightSequence):
+                part_results = part._compute_batch(part_starts)
+            else:
+                part_results = [
+                    (flight_points, 0.0) for flight_points in part.compute_batch_from(part_starts)
+                ]
+
+            for i, (flight_points, part_consumed_mass) in enumerate(part_results):
+                consumed_masses[i] = self._add_part_flight_points(
+                    all_part_flight_points[i],
+                    flight_points,
+                    part_starts[i],
+                    part_has_target_mass=part_has_target_mass,
+                    consumed_mass_before_input_weight=consumed_masses[i] + part_consumed_mass,
+                )
+                part_starts[i] = _get_last_flight_point(flight_points)
+
+        results = []
+        for part_flight_points, consumed_mass in zip(all_part_flight_points, consumed_masses):
+            flight_points = None
+            if part_flight_points:
+                flight_points = pd.concat(part_flight_points, ignore_index=True)
+            results.append((flight_points, consumed_mass))
+        return results
+
+    def _iter_compute_part(
+        self, part: IFlightPart, start: FlightPoint
+    ) -> Generator[pd.DataFrame, None, pd.DataFrame]:
+        """
+        Computes one part of the sequence in :meth:`compute_from`.
+
+        Can be overloaded for reusing results of previous computations. In such case, the
+        returned DataFrame may be modified afterward and should not be kept for further use.
+
+        :param part: the part to compute
+        :param start: the start point of the part
+        :return: a generator that yields flight points as computed by segments, and that
+                 returns the flight points of the part
+        """
+        return (yield from part.iter_compute_from(start))
+
+    @staticmethod
+    def _add_part_flight_points(
+        part_flight_points: list[pd.DataFrame],
+        flight_points: pd.DataFrame,
+        part_start: FlightPoint,
+        *,
+        part_has_target_mass: bool,
+        consumed_mass_before_input_weight: float,
+    ) -> float:
+        """
+        Appends flight points of a computed part to the ones of previous parts.
+
+        :param part_flight_points: flight points of previous parts, modified in place
+        :param flight_points: flight points of the computed part
+        :param part_start: start point of the computed part
+        :param part_has_target_mass: True if the computed part has an absolute target mass
+        :param consumed_mass_before_input_weight: current value
+        :return: updated value of consumed mass before input weight
+        """
+        # If a part has a target mass, computed mass of all previous part must be
+        # offset so this target will be reached.
+        # (mass consumption of previous parts is assumed independent of aircraft mass)
+        if part_has_target_mass:
+            mass_offset = flight_points.iloc[0].mass - part_start.mass
+            for previous_flight_points in part_flight_points:
+                previous_flight_points.mass += mass_offset
+            consumed_mass_before_input_weight = flight_points.iloc[-1].consumed_fuel
+
+        if len(part_flight_points) > 0 and len(flight_points) > 1:
+            # First point of the segment is omitted, as it is the last of previous segment.
+            #
+            # But sometimes (especially in the case of simplistic segments), the new first
+            # point may contain more information than the previous last one. In such case,
+            # it is interesting to complete the previous last one.
+            last_flight_points = part_flight_points[-1]
+            last_values = _get_row_values(last_flight_points, -1)
+            first_values = _get_row_values(flight_points, 0)
+            last_index = last_flight_points.index[-1]
+            for name, value in first_values.items():
+                # Values are set one by one, as some of them may be 1-element arrays.
+                if not last_values[name]:
+                    last_flight_points.loc[last_index, name] = value
+
+            part_flight_points.append(flight_points.iloc[1:])
+
+        else:
+            # But it is kept if the computed segment is the first one.
+            part_flight_points.append(flight_points)
+
+        return consumed_mass_before_input_weight
+
     @property
     def target(self) -> FlightPoint | None:
         """Target of the last element of current sequence."""
@@ -168,6 +345,44 @@ class FlightSequence(IFlightPart):
         return iter(self._sequence)
 
 
+def _get_row_values(flight_points: pd.DataFrame, position: int) -> dict:
+    """
+    Provides values of one row of a DataFrame.
+
+    The row is extracted as a one-row DataFrame, which avoids building a Series with
+    mixed-type values.
+
+    :param flight_points:
+    :param position: position of the row (negative values count from the end)
+    :return: values of the row, by column name
+    """
+    row = flight_points.iloc[position : (position + 1) or None].to_numpy(dtype=object)[0]
+    return dict(zip(flight_points.columns, row))
+
+
+def _get_last_flight_point(flight_points: pd.DataFrame) -> FlightPoint:
+    """
+    :param flight_points:
+    :return: the last flight point of provided DataFrame, with scalar values
+    """
+    flight_point = FlightPoint(**_get_row_values(flight_points, -1))
+    flight_point.scalarize()
+    return flight_point
+
+
+def _run_to_end(generator: Generator):
+    """
+    Runs provided generator until it is exhausted.
+
+    :return: the return value of the generator
+    """
+    try:
+        while True:
+            next(generator)
+    except StopIteration as stop:
+        return stop.value
+
+
 class RegisterElement:
     """
     Base class for decorators that can associate a class with a keyword.
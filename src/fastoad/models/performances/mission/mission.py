@@ -13,11 +13,12 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from collections.abc import Generator
 from copy import deepcopy
 from dataclasses import dataclass, field
 
+import numpy as np
 import pandas as pd
-from scipy.optimize import root_scalar
 
 from fastoad.model_base import FlightPoint
 
@@ -25,6 +26,31 @@ from .base import FlightSequence
 from .routes import RangedRoute
 from .segments.registered.cruise import CruiseSegment
 
+# Number of fuel evaluations needed for estimating fuel slope with finite differences
+# (the 2 last ones are used)
+_SLOPE_EVALUATION_COUNT = 2
+
+# Maximum number of Newton iterations for solving cruise distance
+_MAX_ITERATION_COUNT = 50
+
+# Newton iterations for solving cruise distance go on while steps are larger (in m)
+_CRUISE_DISTANCE_TOLERANCE = 10.0
+
+
+@dataclass
+class CruiseDistanceSolution:
+    """
+    Result of the solving of cruise distance for a target fuel consumption.
+
+    Used as starting point for next solving.
+    """
+
+    #: Cruise distance of the first route, in m.
+    cruise_distance: float
+
+    #: Derivative of consumed fuel with respect to cruise distance, in kg/m.
+    fuel_slope: float
+
 
 @dataclass
 class Mission(FlightSequence):
@@ -43,7 +69,13 @@ class Mission(FlightSequence):
     #: Accuracy on actual consumed fuel for the solver. In kg
     fuel_accuracy: float = 10.0
 
+    #: If provided, the solving for target fuel consumption will start from this solution.
+    #: After solving, it is replaced by the new solution.
+    cruise_distance_solution: CruiseDistanceSolution | None = None
+
     _flight_points: pd.DataFrame | None = field(init=False, default=None)
+    _fuel_evaluations: list[tuple[float, float]] = field(init=False, default_factory=list)
+    _fuel_slope: float | None = field(init=False, default=None)
     _first_cruise_segment: CruiseSegment | None = field(init=False, default=None)
 
     @property
@@ -72,14 +104,42 @@ class Mission(FlightSequence):
 
     def compute_from(self, start: FlightPoint) -> pd.DataFrame:
         if self.target_fuel_consumption is None:
-            self._flight_points = super().compute_from(start)
-            self._flight_points.loc[self._flight_points.name.isna(), "name"] = ""
-            self._compute_reserve(self._flight_points)
+            self._set_flight_points(super().compute_from(start))
         else:
             self._solve_cruise_distance(start)
 
         return self._flight_points
 
+    def iter_compute_from(
+        self, start: FlightPoint
+    ) -> Generator[pd.DataFrame, None, pd.DataFrame | None]:
+        """
+        Computes the mission from provided start point, and yields flight points of
+        each segment as soon as they are computed (see :meth:`IFlightPart.iter_compute_from`).
+
+        If a target fuel consumption is set, flight points of the whole mission are yielded
+        once computed.
+
+        :param start: the initial flight point (see :meth:`compute_from`)
+        :return: a generator of pandas DataFrame instances
+        """
+        if self.target_fuel_consumption is not None:
+            flight_points = self.compute_from(start)
+            yield flight_points
+            return flight_points
+
+        self._set_flight_points((yield from self._iter_compute_from(start)))
+        if self.reserve_ratio > 0.0:
+            yield self.part_flight_points[-1]
+
+        return self._flight_points
+
+    def _set_flight_points(self, flight_points: pd.DataFrame):
+        """Completes computed flight points with reserve, and stores them."""
+        flight_points.loc[flight_points.name.isna(), "name"] = ""
+        self._compute_reserve(flight_points)
+        self._flight_points = flight_points
+
     def get_reserve_fuel(self):
         """:returns: the fuel quantity for reserve, obtained after mission computation."""
         if not self.reserve_ratio or not self.part_flight_points:
@@ -120,6 +180,14 @@ class Mission(FlightSequence):
         """
         Adjusts cruise distance through a solver to have whole route that
         matches provided consumed fuel.
+
+        If :attr:`cruise_distance_solution` is provided, the solver starts from the
+        previous cruise distance and fuel slope. Otherwise, it starts from the input flight
+        distance of first route, and the first fuel slope comes from the Breguet equation.
+
+        Newton iterations stop when consumed fuel matches target within :attr:`fuel_accuracy`
+        and cruise distance is no longer significantly modified.
+        The returned flight points are always the ones of the last computed cruise distance.
         """
 
         if self.target_fuel_consumption == 0.0:
@@ -127,15 +195,32 @@ class Mission(FlightSequence):
             self._flight_points = pd.DataFrame([start, start])
         else:
             self.first_route.solve_distance = False
-            input_cruise_distance = self.first_route.flight_distance
-
-            root_scalar(
-                self._compute_flight,
-                args=(start,),
-                x0=input_cruise_distance * 0.5,
-                x1=input_cruise_distance * 1.0,
-                xtol=self.fuel_accuracy,
-                method="secant",
+            if self.cruise_distance_solution is None:
+                initial_cruise_distance = self.first_route.flight_distance
+            else:
+                initial_cruise_distance = self.cruise_distance_solution.cruise_distance
+
+            self._fuel_evaluations = []
+            cruise_distance = initial_cruise_distance
+            fuel_difference = self._compute_flight(cruise_distance, start)
+            for _ in range(_MAX_ITERATION_COUNT):
+                # At least one Newton step is done, even if initial cruise distance is already
+                # a solution, so that the result is sensitive to a small change of target.
+                step = -fuel_difference / self._get_fuel_derivative(cruise_distance, start)
+                cruise_distance += step
+                fuel_difference = self._compute_flight(cruise_distance, start)
+                if (
+                    abs(step) <= _CRUISE_DISTANCE_TOLERANCE
+                    and abs(fuel_difference) <= self.fuel_accuracy
+                ):
+                    break
+            else:
+                raise RuntimeError(
+                    f"Solving of cruise distance for mission {self.name} failed to converge "
+                    f"after {_MAX_ITERATION_COUNT} iterations."
+                )
+            self.cruise_distance_solution = CruiseDistanceSolution(
+                cruise_distance=self.first_route.cruise_distance, fuel_slope=self._fuel_slope
             )
 
         return self._flight_points
@@ -149,8 +234,51 @@ class Mission(FlightSequence):
         :return: difference between computed fuel and self.target_fuel_consumption
         """
         self.first_route.cruise_distance = cruise_distance
-        flight_points = super().compute_from(start)
-        flight_points.loc[flight_points.name.isna(), "name"] = ""
-        self._compute_reserve(flight_points)
-        self._flight_points = flight_points
+        self._set_flight_points(super().compute_from(start))
+        self._fuel_evaluations.append((cruise_distance, self.consumed_fuel))
         return self.target_fuel_consumption - self.consumed_fuel
+
+    def _get_fuel_derivative(self, cruise_distance, start: FlightPoint) -> float:
+        """
+        Provides derivative of :meth:`_compute_flight` at last evaluated cruise distance.
+
+        The fuel slope is estimated from the two last evaluations if available. Otherwise,
+        the slope of previous solution is used. If there is no previous solution, the slope
+        is obtained from the Breguet equation, with a range factor that matches the last
+        evaluation.
+
+        :param cruise_distance:
+        :param start:
+        :return: derivative of fuel difference with respect to cruise distance
+        """
+        if len(self._fuel_evaluations) >= _SLOPE_EVALUATION_COUNT:
+            (distance1, fuel1), (distance2, fuel2) = self._fuel_evaluations[-2:]
+            if distance1 != distance2:
+                self._fuel_slope = (fuel2 - fuel1) / (distance2 - distance1)
+        elif self.cruise_distance_solution is not None:
+            self._fuel_slope = self.cruise_distance_solution.fuel_slope
+        else:
+            self._fuel_slope = self._get_breguet_fuel_slope()
+
+        return -self._fuel_slope
+
+    def _get_breguet_fuel_slope(self) -> float:
+        """
+        Breguet equation gives consumed_fuel = start_mass * (1 - exp(-distance / range_factor)).
+
+        :return: derivative of consumed fuel with respect to distance, with range factor
+                 computed from last evaluation.
+        """
+        start_mass = self._flight_points.iloc[0].mass
+        distance = (
+            self._flight_points.iloc[-1].ground_distance
+            - self._flight_points.iloc[0].ground_distance
+        )
+        end_mass = start_mass - self.consumed_fuel
+        fuel_slope = end_mass * np.log(start_mass / end_mass) / distance
+
+        if not np.isfinite(fuel_slope) or fuel_slope <= 0.0:
+            # Mass may be not defined at mission start (e.g. when a target mass is used later).
+            fuel_slope = self.consumed_fuel / distance
+
+        return fuel_slope
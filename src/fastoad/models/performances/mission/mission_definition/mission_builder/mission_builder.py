@@ -16,8 +16,10 @@ from collections import ChainMap
 from collections.abc import Mapping
 from copy import deepcopy
 from dataclasses import fields
+from functools import cache
 from os import PathLike
 
+import numpy as np
 import pandas as pd
 from deprecated import deprecated
 
@@ -98,6 +100,14 @@ class MissionBuilder:
         """
         self._structure_builders: dict[str, AbstractStructureBuilder] = {}
 
+        # Input definitions that are linked to a variable, by mission name. Lazily set.
+        self._variable_input_definitions: dict[str, list[InputDefinition]] = {}
+
+        # Polars of last build, by definition values, to avoid re-instantiating them
+        # (and re-computing their optimal CL) when values do not change.
+        self._polars: dict[tuple, Polar] = {}
+        self._previous_polars: dict[tuple, Polar] = {}
+
         self._variable_prefix: str = variable_prefix
 
         #: The definition of missions as provided in input file.
@@ -188,10 +198,15 @@ class MissionBuilder:
         if self.get_input_weight_variable_name(mission_name) is None:
             self._add_default_taxi_takeoff(mission_name)
 
-        for input_def in self._structure_builders[mission_name].get_input_definitions():
+        for input_def in self._get_variable_input_definitions(mission_name):
             input_def.set_variable_value(inputs)
 
-        return self._build_mission(self._structure_builders[mission_name].structure)  # Mission
+        self._previous_polars = self._polars
+        self._polars = {}
+        try:
+            return self._build_mission(self._structure_builders[mission_name].structure)
+        finally:
+            self._previous_polars = {}
 
     def get_route_names(self, mission_name: str | None = None) -> list[str]:
         """
@@ -296,7 +311,39 @@ class MissionBuilder:
             self._get_mission_part_structures(mission_name)
         )
 
+    def _get_variable_input_definitions(self, mission_name: str) -> list[InputDefinition]:
+        """
+        :param mission_name:
+        :return: the input definitions of the mission that are linked to a variable
+        """
+        if mission_name not in self._variable_input_definitions:
+            self._variable_input_definitions[mission_name] = [
+                input_def
+                for input_def in self._structure_builders[mission_name].get_input_definitions()
+                if input_def.variable_name
+            ]
+
+        return self._variable_input_definitions[mission_name]
+
+    def _get_polar(self, cl, cd, alpha) -> Polar:
+        """
+        Provides the polar for provided definition.
+
+        If a polar with same definition has been instantiated in the current build or in
+        the previous one, it is reused.
+        """
+        key = tuple(
+            None if values is None else (np.shape(values), np.asarray(values, float).tobytes())
+            for values in (cl, cd, alpha)
+        )
+        polar = self._polars.get(key) or self._previous_polars.get(key)
+        if polar is None:
+            polar = Polar(cl=cl, cd=cd, alpha=alpha)
+        self._polars[key] = polar
+        return polar
+
     def _update_structure_builders(self):
+        self._variable_input_definitions = {}
         for mission_name in self._definition[MISSION_DEFINITION_TAG]:
             self._structure_builders[mission_name] = MissionStructureBuilder(
                 self._definition, mission_name, variable_prefix=self._variable_prefix
@@ -433,7 +480,7 @@ class MissionBuilder:
         for key, value in part_kwargs.items():
             if key == POLAR_TAG:
                 modifier_kwargs = deepcopy(value.get("modifier"))
-                new_value = Polar(
+                new_value = self._get_polar(
                     cl=value["CL"].value,
                     cd=value["CD"].value,
                     alpha=value["alpha"].value if "alpha" in value else None,
@@ -467,9 +514,7 @@ class MissionBuilder:
         if "engine_setting" in part_kwargs:
             part_kwargs["engine_setting"] = EngineSetting.convert(part_kwargs["engine_setting"])
 
-        input_field_names = [
-            class_field.name for class_field in fields(segment_class) if class_field.init
-        ]
+        input_field_names = _get_init_field_names(segment_class)
         part_kwargs = {key: value for key, value in part_kwargs.items() if key in input_field_names}
         return segment_class(**part_kwargs)  # Segment
 
@@ -581,3 +626,13 @@ class MissionBuilder:
         takeoff = PhaseStructureBuilder(definition, "takeoff", mission_name, self._variable_prefix)
         takeoff_structure = self._structure_builders[mission_name].process_builder(takeoff)
         self._structure_builders[mission_name].structure[PARTS_TAG].insert(1, takeoff_structure)
+        self._variable_input_definitions.pop(mission_name, None)
+
+
+@cache
+def _get_init_field_names(segment_class: type) -> frozenset[str]:
+    """
+    :param segment_class:
+    :return: names of fields of segment_class that are used at instantiation
+    """
+    return frozenset(class_field.name for class_field in fields(segment_class) if class_field.init)
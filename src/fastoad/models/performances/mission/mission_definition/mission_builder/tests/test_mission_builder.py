@@ -338,6 +338,18 @@ def test_build(custom_segment_class):
     taxi_in = taxi_in_phase[0]
     assert isinstance(taxi_in, TaxiSegment)
 
+    # Polars are reused from previous build if their definition did not change.
+    new_mission = mission_builder.build(inputs, mission_name="sizing")
+    assert new_mission[2][0][2].polar is climb2.polar
+    assert new_mission[2][0][1].polar is climb2.polar
+    assert new_mission[2][0][0].polar is climb1.polar
+
+    inputs["data:aerodynamics:aircraft:takeoff:CD"] = 0.6 * cl**2
+    new_mission = mission_builder.build(inputs, mission_name="sizing")
+    assert new_mission[2][0][2].polar is not climb2.polar
+    assert new_mission[2][0][0].polar is climb1.polar
+    inputs["data:aerodynamics:aircraft:takeoff:CD"] = cd
+
     # Check of "test" mission ##################################################
     test_inputs = {
         "some:static:array": [1.0, 2.0, 3.0],
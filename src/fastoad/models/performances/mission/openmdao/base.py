@@ -15,12 +15,20 @@ Base classes for mission-related OpenMDAO components.
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from abc import ABCMeta
+from collections import OrderedDict
 from enum import Enum
 from os import PathLike
 
+import numpy as np
 from openmdao.core.system import System
 
 from fastoad._utils.resource_management.contents import PackageReader
+from fastoad.model_base.propulsion import (
+    CachedPropulsion,
+    GridPropulsion,
+    IOMPropulsionWrapper,
+    IPropulsion,
+)
 from fastoad.models.performances.mission.mission_definition.exceptions import (
     FastMissionFileMissingMissionNameError,
 )
@@ -28,6 +36,9 @@ from fastoad.models.performances.mission.mission_definition.schema import Missio
 from fastoad.models.performances.mission.openmdao import resources
 from fastoad.models.performances.mission.openmdao.mission_wrapper import MissionWrapper
 
+# Maximum number of propulsion surrogates that are kept by a mission component.
+_MAX_PROPULSION_SURROGATES = 2
+
 
 class NeedsOWE(System, metaclass=ABCMeta):
     """To be inherited when Operating Weight Empty variable is used."""
@@ -77,6 +88,13 @@ class BaseMissionComp(System, metaclass=ABCMeta):
         self._mission_wrapper: MissionWrapper | None = None
         self._name_provider = None
 
+        # Propulsion surrogates, with keys built from input values of propulsion model.
+        # The same instance may be shared with sub-components (see PayloadRange).
+        self._propulsion_surrogates = OrderedDict()
+
+        # Names of inputs that are declared by the propulsion wrapper.
+        self._propulsion_input_names = []
+
         super().__init__(**kwargs)
 
     def initialize(self):
@@ -87,6 +105,24 @@ class BaseMissionComp(System, metaclass=ABCMeta):
             types=str,
             desc="(mandatory) The identifier of the propulsion wrapper.",
         )
+        self.options.declare(
+            "propulsion_cache_size",
+            default=0,
+            types=int,
+            lower=0,
+            desc="If not 0, results of the propulsion model are reused for near-identical "
+            "flight conditions (altitude, Mach, thrust or thrust rate, engine setting, ISA "
+            "offset) during each mission computation. Value is the maximum number of stored "
+            "results.",
+        )
+        self.options.declare(
+            "use_propulsion_surrogate",
+            default=False,
+            types=bool,
+            desc="If True, the propulsion model is computed once on a grid of altitude, Mach "
+            "and thrust rate values, and mission computations use interpolation in this grid. "
+            "The grid is computed again only when input values of the propulsion model change.",
+        )
         self.options.declare(
             "mission_file_path",
             default="::sizing_mission",
@@ -144,6 +180,57 @@ class BaseMissionComp(System, metaclass=ABCMeta):
         except IndexError:
             return None
 
+    def _setup_engine_wrapper(self, engine_wrapper: IOMPropulsionWrapper):
+        """
+        Runs setup of provided propulsion wrapper, and records the names of the inputs it
+        declares, that identify the propulsion surrogates.
+
+        :param engine_wrapper: the propulsion wrapper
+        """
+        self._propulsion_input_names = []
+        add_input = self.add_input
+
+        def add_propulsion_input(name, *args, **kwargs):
+            self._propulsion_input_names.append(name)
+            return add_input(name, *args, **kwargs)
+
+        self.add_input = add_propulsion_input
+        try:
+            engine_wrapper.setup(self)
+        finally:
+            del self.add_input
+
+    def _get_propulsion_model(self, engine_wrapper: IOMPropulsionWrapper, inputs) -> IPropulsion:
+        """
+        :param engine_wrapper: the propulsion wrapper
+        :param inputs: OpenMDAO input vector
+        :return: the propulsion model to use for mission computation, that is a surrogate
+                 and/or is cached according to options "use_propulsion_surrogate" and
+                 "propulsion_cache_size"
+        """
+        if not self.options["use_propulsion_surrogate"]:
+            propulsion = engine_wrapper.get_model(inputs)
+        elif not self._propulsion_input_names:
+            # Without known propulsion inputs, a stored surrogate may not match current inputs.
+            propulsion = GridPropulsion(engine_wrapper.get_model(inputs))
+        else:
+            key = tuple(
+                (name, np.asarray(inputs[name], dtype=float).tobytes())
+                for name in self._propulsion_input_names
+            )
+            surrogates = self._propulsion_surrogates
+            if key in surrogates:
+                surrogates.move_to_end(key)
+            else:
+                surrogates[key] = GridPropulsion(engine_wrapper.get_model(inputs))
+                if len(surrogates) > _MAX_PROPULSION_SURROGATES:
+                    surrogates.popitem(last=False)
+            propulsion = surrogates[key]
+
+        if self.options["propulsion_cache_size"] > 0:
+            return CachedPropulsion(propulsion, cache_size=self.options["propulsion_cache_size"])
+        return propulsion
+
     @staticmethod
     def get_mission_definition(
         mission_file_path: str | PathLike | MissionDefinition | None,
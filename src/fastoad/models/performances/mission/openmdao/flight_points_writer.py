@@ -0,0 +1,155 @@
+"""
+Export of computed flight points to file.
+"""
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2024 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import queue
+import threading
+from os import PathLike
+from pathlib import Path
+
+import pandas as pd
+
+from fastoad._utils.files import make_parent_dir
+from fastoad.model_base import FlightPoint
+
+#: Writing methods, by file extension. CSV is used for any other extension.
+_WRITERS = {
+    ".parquet": lambda flight_points, path: flight_points.to_parquet(path),
+    ".feather": lambda flight_points, path: flight_points.reset_index().to_feather(path),
+    ".h5": lambda flight_points, path: flight_points.to_hdf(path, key="flight_points", mode="w"),
+    ".hdf5": lambda flight_points, path: flight_points.to_hdf(path, key="flight_points", mode="w"),
+}
+
+
+class FlightPointsWriter:
+    """
+    Writes flight points to file, as computed by mission components.
+
+    File format is deduced from file extension: Parquet (.parquet), Feather (.feather),
+    HDF5 (.h5 or .hdf5) or CSV (any other extension). Binary formats need the matching
+    optional dependency of pandas (pyarrow or tables).
+
+    Column names are completed with units.
+    """
+
+    def __init__(
+        self,
+        file_path: str | PathLike,
+        *,
+        frequency: int = 1,
+        asynchronous: bool = False,
+        queue_size: int = 2,
+    ):
+        """
+        :param file_path: path of the file to write
+        :param frequency: file is written at every `frequency` call of :meth:`submit`.
+                          If 0, file is written only by :meth:`close`.
+        :param asynchronous: if True, file is written by a background thread, so that
+                             :meth:`submit` does not wait for writing to be done.
+        :param queue_size: in asynchronous mode, maximum number of flight point sets that are
+                           waiting for being written. When the queue is full, submitted
+                           flight points are not written, unless they are the last ones
+                           when :meth:`close` is called.
+
+        In asynchronous mode, an error that occurs while writing is raised by next call of
+        :meth:`submit` or :meth:`close`.
+        """
+        self.file_path = Path(file_path)
+        self.frequency = frequency
+        self.asynchronous = asynchronous
+
+        self._submit_count = 0
+        self._pending_flight_points = None
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = None
+        self._error = None
+
+    def submit(self, flight_points: pd.DataFrame):
+        """
+        Provides flight points to write, according to writing frequency.
+
+        Provided DataFrame should not be modified afterward.
+
+        :param flight_points: the flight points of last mission computation
+        """
+        self._raise_error()
+        self._submit_count += 1
+        if self.frequency and self._submit_count % self.frequency == 0:
+            self._pending_flight_points = None
+            if self.asynchronous:
+                self._start_thread()
+                try:
+                    self._queue.put_nowait(flight_points)
+                except queue.Full:
+                    self._pending_flight_points = flight_points
+            else:
+                self._write(flight_points)
+        else:
+            self._pending_flight_points = flight_points
+
+    def close(self):
+        """
+        Writes last submitted flight points if not done yet, and waits for all writings
+        to be done.
+        """
+        if self._pending_flight_points is not None:
+            if self._thread is not None:
+                self._queue.put(self._pending_flight_points)
+            else:
+                self._write(self._pending_flight_points)
+            self._pending_flight_points = None
+
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+        self._raise_error()
+
+    def _raise_error(self):
+        """Raises the error that occurred in background thread, if any."""
+        if self._error is not None:
+            error = self._error
+            self._error = None
+            raise error
+
+    def _start_thread(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._process_queue, daemon=True)
+            self._thread.start()
+
+    def _process_queue(self):
+        # After an error, the queue is still emptied, so that the main thread never waits
+        # for free space in the queue.
+        while (flight_points := self._queue.get()) is not None:
+            if self._error is None:
+                try:
+                    self._write(flight_points)
+                except Exception as error:  # noqa: BLE001 error is raised in main thread
+                    self._error = error
+
+    def _write(self, flight_points: pd.DataFrame):
+        rename_dict = {
+            field_name: f"{field_name}{' [' + unit + ']' if unit else ''}"
+            for field_name, unit in FlightPoint.get_units().items()
+        }
+        flight_points = flight_points.rename(columns=rename_dict)
+
+        make_parent_dir(self.file_path)
+        writer = _WRITERS.get(self.file_path.suffix.lower())
+        if writer is None:
+            flight_points.to_csv(self.file_path)
+        else:
+            writer(flight_points, self.file_path)
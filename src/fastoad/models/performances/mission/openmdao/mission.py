@@ -47,9 +47,42 @@ class OMMission(
             "out_file",
             default="",
             types=(str, PathLike),
-            desc="If provided, a csv file will be written at provided path with all computed "
+            desc="If provided, a file will be written at provided path with all computed "
+            "flight points. Format is Parquet, Feather or HDF5 if file extension is "
+            ".parquet, .feather or .h5 (.hdf5), and CSV otherwise.",
+        )
+        self.options.declare(
+            "out_file_frequency",
+            default=1,
+            types=int,
+            lower=0,
+            desc="out_file is written every N mission computations. If 0, it is written "
+            "only when the problem is cleaned up (Problem.cleanup()), with last computed "
             "flight points.",
         )
+        self.options.declare(
+            "out_file_asynchronous",
+            default=False,
+            types=bool,
+            desc="If True, out_file is written by a background thread, so that mission "
+            "computation does not wait for file writing.",
+        )
+        self.options.declare(
+            "cache_size",
+            default=1,
+            types=int,
+            lower=0,
+            desc="Number of mission computation results that are kept for being reused if the "
+            "mission is called again with the same inputs. Set to 0 to deactivate.",
+        )
+        self.options.declare(
+            "use_partial_coloring",
+            default=False,
+            types=bool,
+            desc="If True, partial coloring is used for finite differences of the mission "
+            "computation. It greatly reduces the number of mission computations needed for "
+            "derivatives.",
+        )
         self.options.declare(
             "use_initializer_iteration",
             default=True,
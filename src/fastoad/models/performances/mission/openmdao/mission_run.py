@@ -13,18 +13,20 @@
 
 
 import contextlib
+import hashlib
 import logging
+from collections import OrderedDict
 from os import PathLike
 
 import numpy as np
 from openmdao import api as om
 
-from fastoad._utils.files import make_parent_dir
 from fastoad.model_base import FlightPoint
 from fastoad.model_base.propulsion import IOMPropulsionWrapper
 from fastoad.module_management.service_registry import RegisterPropulsion
 
 from .base import BaseMissionComp
+from .flight_points_writer import FlightPointsWriter
 from ..polar import Polar
 from ..segments.registered.cruise import BreguetCruiseSegment
 
@@ -43,6 +45,13 @@ class MissionComp(om.ExplicitComponent, BaseMissionComp):
         self.flight_points = None
         self._input_weight_variable_name = ""
         self._engine_wrapper = None
+        self._flight_points_writer = None
+
+        #: Number of computations where results have been retrieved from cache.
+        self.cache_hit_count = 0
+        #: Number of computations where mission has actually been computed.
+        self.cache_miss_count = 0
+        self._results_cache = OrderedDict()
 
     def initialize(self):
         super().initialize()
@@ -50,15 +59,62 @@ class MissionComp(om.ExplicitComponent, BaseMissionComp):
             "out_file",
             default="",
             types=(str, PathLike),
-            desc="if provided, a csv file will be written at provided path with "
-            "all computed flight points.",
+            desc="if provided, a file will be written at provided path with "
+            "all computed flight points. Format is Parquet, Feather or HDF5 if file extension "
+            "is .parquet, .feather or .h5 (.hdf5), and CSV otherwise.",
+        )
+        self.options.declare(
+            "out_file_frequency",
+            default=1,
+            types=int,
+            lower=0,
+            desc="out_file is written every N computations. If 0, it is written only "
+            "when the problem is cleaned up (Problem.cleanup()), with last computed "
+            "flight points.",
+        )
+        self.options.declare(
+            "out_file_asynchronous",
+            default=False,
+            types=bool,
+            desc="If True, out_file is written by a background thread, so that computation "
+            "does not wait for file writing. Intermediate flight points may be skipped "
+            "if writing is slower than computation.",
+        )
+        self.options.declare(
+            "cache_size",
+            default=1,
+            types=int,
+            lower=0,
+            desc="Number of computation results that are kept for being reused if the "
+            "component is called again with the same inputs. Set to 0 to deactivate.",
+        )
+        self.options.declare(
+            "use_partial_coloring",
+            default=False,
+            types=bool,
+            desc="If True, partial coloring is used for finite differences. Outputs generally "
+            "depend on a small part of array inputs (e.g. polar values close to the "
+            "actual lift coefficients), so it greatly reduces the number of mission "
+            "computations needed for derivatives.",
         )
 
     def setup(self):
         super().setup()
 
+        self._results_cache.clear()
+
+        if self._flight_points_writer is not None:
+            self._flight_points_writer.close()
+            self._flight_points_writer = None
+        if self.options["out_file"]:
+            self._flight_points_writer = FlightPointsWriter(
+                self.options["out_file"],
+                frequency=self.options["out_file_frequency"],
+                asynchronous=self.options["out_file_asynchronous"],
+            )
+
         self._engine_wrapper = self.get_engine_wrapper()
-        self._engine_wrapper.setup(self)
+        self._setup_engine_wrapper(self._engine_wrapper)
 
         self._mission_wrapper.setup(self)
 
@@ -84,9 +140,38 @@ class MissionComp(om.ExplicitComponent, BaseMissionComp):
 
     def setup_partials(self):
         self.declare_partials(["*"], ["*"], method="fd")
+        if self.options["use_partial_coloring"]:
+            self.declare_coloring(wrt=["*"], method="fd", show_summary=False)
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
-        propulsion_model = self._engine_wrapper.get_model(inputs)
+        cache_key = hashlib.blake2b(np.ascontiguousarray(inputs.asarray()).tobytes()).digest()
+        if cache_key in self._results_cache:
+            self.cache_hit_count += 1
+            self._results_cache.move_to_end(cache_key)
+            output_values, self.flight_points, consumed_fuel_before_input_weight = (
+                self._results_cache[cache_key]
+            )
+            outputs.set_val(output_values)
+            self._mission_wrapper.consumed_fuel_before_input_weight = (
+                consumed_fuel_before_input_weight
+            )
+            self._postprocess_flight_points(self.flight_points)
+            return
+
+        self.cache_miss_count += 1
+        self._compute_mission(inputs, outputs)
+
+        if self.options["cache_size"] > 0:
+            self._results_cache[cache_key] = (
+                outputs.asarray().copy(),
+                self.flight_points,
+                self._mission_wrapper.consumed_fuel_before_input_weight,
+            )
+            while len(self._results_cache) > self.options["cache_size"]:
+                self._results_cache.popitem(last=False)
+
+    def _compute_mission(self, inputs, outputs):
+        propulsion_model = self._get_propulsion_model(self._engine_wrapper, inputs)
         reference_area = inputs[self.options["reference_area_variable"]]
 
         self._mission_wrapper.propulsion = propulsion_model
@@ -104,18 +189,14 @@ class MissionComp(om.ExplicitComponent, BaseMissionComp):
 
         self._postprocess_flight_points(self.flight_points)
 
-    def _postprocess_flight_points(self, flight_points):
-        flight_points = flight_points.copy()  # local copy for renaming columns before CSV export
-        rename_dict = {
-            field_name: f"{field_name}{' [' + unit + ']' if unit else ''}"
-            for field_name, unit in FlightPoint.get_units().items()
-        }
-        flight_points.rename(columns=rename_dict, inplace=True)
-        if self.options["out_file"]:
-            make_parent_dir(self.options["out_file"])
-            flight_points.to_csv(self.options["out_file"])
+    def cleanup(self):
+        super().cleanup()
+        if self._flight_points_writer is not None:
+            self._flight_points_writer.close()
 
-        return flight_points
+    def _postprocess_flight_points(self, flight_points):
+        if self._flight_points_writer is not None:
+            self._flight_points_writer.submit(flight_points)
 
     def _compute_outputs(self, outputs, flight_points):
         # Final ================================================================
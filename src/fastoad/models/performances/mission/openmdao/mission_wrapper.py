@@ -84,9 +84,20 @@ class MissionWrapper(MissionBuilder):
             variable_prefix=variable_prefix,
         )
         self.consumed_fuel_before_input_weight = 0.0
+
+        # Kept from one computation to another to warm-start the solving for target fuel.
+        self._cruise_distance_solution = None
+
         if force_all_block_fuel_usage:
             self.force_all_block_fuel_usage()
 
+    def reset_solution(self):
+        """
+        Forgets the solution of previous computation, so that next computation does not
+        start from it.
+        """
+        self._cruise_distance_solution = None
+
     def force_all_block_fuel_usage(self):
         """Modifies mission definition to set block fuel as target fuel consumption."""
         if self._mission_name:
@@ -132,53 +143,76 @@ class MissionWrapper(MissionBuilder):
                  :class:`~fastoad.model_base.flight_point.FlightPoint`
         """
         mission = self.build(inputs, self.mission_name)
+        mission.cruise_distance_solution = self._cruise_distance_solution
+
+        flight_points = mission.compute_from(start_flight_point)
+        self._cruise_distance_solution = mission.cruise_distance_solution
+        flight_points.loc[0, "name"] = flight_points.loc[1, "name"]
+
+        self._compute_part_outputs(flight_points, outputs)
 
-        def _compute_vars(name_root, start: FlightPoint, end: FlightPoint):
+        self.consumed_fuel_before_input_weight = mission.consumed_mass_before_input_weight
+        if mission.reserve_ratio:
+            outputs[self.get_reserve_variable_name()] = mission.get_reserve_fuel()
+
+        return flight_points
+
+    def _compute_part_outputs(self, flight_points: pd.DataFrame, outputs: Vector):
+        """
+        Fills `outputs` with duration, burned fuel and covered distance of each part
+        of the flight.
+
+        Parts are identified at each level of the name hierarchy in flight point names.
+        """
+        time = flight_points.time.to_numpy()
+        mass = flight_points.mass.to_numpy()
+        ground_distance = flight_points.ground_distance.to_numpy()
+        altitude = flight_points.altitude.to_numpy()
+
+        def _compute_vars(name_root, start: int, end: int):
             """Computes duration, burned fuel and covered distance."""
-            distance = end.ground_distance - start.ground_distance
+            distance = ground_distance[end] - ground_distance[start]
             if name_root + ":duration" in outputs:
-                outputs[name_root + ":duration"] = end.time - start.time
+                outputs[name_root + ":duration"] = time[end] - time[start]
             if name_root + ":fuel" in outputs:
-                outputs[name_root + ":fuel"] = start.mass - end.mass
+                outputs[name_root + ":fuel"] = mass[start] - mass[end]
             if name_root + ":distance" in outputs:
                 outputs[name_root + ":distance"] = distance
             if name_root + ":TOFL" in outputs:
                 outputs[name_root + ":TOFL"] = TOFL_FACTOR * distance
             if name_root + ":initial_altitude" in outputs:
-                outputs[name_root + ":initial_altitude"] = start.altitude
+                outputs[name_root + ":initial_altitude"] = altitude[start]
             if name_root + ":final_altitude" in outputs:
-                outputs[name_root + ":final_altitude"] = end.altitude
+                outputs[name_root + ":final_altitude"] = altitude[end]
             if name_root + ":altitude" in outputs:  # for non-optimal cruise segments
-                outputs[name_root + ":altitude"] = start.altitude
+                outputs[name_root + ":altitude"] = altitude[start]
 
-        flight_points = mission.compute_from(start_flight_point)
-        flight_points.loc[0, "name"] = flight_points.loc[1, "name"]
+        # Names are split only once for each distinct name.
+        name_codes, unique_names = pd.factorize(flight_points.name)
+        split_names = [name.split(":") for name in unique_names]
+        nb_levels = max(len(name_parts) for name_parts in split_names)
+        row_indices = pd.Series(np.arange(len(flight_points)))
 
-        nb_levels = np.max([len(n.split(":")) for n in flight_points["name"]])
         for i in range(nb_levels):
-            flight_points["name2"] = [":".join(n.split(":")[: i + 1]) for n in flight_points.name]
-            grouped_points = flight_points.groupby("name2")
+            level_names = np.array([":".join(name_parts[: i + 1]) for name_parts in split_names])
+            grouped_indices = row_indices.groupby(level_names[name_codes], sort=False)
+            first_indices = grouped_indices.min()
+            last_indices = grouped_indices.max()
 
-            part_names = pd.unique(flight_points.name2)
+            part_names = last_indices.index
             for part_name1, part_name2 in pairwise(part_names):
-                part1 = grouped_points.get_group(part_name1)
-                part2 = grouped_points.get_group(part_name2)
                 _compute_vars(
-                    f"{self.variable_prefix}:{part_name2}", part1.iloc[-1], part2.iloc[-1]
+                    f"{self.variable_prefix}:{part_name2}",
+                    last_indices[part_name1],
+                    last_indices[part_name2],
                 )
 
             start_part_name = part_names[0]
-            start_part = grouped_points.get_group(start_part_name)
             _compute_vars(
-                f"{self.variable_prefix}:{start_part_name}", start_part.iloc[0], start_part.iloc[-1]
+                f"{self.variable_prefix}:{start_part_name}",
+                first_indices[start_part_name],
+                last_indices[start_part_name],
             )
-        del flight_points["name2"]
-
-        self.consumed_fuel_before_input_weight = mission.consumed_mass_before_input_weight
-        if mission.reserve_ratio:
-            outputs[self.get_reserve_variable_name()] = mission.get_reserve_fuel()
-
-        return flight_points
 
     def get_reserve_variable_name(self) -> str:
         """
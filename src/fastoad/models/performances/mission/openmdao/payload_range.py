@@ -12,6 +12,7 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import contextlib
 from dataclasses import dataclass
 
 import numpy as np
@@ -19,12 +20,14 @@ import openmdao.api as om
 from pyDOE3 import lhs
 from scipy.interpolate import interp1d
 
+from fastoad.model_base import FlightPoint
 from fastoad.module_management.constants import ModelDomain
-from fastoad.module_management.service_registry import RegisterOpenMDAOSystem
-from fastoad.openmdao.problem import get_variable_list_from_system
+from fastoad.module_management.service_registry import (
+    RegisterOpenMDAOSystem,
+    RegisterPropulsion,
+)
 
 from .base import BaseMissionComp, NeedsMFW, NeedsMTOW, NeedsOWE
-from .mission_run import MissionComp
 
 
 @RegisterOpenMDAOSystem("fastoad.performances.payload_range", domain=ModelDomain.PERFORMANCE)
@@ -128,20 +131,10 @@ class PayloadRange(om.Group, BaseMissionComp, NeedsOWE, NeedsMTOW, NeedsMFW):
             promotes=["*"],
         )
 
-        var_connections = {"block_fuel": "block_fuel", "TOW": "TOW"}
-        self._add_mission_runs(group, nb_contour_points, var_connections, "mux_contour")
-
-        mux_comp = group.add_subsystem(
-            name="mux_contour", subsys=om.MuxComp(vec_size=nb_contour_points)
-        )
-        mux_comp.add_var("range", shape=(1,), axis=0, units="m")
-        mux_comp.add_var("duration", shape=(1,), axis=0, units="s")
-        group.promotes(
-            "mux_contour",
-            outputs=[
-                ("range", self._contour_names.range),
-                ("duration", self._contour_names.duration),
-            ],
+        group.add_subsystem(
+            "missions",
+            self._get_missions_component(nb_contour_points, grid=False),
+            promotes=["*"],
         )
 
         self.add_subsystem(
@@ -181,38 +174,12 @@ class PayloadRange(om.Group, BaseMissionComp, NeedsOWE, NeedsMTOW, NeedsMFW):
         )
 
         # Run computations
-        var_connections = {"grid:block_fuel": "block_fuel", "grid:TOW": "TOW"}
-        self._add_mission_runs(group, nb_grid_points, var_connections, "mux_grid")
-
-        # Assemble mission results in variables
-        # 2 points are added to include the 2 MTOW points of the contour in the grid points.
-        # (These 2 points are already added in grid inputs by PayloadRangeGridInputValues)
-        mux_comp = group.add_subsystem(
-            name="mux_grid", subsys=om.MuxComp(vec_size=nb_grid_points + 2)
-        )
-        mux_comp.add_var("range", shape=(1,), axis=0, units="m")
-        mux_comp.add_var("duration", shape=(1,), axis=0, units="s")
-        group.promotes(
-            "mux_grid",
-            outputs=[
-                ("range", self._grid_names.range),
-                ("duration", self._grid_names.duration),
-            ],
+        group.add_subsystem(
+            "missions",
+            self._get_missions_component(nb_grid_points, grid=True),
+            promotes=["*"],
         )
 
-        # Adding the results of the 2 MTOW points of the contour.
-        for i in range(2):
-            self.connect(
-                self._contour_names.range,
-                f"mux_grid.range_{nb_grid_points + i}",
-                src_indices=[i + 1],
-            )
-            self.connect(
-                self._contour_names.duration,
-                f"mux_grid.duration_{nb_grid_points + i}",
-                src_indices=om.slicer[i + 1],
-            )
-
         # Computation of specific burned fuel
         group.add_subsystem(
             "sbf_comp",
@@ -248,58 +215,150 @@ class PayloadRange(om.Group, BaseMissionComp, NeedsOWE, NeedsMTOW, NeedsMFW):
 
         return group
 
-    def _add_mission_runs(
-        self, group: om.Group, nb_missions: int, input_var_connections: dict[str, str], mux_name
-    ):
-        """Adds MissionRun components to the provided group."""
-
-        input_var_connections = {
-            self._contour_names.get_variable_name(
-                name1
-            ): f"data:mission:{self.mission_name}:{name2}"
-            for name1, name2 in input_var_connections.items()
-        }
-
-        mission_options = {
-            key: val for key, val in self.options.items() if key in MissionComp().options
-        }
+    def _get_missions_component(self, nb_points: int, *, grid: bool) -> "PayloadRangeMissions":
+        """Provides the component that computes missions for contour or grid points."""
         # We don't want to use the same mission wrapper because we modify
-        # its variable prefix.
-        mission_options["mission_file_path"] = self._mission_wrapper.definition
-        mission_options["variable_prefix"] = "data:mission"
-        mission_inputs = get_variable_list_from_system(
-            MissionComp(**mission_options), io_status="inputs"
-        )
-
-        for i in range(nb_missions):
-            subsys_name = f"mission_{i}"
-            group.add_subsystem(subsys_name, MissionComp(**mission_options))
-
-            # Connect block_fuel and TOW mission inputs to contour inputs
-            for payload_range_var, mission_var in input_var_connections.items():
-                group.connect(
-                    payload_range_var,
-                    f"{subsys_name}.{mission_var}",
-                    src_indices=[i],
-                )
-
-            # All other inputs are promoted.
-            promoted_inputs = [
-                variable.name
-                for variable in mission_inputs
-                if variable.name not in input_var_connections.values()
-            ]
-
-            group.promotes(subsys_name, inputs=promoted_inputs)
-
-            group.connect(
-                f"{subsys_name}.data:mission:{self.mission_name}:{self.first_route_name}:distance",
-                f"{mux_name}.range_{i}",
-            )
-            group.connect(
-                f"{subsys_name}.data:mission:{self.mission_name}:{self.first_route_name}:duration",
-                f"{mux_name}.duration_{i}",
+        # its variable prefix. The parsed mission definition is shared, though.
+        missions = PayloadRangeMissions(
+            propulsion_id=self.options["propulsion_id"],
+            propulsion_cache_size=self.options["propulsion_cache_size"],
+            use_propulsion_surrogate=self.options["use_propulsion_surrogate"],
+            mission_file_path=self._mission_wrapper.definition,
+            mission_name=self.mission_name,
+            reference_area_variable=self.options["reference_area_variable"],
+            variable_prefix="data:mission",
+            nb_points=nb_points,
+            grid=grid,
+            PR_variable_prefix=self.variable_prefix,
+        )
+        # Contour and grid missions use the same propulsion inputs, hence the same surrogate.
+        missions._propulsion_surrogates = self._propulsion_surrogates
+        return missions
+
+
+class PayloadRangeMissions(om.ExplicitComponent, BaseMissionComp):
+    """
+    Computes the missions of the payload-range diagram, for contour or grid points.
+
+    All missions are computed in this component, using the same mission definition and the
+    same propulsion model, instead of using one mission component per point.
+
+    For grid points, the 2 last points are the 2 MTOW points of the contour (as added by
+    :class:`PayloadRangeGridInputValues`), so their results are taken from contour results.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._names = None
+        self._contour_names = None
+        self._engine_wrapper = None
+        self._mission_input_names = []
+        self._input_weight_variable_name = ""
+        self._takeoff_weight_variable_name = ""
+        self._block_fuel_variable_name = ""
+
+    def initialize(self):
+        super().initialize()
+        self.options.declare(
+            "nb_points", default=4, types=int, desc="Number of missions to compute."
+        )
+        self.options.declare(
+            "grid",
+            default=False,
+            types=bool,
+            desc="If True, missions are computed for inner grid points, otherwise for "
+            "contour points.",
+        )
+        self.options.declare(
+            "PR_variable_prefix",
+            default="data:payload_range",
+            types=str,
+            desc="How auto-generated names of payload-range variables should begin.",
+        )
+
+    def setup(self):
+        super().setup()
+        self._names = _VariableNamer(
+            self.options["PR_variable_prefix"], self.mission_name, grid=self.options["grid"]
+        )
+        self._contour_names = _VariableNamer(
+            self.options["PR_variable_prefix"], self.mission_name, grid=False
+        )
+        nb_points = self.options["nb_points"]
+        nb_outputs = nb_points + 2 if self.options["grid"] else nb_points
+
+        self._engine_wrapper = RegisterPropulsion.get_provider(self.options["propulsion_id"])
+        self._setup_engine_wrapper(self._engine_wrapper)
+
+        self._input_weight_variable_name = self._mission_wrapper.get_input_weight_variable_name(
+            self.mission_name
+        )
+
+        # Block fuel and TOW of the missions are provided by payload-range inputs.
+        self._takeoff_weight_variable_name = f"{self.variable_prefix}:{self.mission_name}:TOW"
+        self._block_fuel_variable_name = f"{self.variable_prefix}:{self.mission_name}:block_fuel"
+        payload_range_variable_names = [
+            self._takeoff_weight_variable_name,
+            self._block_fuel_variable_name,
+        ]
+        self._mission_input_names = []
+        for variable in self._mission_wrapper.get_input_variables(self.mission_name):
+            if variable.name not in payload_range_variable_names:
+                self.add_input(**variable.get_openmdao_kwargs())
+                self._mission_input_names.append(variable.name)
+
+        with contextlib.suppress(ValueError):
+            self.add_input(self.options["reference_area_variable"], np.nan, units="m**2")
+
+        self.add_input(self._names.block_fuel, val=np.nan, shape_by_conn=True, units="kg")
+        self.add_input(self._names.TOW, val=np.nan, shape_by_conn=True, units="kg")
+        if self.options["grid"]:
+            self.add_input(self._contour_names.range, val=np.nan, shape_by_conn=True, units="m")
+            self.add_input(self._contour_names.duration, val=np.nan, shape_by_conn=True, units="s")
+
+        self.add_output(self._names.range, shape=(nb_outputs,), units="m")
+        self.add_output(self._names.duration, shape=(nb_outputs,), units="s")
+
+    def setup_partials(self):
+        self.declare_partials(["*"], ["*"], method="fd")
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        self._mission_wrapper.propulsion = self._get_propulsion_model(self._engine_wrapper, inputs)
+        self._mission_wrapper.reference_area = inputs[self.options["reference_area_variable"]]
+
+        route_name = f"{self.variable_prefix}:{self.mission_name}:{self.first_route_name}"
+        range_variable_name = f"{route_name}:distance"
+        duration_variable_name = f"{route_name}:duration"
+
+        mission_inputs = {name: inputs[name] for name in self._mission_input_names}
+        range_values = np.zeros_like(outputs[self._names.range])
+        duration_values = np.zeros_like(outputs[self._names.duration])
+        for i in range(self.options["nb_points"]):
+            # Missions are very different, so the solution of previous one is a bad starting
+            # point. Moreover, results would depend on the order of points.
+            self._mission_wrapper.reset_solution()
+            mission_inputs[self._block_fuel_variable_name] = inputs[self._names.block_fuel][i]
+            mission_inputs[self._takeoff_weight_variable_name] = inputs[self._names.TOW][i]
+            mission_outputs = {range_variable_name: 0.0, duration_variable_name: 0.0}
+
+            # Same default start point as in MissionComp
+            start_flight_point = FlightPoint(
+                altitude=0.0,
+                mass=mission_inputs[self._input_weight_variable_name],
+                true_airspeed=0.0,
             )
+            self._mission_wrapper.compute(start_flight_point, mission_inputs, mission_outputs)
+
+            range_values[i] = mission_outputs[range_variable_name]
+            duration_values[i] = mission_outputs[duration_variable_name]
+
+        if self.options["grid"]:
+            # Adding the results of the 2 MTOW points of the contour.
+            range_values[-2:] = inputs[self._contour_names.range][1:3]
+            duration_values[-2:] = inputs[self._contour_names.duration][1:3]
+
+        outputs[self._names.range] = range_values
+        outputs[self._names.duration] = duration_values
 
 
 class PayloadRangeContourInputValues(
@@ -0,0 +1,94 @@
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2024 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import contextlib
+
+import pandas as pd
+import pytest
+from numpy.testing import assert_allclose
+
+from ..flight_points_writer import FlightPointsWriter
+
+
+def _get_flight_points(value):
+    return pd.DataFrame({"time": [0.0, value], "mass": [70000.0, 69000.0]})
+
+
+def test_synchronous_writing(tmp_path):
+    file_path = tmp_path / "flight_points.csv"
+    writer = FlightPointsWriter(file_path, frequency=2)
+
+    writer.submit(_get_flight_points(1.0))
+    assert not file_path.exists()
+
+    writer.submit(_get_flight_points(2.0))
+    written = pd.read_csv(file_path, index_col=0)
+    assert list(written.columns) == ["time [s]", "mass [kg]"]
+    assert_allclose(written["time [s]"], [0.0, 2.0])
+
+    writer.submit(_get_flight_points(3.0))
+    writer.close()
+    assert_allclose(pd.read_csv(file_path, index_col=0)["time [s]"], [0.0, 3.0])
+
+
+def test_final_writing_only(tmp_path):
+    file_path = tmp_path / "flight_points.csv"
+    writer = FlightPointsWriter(file_path, frequency=0)
+
+    for i in range(5):
+        writer.submit(_get_flight_points(float(i)))
+    assert not file_path.exists()
+
+    writer.close()
+    assert_allclose(pd.read_csv(file_path, index_col=0)["time [s]"], [0.0, 4.0])
+
+
+def test_asynchronous_writing(tmp_path):
+    file_path = tmp_path / "flight_points.csv"
+    writer = FlightPointsWriter(file_path, asynchronous=True, queue_size=1)
+
+    for i in range(20):
+        writer.submit(_get_flight_points(float(i)))
+
+    writer.close()
+    # Whatever the intermediate writings, last flight points are written.
+    assert_allclose(pd.read_csv(file_path, index_col=0)["time [s]"], [0.0, 19.0])
+
+
+def test_parquet_writing(tmp_path):
+    pytest.importorskip("pyarrow")
+    file_path = tmp_path / "flight_points.parquet"
+    writer = FlightPointsWriter(file_path)
+
+    writer.submit(_get_flight_points(1.0))
+    assert_allclose(pd.read_parquet(file_path)["time [s]"], [0.0, 1.0])
+
+
+def test_asynchronous_writing_error(tmp_path, monkeypatch):
+    def failing_write(self, flight_points):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(FlightPointsWriter, "_write", failing_write)
+    writer = FlightPointsWriter(tmp_path / "flight_points.csv", asynchronous=True, queue_size=1)
+
+    writer.submit(_get_flight_points(0.0))
+    with pytest.raises(OSError, match="No space left"):
+        writer.close()
+
+    # Closing does not wait for ever for free space in the queue, whatever the number of
+    # submitted flight points after the error.
+    for i in range(20):
+        with contextlib.suppress(OSError):
+            writer.submit(_get_flight_points(float(i)))
+    with pytest.raises(OSError, match="No space left"):
+        writer.close()
@@ -161,6 +161,17 @@ def test_mission_component(cleanup, with_dummy_plugin_2):
         problem["data:weight:aircraft:sizing_onboard_fuel_at_input_weight"], 6395.0, atol=1.0
     )
 
+    # Running again with same inputs uses cached results
+    component = problem.model.component
+    flight_points = component.flight_points
+    assert component.cache_miss_count == 1
+    problem.run_model()
+    assert component.cache_hit_count == 1
+    assert component.cache_miss_count == 1
+    assert component.flight_points is flight_points
+    assert_allclose(problem["data:mission:operational:needed_block_fuel"], 6590.0, atol=1.0)
+    assert_allclose(problem["data:weight:aircraft:sizing_block_fuel"], 6590.0, atol=1.0)
+
 
 def test_mission_component_breguet(cleanup, with_dummy_plugin_2):
     input_file_path = DATA_FOLDER_PATH / "test_mission.xml"
@@ -19,7 +19,12 @@ from numpy.testing import assert_allclose
 from scipy.constants import nautical_mile
 
 from fastoad.io import DataFile
+from fastoad.model_base.propulsion import FuelEngineSet, GridPropulsion
 from fastoad.testing import run_system
+from tests.dummy_plugins.dist_2.dummy_plugin_2.models.subpackage.dummy_engine import (
+    DummyEngine,
+    DummyEngineWrapper,
+)
 
 from ..mission_run import MissionComp
 
@@ -99,3 +104,139 @@ def test_mission_run(cleanup, with_dummy_plugin_2):
         problem["data:payload_range:operational:distance"], 2000.0 * nautical_mile, atol=500.0
     )
     assert_allclose(problem["data:payload_range:operational:duration"], 16573.0, atol=10.0)
+
+
+def test_mission_run_with_propulsion_surrogate(cleanup, with_dummy_plugin_2):
+    input_file_path = DATA_FOLDER_PATH / "test_mission_run.xml"
+    ivc = DataFile(input_file_path).to_ivc()
+
+    def get_component():
+        return MissionComp(
+            propulsion_id="test.wrapper.propulsion.dummy_engine",
+            use_propulsion_surrogate=True,
+            mission_file_path=DATA_FOLDER_PATH / "test_mission.yml",
+            mission_name="operational",
+            reference_area_variable="data:geometry:aircraft:reference_area",
+            variable_prefix="data:payload_range",
+        )
+
+    problem = run_system(get_component(), ivc)
+    component = problem.model.component
+
+    # Results are close to the ones of test_mission_run()
+    assert_allclose(problem["data:payload_range:operational:needed_block_fuel"], 6590.0, rtol=1e-3)
+
+    # The surrogate is kept by the component and reused as long as inputs do not change.
+    inputs = component._inputs
+    propulsion = component._get_propulsion_model(component._engine_wrapper, inputs)
+    assert isinstance(propulsion, GridPropulsion)
+    assert component._get_propulsion_model(component._engine_wrapper, inputs) is propulsion
+    assert len(component._propulsion_surrogates) == 1
+
+    # Another component does not share it.
+    other_problem = run_system(get_component(), ivc)
+    other_component = other_problem.model.component
+    assert (
+        other_component._get_propulsion_model(other_component._engine_wrapper, inputs)
+        is not propulsion
+    )
+
+
+class _ItemsDummyEngineWrapper(DummyEngineWrapper):
+    """Reads inputs with items() instead of item access."""
+
+    def get_model(self, inputs):
+        values = dict(inputs.items())
+        return FuelEngineSet(
+            DummyEngine(
+                values["data:propulsion:dummy_engine:max_thrust"],
+                values["data:propulsion:dummy_engine:max_sfc"],
+            ),
+            values["data:geometry:propulsion:engine_count"],
+        )
+
+
+class _ItemsMissionComp(MissionComp):
+    def get_engine_wrapper(self):
+        return _ItemsDummyEngineWrapper()
+
+
+def test_mission_run_with_propulsion_surrogate_and_modified_inputs(cleanup, with_dummy_plugin_2):
+    input_file_path = DATA_FOLDER_PATH / "test_mission_run.xml"
+    ivc = DataFile(input_file_path).to_ivc()
+
+    problem = run_system(
+        _ItemsMissionComp(
+            use_propulsion_surrogate=True,
+            mission_file_path=DATA_FOLDER_PATH / "test_mission.yml",
+            mission_name="operational",
+            reference_area_variable="data:geometry:aircraft:reference_area",
+            variable_prefix="data:payload_range",
+        ),
+        ivc,
+    )
+    component = problem.model.component
+    assert component._propulsion_input_names == [
+        "data:propulsion:dummy_engine:max_thrust",
+        "data:propulsion:dummy_engine:max_sfc",
+        "data:geometry:propulsion:engine_count",
+    ]
+    block_fuel = problem["data:payload_range:operational:needed_block_fuel"].copy()
+
+    # Surrogate is computed again when propulsion inputs change.
+    problem["data:propulsion:dummy_engine:max_sfc"] *= 1.1
+    problem.run_model()
+    assert len(component._propulsion_surrogates) == 2
+    assert problem["data:payload_range:operational:needed_block_fuel"] > block_fuel * 1.05
+
+
+def test_mission_run_with_partial_coloring(cleanup, with_dummy_plugin_2, monkeypatch):
+    # Keeps coloring files of OpenMDAO out of current directory
+    monkeypatch.setenv("OPENMDAO_WORKDIR", str(RESULTS_FOLDER_PATH))
+
+    input_file_path = DATA_FOLDER_PATH / "test_mission.xml"
+    ivc = DataFile(input_file_path).to_ivc()
+    ivc.add_output("data:mission:operational:ramp_weight", 70100.0, units="kg")
+
+    of = ["data:mission:operational:needed_block_fuel"]
+    wrt = [
+        "data:aerodynamics:aircraft:cruise:CL",
+        "data:aerodynamics:aircraft:cruise:CD",
+        "data:geometry:aircraft:reference_area",
+    ]
+
+    def get_problem(*, use_partial_coloring):
+        return run_system(
+            MissionComp(
+                propulsion_id="test.wrapper.propulsion.dummy_engine",
+                mission_file_path=DATA_FOLDER_PATH / "test_breguet.yml",
+                mission_name="operational",
+                reference_area_variable="data:geometry:aircraft:reference_area",
+                use_partial_coloring=use_partial_coloring,
+            ),
+            ivc,
+        )
+
+    # Coloring is computed at first linearization, and used for next ones.
+    problem = get_problem(use_partial_coloring=True)
+    component = problem.model.component
+    problem.compute_totals(of=of, wrt=wrt)
+    problem["data:geometry:aircraft:reference_area"] += 1.0
+    problem.run_model()
+    computation_count = component.cache_miss_count
+    totals = problem.compute_totals(of=of, wrt=wrt)
+    colored_computation_count = component.cache_miss_count - computation_count
+
+    ref_problem = get_problem(use_partial_coloring=False)
+    ref_component = ref_problem.model.component
+    ref_problem["data:geometry:aircraft:reference_area"] += 1.0
+    ref_problem.run_model()
+    computation_count = ref_component.cache_miss_count
+    ref_totals = ref_problem.compute_totals(of=of, wrt=wrt)
+    ref_computation_count = ref_component.cache_miss_count - computation_count
+
+    for key, value in ref_totals.items():
+        assert_allclose(totals[key], value, rtol=1e-6, atol=1e-3)
+
+    # Only a small part of polar values is used during the mission.
+    assert colored_computation_count < ref_computation_count / 4
@@ -20,6 +20,7 @@ from numpy.testing import assert_allclose
 from fastoad.io import DataFile
 from fastoad.testing import run_system
 
+from ..mission_run import MissionComp
 from ..payload_range import PayloadRange
 
 DATA_FOLDER_PATH = Path(__file__).parent / "data"
@@ -189,3 +190,55 @@ def test_payload_range_sizing_mission(cleanup, with_dummy_plugin_2):
         [1.463138e-4, 1.12571e-4, 1.05282e-4, 1.18153e-4],
         rtol=1.0e-4,
     )
+
+
+def test_payload_range_missions_match_mission_component(cleanup, with_dummy_plugin_2):
+    input_file_path = DATA_FOLDER_PATH / "test_payload_range.xml"
+
+    payload_range = PayloadRange(
+        propulsion_id="test.wrapper.propulsion.dummy_engine",
+        mission_file_path="::sizing_breguet",
+        mission_name="sizing",
+        reference_area_variable="data:geometry:aircraft:reference_area",
+        nb_contour_points=5,
+    )
+    problem = run_system(payload_range, DataFile(input_file_path).to_ivc())
+    ranges = problem.get_val("data:payload_range:sizing:range", "m")
+    durations = problem.get_val("data:payload_range:sizing:duration", "s")
+
+    # A second run gives the same results (no dependency on previous computations).
+    problem.run_model()
+    assert_allclose(problem.get_val("data:payload_range:sizing:range", "m"), ranges)
+
+    # Each point gives the same results as a mission component.
+    for i in range(1, 5):
+        input_data = DataFile(input_file_path)
+        # This one is an output of mission component.
+        input_data.remove(input_data["data:mission:sizing:consumed_fuel_before_input_weight"])
+        input_data["data:mission:sizing:TOW"] = {
+            "val": problem.get_val("data:payload_range:sizing:TOW", "kg")[i],
+            "units": "kg",
+        }
+        input_data["data:mission:sizing:block_fuel"] = {
+            "val": problem.get_val("data:payload_range:sizing:block_fuel", "kg")[i],
+            "units": "kg",
+        }
+        mission_problem = run_system(
+            MissionComp(
+                propulsion_id="test.wrapper.propulsion.dummy_engine",
+                mission_file_path=payload_range._mission_wrapper.definition,
+                mission_name="sizing",
+                reference_area_variable="data:geometry:aircraft:reference_area",
+            ),
+            input_data,
+        )
+        assert_allclose(
+            mission_problem.get_val("data:mission:sizing:main_route:distance", "m"),
+            ranges[i],
+            rtol=1.0e-10,
+        )
+        assert_allclose(
+            mission_problem.get_val("data:mission:sizing:main_route:duration", "s"),
+            durations[i],
+            rtol=1.0e-10,
+        )
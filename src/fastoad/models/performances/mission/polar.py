@@ -12,8 +12,11 @@
 #  GNU General Public License for more details.
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+from bisect import bisect_left, bisect_right
+
+import numpy as np
 from numpy import ndarray
-from scipy.interpolate import interp1d
+from scipy.interpolate import PPoly, make_interp_spline
 from scipy.optimize import fmin
 
 
@@ -39,18 +42,15 @@ class Polar:
         self._definition_CD = cd
 
         # Interpolate cd
-        self._cd_vs_cl = interp1d(cl, cd, kind="quadratic", fill_value="extrapolate")
+        self._cd_vs_cl = _QuadraticInterpolator(cl, cd)
 
         # CL as a function of AoA
         self._definition_alpha = alpha
         if alpha is not None:
-            self._cl_vs_alpha = interp1d(alpha, cl, kind="linear", fill_value="extrapolate")
-
-        def _negated_lift_drag_ratio(lift_coeff):
-            """Returns -CL/CD."""
-            return -lift_coeff / self.cd(lift_coeff)
+            self._cl_vs_alpha = _LinearInterpolator(alpha, cl)
 
-        self._optimal_CL = fmin(_negated_lift_drag_ratio, cl[0], disp=0)
+        # Computed when first requested
+        self._optimal_CL = None
 
     @property
     def definition_cl(self):
@@ -70,6 +70,8 @@ class Polar:
     @property
     def optimal_cl(self):
         """The CL value that provides larger lift/drag ratio."""
+        if self._optimal_CL is None:
+            self._optimal_CL = self._compute_optimal_cl()
         return self._optimal_CL
 
     def cd(self, cl=None):
@@ -95,3 +97,207 @@ class Polar:
             raise ValueError("Polar was instantiated without alpha vector.")
 
         return self._cl_vs_alpha(alpha)
+
+    def _get_cd_polynomials(self) -> tuple[ndarray, ndarray]:
+        """
+        Provides the CD interpolation as piecewise polynomials.
+
+        On interval `i`, CD = c[0, i] * dx**2 + c[1, i] * dx + c[2, i], with
+        dx = CL - breakpoints[i]. The first and last polynomials are also used below and above
+        the breakpoint range.
+
+        :return: breakpoints (N+1 values), and coefficients c (3xN array)
+        """
+        polynomials = PPoly.from_spline(self._cd_vs_cl.spline)
+        # Intervals of null length at both ends of knot vector are removed.
+        is_used = np.diff(polynomials.x) > 0.0
+        breakpoints = np.append(polynomials.x[:-1][is_used], polynomials.x[-1])
+        return breakpoints, polynomials.c[:, is_used]
+
+    def _compute_optimal_cl(self) -> float:
+        """
+        Computes the CL value that provides larger lift/drag ratio.
+
+        On each interval, where CD = a * CL**2 + b * CL + c, CL/CD is stationary for
+        CL = sqrt(c/a). The best of these candidates is retained.
+        """
+        breakpoints, (c_0, c_1, c_2) = self._get_cd_polynomials()
+        x_i = breakpoints[:-1]
+        lower_bounds = np.concatenate(([-np.inf], breakpoints[1:-1]))
+        upper_bounds = np.concatenate((breakpoints[1:-1], [np.inf]))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            candidates = np.sqrt((c_0 * x_i**2 - c_1 * x_i + c_2) / c_0)
+        candidates = candidates[
+            np.isfinite(candidates) & (lower_bounds <= candidates) & (candidates <= upper_bounds)
+        ]
+        candidates = candidates[self.cd(candidates) > 0.0]
+
+        if len(candidates) == 0:
+            # No maximum of lift/drag ratio has been found. Let's do as before.
+            return fmin(self._negated_lift_drag_ratio, self.definition_cl[0], disp=0)[0]
+
+        return float(candidates[np.argmax(candidates / self.cd(candidates))])
+
+    def _negated_lift_drag_ratio(self, lift_coeff):
+        """Returns -CL/CD."""
+        return -lift_coeff / self.cd(lift_coeff)
+
+
+class IncrementedPolar(Polar):
+    def __init__(self, polar: Polar, induced_drag_increment: float):
+        """
+        Polar obtained by adding to a base polar a CD increment that is proportional to CL**2.
+
+        No interpolation is built at instantiation: CD is computed from the base polar, and the
+        increment is added analytically. Therefore, this class is suited for polar modifiers
+        that are called at each time step.
+
+        As CD interpolation of the base polar is quadratic, results are the same as with a
+        :class:`Polar` instance defined with incremented CD values.
+
+        :param polar: the base polar
+        :param induced_drag_increment: the CD increment is `induced_drag_increment * CL**2`
+        """
+        # Polar.__init__() is not called, as interpolations of base polar are used.
+        self._base_polar = polar
+        self._induced_drag_increment = induced_drag_increment
+        self._optimal_CL = None
+
+    @property
+    def base_polar(self) -> Polar:
+        """The polar to which CD increment is applied."""
+        return self._base_polar
+
+    @property
+    def definition_cl(self):
+        return self._base_polar.definition_cl
+
+    @property
+    def definition_cd(self):
+        return self._base_polar.definition_cd + self._get_cd_increment(self.definition_cl)
+
+    @property
+    def definition_alpha(self):
+        return self._base_polar.definition_alpha
+
+    def cd(self, cl=None):
+        if cl is None:
+            cl = self.definition_cl
+        return self._base_polar.cd(cl) + self._get_cd_increment(cl)
+
+    def cl(self, alpha):
+        return self._base_polar.cl(alpha)
+
+    def _get_cd_polynomials(self) -> tuple[ndarray, ndarray]:
+        breakpoints, coefficients = self._base_polar._get_cd_polynomials()
+        x_i = breakpoints[:-1]
+        k = self._induced_drag_increment
+        # k * CL**2 = k * dx**2 + 2 * k * x_i * dx + k * x_i**2
+        return breakpoints, coefficients + np.array([np.full_like(x_i, k), 2 * k * x_i, k * x_i**2])
+
+    def _get_cd_increment(self, cl):
+        return self._induced_drag_increment * cl**2
+
+
+class _QuadraticInterpolator:
+    def __init__(self, x: ndarray, y: ndarray):
+        """
+        Quadratic spline interpolation with extrapolation.
+
+        Results are identical to the ones of
+        `scipy.interpolate.interp1d(x, y, kind="quadratic", fill_value="extrapolate")`, but
+        evaluation for a scalar value is done without any call to numpy or scipy.
+
+        :param x: a N-elements array
+        :param y: a N-elements array
+        """
+        x, y = _sort_definition(x, y)
+        self.spline = make_interp_spline(x, y, k=2, check_finite=False)
+
+        # Data for computing the De Boor algorithm for each interval, with same operations as
+        # in scipy, to get the same floating-point results.
+        knots = self.spline.t.tolist()
+        coefficients = self.spline.c.tolist()
+        self._knots = knots
+        self._max_interval_index = len(coefficients) - 1
+        self._interval_data = {
+            i: (
+                knots[i - 1],
+                knots[i],
+                knots[i + 1],
+                knots[i + 2],
+                knots[i + 1] - knots[i],
+                knots[i + 1] - knots[i - 1],
+                knots[i + 2] - knots[i],
+                coefficients[i - 2],
+                coefficients[i - 1],
+                coefficients[i],
+            )
+            for i in range(2, len(coefficients))
+        }
+
+    def __call__(self, x):
+        if not isinstance(x, float) and np.ndim(x) != 0:
+            return self.spline(x)
+
+        x = float(x)
+        # First and last intervals are used for extrapolation.
+        interval_index = min(max(bisect_right(self._knots, x) - 1, 2), self._max_interval_index)
+        t_0, t_1, t_2, t_3, d_1, d_2, d_3, c_0, c_1, c_2 = self._interval_data[interval_index]
+
+        # B-spline basis functions
+        w = 1.0 / d_1
+        h_0 = w * (t_2 - x)
+        h_1 = w * (x - t_1)
+
+        w = h_0 / d_2
+        h_0 = w * (t_2 - x)
+        h_1_ = w * (x - t_0)
+        w = h_1 / d_3
+        h_1 = h_1_ + w * (t_3 - x)
+        h_2 = w * (x - t_1)
+
+        return np.float64(0.0 + c_0 * h_0 + c_1 * h_1 + c_2 * h_2)
+
+
+class _LinearInterpolator:
+    def __init__(self, x: ndarray, y: ndarray):
+        """
+        Linear interpolation with extrapolation.
+
+        Results are identical to the ones of
+        `scipy.interpolate.interp1d(x, y, kind="linear", fill_value="extrapolate")`, but
+        evaluation for a scalar value is done without any call to numpy or scipy.
+
+        :param x: a N-elements array
+        :param y: a N-elements array
+        """
+        self._x, self._y = _sort_definition(x, y)
+        self._slopes = (self._y[1:] - self._y[:-1]) / (self._x[1:] - self._x[:-1])
+        self._x_list = self._x.tolist()
+        self._interval_data = list(
+            zip(self._x_list[:-1], self._y.tolist()[:-1], self._slopes.tolist())
+        )
+
+    def __call__(self, x):
+        if not isinstance(x, float) and np.ndim(x) != 0:
+            x = np.asarray(x)
+            lower_indices = np.searchsorted(self._x, x).clip(1, len(self._x) - 1) - 1
+            return (
+                self._slopes[lower_indices] * (x - self._x[lower_indices]) + self._y[lower_indices]
+            )
+
+        x = float(x)
+        # First and last intervals are used for extrapolation.
+        lower_index = min(max(bisect_left(self._x_list, x), 1), len(self._x_list) - 1) - 1
+        x_lower, y_lower, slope = self._interval_data[lower_index]
+        return np.float64(slope * (x - x_lower) + y_lower)
+
+
+def _sort_definition(x: ndarray, y: ndarray) -> tuple[ndarray, ndarray]:
+    """Returns x and y as float arrays, sorted according to x values."""
+    x = np.array(x, dtype=float)
+    y = np.array(y, dtype=float)
+    indices = np.argsort(x, kind="mergesort")
+    return x[indices], y[indices]
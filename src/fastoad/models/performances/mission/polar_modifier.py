@@ -18,7 +18,7 @@ from dataclasses import dataclass
 from fastoad.model_base.flight_point import FlightPoint
 
 from .base import RegisterElement
-from .polar import Polar
+from .polar import IncrementedPolar, Polar
 
 
 @dataclass
@@ -30,6 +30,10 @@ class AbstractPolarModifier(ABC):
     @abstractmethod
     def modify_polar(self, polar: Polar, flight_point: FlightPoint) -> Polar:
         """
+        As this method is called for each computed flight point, building new interpolations
+        should be avoided. If possible, the returned polar should rather rely on the
+        interpolations of provided polar (see :class:`~.polar.IncrementedPolar`).
+
         :param polar: an instance of Polar
         :param flight_point: an intance of FlightPoint containg only floats
         :return: the modified polar for the flight point
@@ -99,7 +103,7 @@ class GroundEffectRaymer(AbstractPolarModifier):
         :param polar: a Polar instance used as basis to apply ground effect
         :param flight_point: a flight point containing the flight conditions
         for calculation of ground effect
-        :return: a copy of polar with ground effect
+        :return: polar with ground effect
         """
 
         h_b = (
@@ -109,17 +113,9 @@ class GroundEffectRaymer(AbstractPolarModifier):
             - self.ground_altitude
         ) / self.span
         k_ground = 33.0 * h_b**1.5 / (1 + 33.0 * h_b**1.5)
-        cd_ground = (
-            self.induced_drag_coefficient
-            * polar.definition_cl**2
-            * self.k_winglet
-            * self.k_cd
-            * (k_ground - 1)
-        )
 
-        # Update polar interpolation
-        return Polar(  # modified_polar
-            polar.definition_cl,
-            polar.definition_cd + cd_ground,
-            polar.definition_alpha,
+        # Ground effect is a change of the induced drag, so no new interpolation is needed.
+        return IncrementedPolar(  # modified_polar
+            polar,
+            self.induced_drag_coefficient * self.k_winglet * self.k_cd * (k_ground - 1),
         )
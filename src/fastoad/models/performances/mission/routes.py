@@ -14,6 +14,7 @@ Classes for computation of routes (i.e. assemblies of climb, cruise and descent
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from collections.abc import Generator
 from dataclasses import dataclass
 
 import numpy as np
@@ -65,6 +66,10 @@ class RangedRoute(FlightSequence):
         # We will use this to keep data along root_scalar process (see _solve_cruise_distance() )
         self._flight_points = None
 
+        # Flight points of climb phases, stored during _solve_cruise_distance(), by
+        # (phase index, start point values).
+        self._climb_flight_points = None
+
     @property
     def cruise_distance(self):
         """
@@ -141,18 +146,53 @@ class RangedRoute(FlightSequence):
         """
         Adjusts cruise distance through a solver to have whole route that
         matches provided flight distance.
+
+        Climb phases do not depend on cruise distance, so they are computed only once.
+
+        Route distance is the sum of climb, cruise and descent distances, and climb and
+        descent distances depend very little on cruise distance. Therefore, the derivative of
+        route distance with respect to cruise distance is taken equal to 1. The first
+        iteration then gives the climb and descent distances, from which the second iteration
+        gets a nearly exact cruise distance.
+
+        As the solver does not evaluate the flight at the cruise distance it returns, the
+        flight is computed once more for this cruise distance.
         """
+        self._climb_flight_points = {}
+        try:
+            solution = root_scalar(
+                self._compute_flight,
+                args=(start,),
+                fprime=lambda cruise_distance, start: -1.0,
+                x0=self.flight_distance * 0.5,
+                xtol=self.distance_accuracy,
+                method="newton",
+            )
+            if solution.root != self.cruise_distance:
+                self._compute_flight(solution.root, start)
+        finally:
+            self._climb_flight_points = None
 
-        root_scalar(
-            self._compute_flight,
-            args=(start,),
-            x0=self.flight_distance * 0.5,
-            x1=self.flight_distance * 0.25,
-            xtol=self.distance_accuracy,
-            method="secant",
+        return self._flight_points
+
+    def _iter_compute_part(
+        self, part: IFlightPart, start: FlightPoint
+    ) -> Generator[pd.DataFrame, None, pd.DataFrame]:
+        climb_phase_indices = [i for i, phase in enumerate(self.climb_phases) if phase is part]
+        if self._climb_flight_points is None or not climb_phase_indices:
+            return (yield from super()._iter_compute_part(part, start))
+
+        key = (
+            climb_phase_indices[0],
+            tuple(getattr(start, name) for name in FlightPoint.get_field_names()),
         )
+        if key not in self._climb_flight_points:
+            self._climb_flight_points[key] = yield from super()._iter_compute_part(part, start)
+        else:
+            yield self._climb_flight_points[key]
 
-        return self._flight_points
+        # A copy is returned because flight points may be modified in the flight sequence.
+        return self._climb_flight_points[key].copy()
 
     def _compute_flight(self, cruise_distance, start: FlightPoint):
         """
@@ -0,0 +1,166 @@
+"""Fast computation of atmosphere parameters for flight segments."""
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from functools import lru_cache
+from math import log
+from typing import NamedTuple
+
+import numpy as np
+from stdatm.speed_parameters import (
+    compute_calibrated_airspeed,
+    compute_equivalent_airspeed,
+    compute_impact_pressure,
+    compute_mach,
+    compute_tas_from_eas,
+    compute_tas_from_mach,
+)
+from stdatm.state_parameters import (
+    SEA_LEVEL_PRESSURE,
+    TROPOPAUSE,
+    compute_density,
+    compute_pressure,
+    compute_speed_of_sound,
+    compute_temperature,
+)
+
+#: Maximum number of (altitude, ISA offset) couples for which atmosphere state is kept in memory.
+ATMOSPHERE_CACHE_SIZE = 4096
+
+# Coefficients of pressure model, as in stdatm.state_parameters.compute_pressure(), where
+# they are not available as constants. Consistency is checked in tests/test_atmosphere.py.
+_TROPOSPHERE_PRESSURE_SCALE = 44330.78
+_TROPOSPHERE_PRESSURE_EXPONENT = 5.25587611
+_STRATOSPHERE_REFERENCE_PRESSURE = 22632.0
+_STRATOSPHERE_BASE = 2.718281
+_STRATOSPHERE_OFFSET = 1.7345725
+_STRATOSPHERE_ALTITUDE_COEFF = 0.0001576883
+
+
+class AtmosphereState(NamedTuple):
+    """Atmosphere state parameters, in SI units, at one altitude."""
+
+    temperature: float
+    pressure: float
+    density: float
+    speed_of_sound: float
+
+
+class SpeedValues(NamedTuple):
+    """Consistent speed parameters, in SI units, at one altitude."""
+
+    true_airspeed: float
+    mach: float
+    equivalent_airspeed: float
+    calibrated_airspeed: float
+
+
+@lru_cache(maxsize=ATMOSPHERE_CACHE_SIZE)
+def get_atmosphere_state(altitude: float, isa_offset: float) -> AtmosphereState:
+    """
+    Computes atmosphere state for a scalar altitude.
+
+    Computation uses the same functions as :class:`stdatm.AtmosphereSI`, so results are
+    identical, but no object is instantiated. Moreover, results are cached, so that
+    calls for the same altitude in a time step are almost free.
+
+    :param altitude: in meters
+    :param isa_offset: temperature increment (°C) applied to whole temperature profile
+    :return: the atmosphere state
+    """
+    return compute_atmosphere_state(altitude, isa_offset)
+
+
+def compute_atmosphere_state(altitude, isa_offset) -> AtmosphereState:
+    """
+    Computes atmosphere state, without caching.
+
+    Unlike :func:`get_atmosphere_state`, this function accepts arrays of altitudes (and of
+    ISA offsets), as used for batch computations.
+
+    :param altitude: in meters
+    :param isa_offset: temperature increment (°C) applied to whole temperature profile
+    :return: the atmosphere state
+    """
+    temperature = compute_temperature(altitude, isa_offset)
+    pressure = compute_pressure(altitude)
+    return AtmosphereState(
+        temperature,
+        pressure,
+        compute_density(pressure, temperature),
+        compute_speed_of_sound(temperature),
+    )
+
+
+def get_speed_values(
+    state: AtmosphereState,
+    *,
+    true_airspeed: float | None = None,
+    mach: float | None = None,
+    equivalent_airspeed: float | None = None,
+) -> SpeedValues:
+    """
+    Computes all speed parameters from one of them, as :class:`stdatm.AtmosphereSI` does.
+
+    If several speed parameters are provided, priority order is true airspeed, Mach, then
+    equivalent airspeed. At least one of them must be provided.
+
+    :param state: atmosphere state, as provided by :func:`get_atmosphere_state`
+    :param true_airspeed: in m/s
+    :param mach: no unit
+    :param equivalent_airspeed: in m/s
+    :return: the speed values
+    """
+    if true_airspeed is not None:
+        mach = compute_mach(true_airspeed, state.speed_of_sound)
+        equivalent_airspeed = compute_equivalent_airspeed(true_airspeed, state.density)
+    elif mach is not None:
+        true_airspeed = compute_tas_from_mach(mach, state.speed_of_sound)
+        equivalent_airspeed = compute_equivalent_airspeed(true_airspeed, state.density)
+    else:
+        true_airspeed = compute_tas_from_eas(equivalent_airspeed, state.density)
+        mach = compute_mach(true_airspeed, state.speed_of_sound)
+
+    if isinstance(state.pressure, np.ndarray) and not isinstance(mach, np.ndarray):
+        # Scalar Mach with array of altitudes: stdatm would use its cached scalar implementation.
+        mach = np.full_like(state.pressure, mach)
+
+    return SpeedValues(
+        true_airspeed,
+        mach,
+        equivalent_airspeed,
+        compute_calibrated_airspeed(compute_impact_pressure(mach, state.pressure)),
+    )
+
+
+def get_altitude_from_pressure(pressure: float) -> float:
+    """
+    Computes altitude from static pressure.
+
+    This is the analytical inverse of the pressure model of :class:`stdatm.AtmosphereSI`.
+    Since this model does not depend on ISA temperature offset, neither does this function.
+
+    :param pressure: in Pa
+    :return: altitude in meters
+    """
+    altitude = _TROPOSPHERE_PRESSURE_SCALE * (
+        1.0 - (pressure / SEA_LEVEL_PRESSURE) ** (1.0 / _TROPOSPHERE_PRESSURE_EXPONENT)
+    )
+    if altitude >= TROPOPAUSE:
+        altitude = (
+            _STRATOSPHERE_OFFSET
+            - log(pressure / _STRATOSPHERE_REFERENCE_PRESSURE) / log(_STRATOSPHERE_BASE)
+        ) / _STRATOSPHERE_ALTITUDE_COEFF
+        # The pressure model is very slightly discontinuous at tropopause.
+        altitude = max(altitude, TROPOPAUSE)
+    return altitude
@@ -14,8 +14,8 @@
 
 import contextlib
 from abc import ABC, abstractmethod
-from copy import deepcopy
 from dataclasses import dataclass, field
+from numbers import Real
 from typing import ClassVar
 
 import numpy as np
@@ -26,6 +26,12 @@ from stdatm import AtmosphereSI
 from fastoad.model_base import FlightPoint
 from fastoad.model_base.datacls import MANDATORY_FIELD
 
+from .atmosphere import (
+    AtmosphereState,
+    compute_atmosphere_state,
+    get_atmosphere_state,
+    get_speed_values,
+)
 from ..base import IFlightPart, RegisterElement
 from ..exceptions import FastFlightSegmentIncompleteFlightPointError
 
@@ -140,7 +146,12 @@ class AbstractFlightSegment(IFlightPart, ABC):
     constant_value_name = "constant"
 
     # To be noted: this one is not a dataclass field, but an actual class attribute
-    _attribute_units: ClassVar[dict] = {"reference_area": "m**2", "time_step": "s"}
+    _attribute_units: ClassVar[dict] = {
+        "reference_area": "m**2",
+        "time_step": "s",
+        "minimum_time_step": "s",
+        "maximum_time_step": "s",
+    }
 
     @abstractmethod
     def compute_from_start_to_target(self, start, target) -> pd.DataFrame:
@@ -200,9 +211,19 @@ class AbstractFlightSegment(IFlightPart, ABC):
         :return: a pandas DataFrame where column names match fields of
                  :class:`~fastoad.model_base.flight_point.FlightPoint`
         """
+        start_copy, target_copy = self._get_start_and_target(start)
+        return self.compute_from_start_to_target(start_copy, target_copy)  # flight_points
+
+    def _get_start_and_target(self, start: FlightPoint) -> tuple[FlightPoint, FlightPoint]:
+        """
+        Generic preprocessing of start and target flight points, as done in :meth:`compute_from`.
+
+        :param start: the initial flight point, as provided to :meth:`compute_from`
+        :return: completed copy of start point, and copy of target where no field is relative
+        """
         # Let's ensure we do not modify the original definitions of start and target
         # during the process
-        start_copy = deepcopy(start)
+        start_copy = start.copy()
 
         if start_copy.altitude is not None:
             with contextlib.suppress(FastFlightSegmentIncompleteFlightPointError):
@@ -218,7 +239,7 @@ class AbstractFlightSegment(IFlightPart, ABC):
         if start_copy.ground_distance is None:
             start_copy.ground_distance = 0.0
 
-        return self.compute_from_start_to_target(start_copy, target_copy)  # flight_points
+        return start_copy, target_copy
 
     def complete_flight_point(self, flight_point: FlightPoint):
         """
@@ -303,6 +324,24 @@ class AbstractFlightSegment(IFlightPart, ABC):
         # make sure flight_point is scalarized before completing speeds
         flight_point.scalarize()
 
+        if flight_point.altitude is not None and (
+            flight_point.true_airspeed is not None
+            or flight_point.mach is not None
+            or flight_point.equivalent_airspeed is not None
+        ):
+            # Fast path for the general case (atmosphere is not cached for array values)
+            speeds = get_speed_values(
+                self._get_atmosphere_state(flight_point.altitude),
+                true_airspeed=flight_point.true_airspeed,
+                mach=flight_point.mach,
+                equivalent_airspeed=flight_point.equivalent_airspeed,
+            )
+            flight_point.true_airspeed = speeds.true_airspeed
+            flight_point.mach = speeds.mach
+            flight_point.equivalent_airspeed = speeds.equivalent_airspeed
+            flight_point.calibrated_airspeed = speeds.calibrated_airspeed
+            return True
+
         atm = self._get_atmosphere_point(flight_point.altitude)
 
         if flight_point.true_airspeed is None:
@@ -336,3 +375,17 @@ class AbstractFlightSegment(IFlightPart, ABC):
         :return: AtmosphereSI instantiated from provided altitude and :attr:`delta_isa`
         """
         return AtmosphereSI(altitude, self.isa_offset)
+
+    def _get_atmosphere_state(self, altitude: float) -> AtmosphereState:
+        """
+        Fast alternative to :meth:`_get_atmosphere_point`.
+
+        Results are cached for a scalar altitude. An array of altitudes is also accepted
+        (see :meth:`compute_batch_from`).
+
+        :param altitude: in meters
+        :return: atmosphere state parameters for provided altitude and :attr:`isa_offset`
+        """
+        if isinstance(altitude, Real) and isinstance(self.isa_offset, Real):
+            return get_atmosphere_state(altitude, self.isa_offset)
+        return compute_atmosphere_state(np.asarray(altitude), self.isa_offset)
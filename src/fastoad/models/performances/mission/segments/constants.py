@@ -25,3 +25,20 @@ class ThrustRateOutOfBound(Enum):
 
     EXTRAPOLATE = "extrapolate"
     LIMIT = "limit"
+
+
+class IntegrationMethod(Enum):
+    """
+    Enum for time integration methods of time-step segments.
+
+    - FIXED_STEP: explicit Euler integration with constant time step
+    - ADAPTIVE: explicit Euler integration where time step is driven by an estimate of
+      local error (embedded Heun-Euler pair)
+    - QUASI_STEADY: for segments where mass is the only evolving state (constant altitude and
+      speed), Heun integration with few large time steps, refined until Richardson estimate
+      of error complies with tolerance. Other segments are integrated as with FIXED_STEP.
+    """
+
+    FIXED_STEP = "fixed_step"
+    ADAPTIVE = "adaptive"
+    QUASI_STEADY = "quasi_steady"
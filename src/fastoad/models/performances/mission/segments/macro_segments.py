@@ -13,9 +13,12 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 from abc import ABCMeta
+from collections.abc import Sequence
 from dataclasses import dataclass, field, fields, make_dataclass
 from typing import ClassVar
 
+import pandas as pd
+
 from fastoad.model_base import FlightPoint
 from fastoad.model_base.datacls import MANDATORY_FIELD
 from fastoad.models.performances.mission.base import FlightSequence
@@ -45,28 +48,38 @@ class MacroSegmentBase(FlightSequence):
     #: List of segment classes that will compose this macro-segment.
     cls_sequence: ClassVar[list] = []
 
+    # For each segment class in cls_sequence, names of its dataclass fields that can be set by
+    # this macro-segment. Set by MacroSegmentMeta.
+    _segment_field_names: ClassVar[list[frozenset[str]]] = []
+
+    # Names of fields that are parameters of the macro-segment, by class. Lazily set.
+    _parameter_names: ClassVar[dict[type, frozenset[str]]] = {}
+
     # Flag that is set to True after instantiation is finished.
     _initialized: bool = field(default=False, init=False)
 
     # Flag that is set to True during sequence building.
     _building: bool = field(default=False, init=False)
 
+    # Flag that is set to True when a parameter has been modified after last sequence building.
+    _needs_build: bool = field(default=True, init=False)
+
     def __post_init__(self):
-        self.build_sequence()
-        self._building = False
+        self._needs_build = True
         self._initialized = True
 
     def __setattr__(self, key, value):
         super().__setattr__(key, value)
 
-        # Here we build the sequence after each field modification, to ensure any
-        # field values will be taken into account, whenever it is set.
-        if key != "_building" and self._initialized and not self._building:
-            self._building = True
-
-            # Rebuild the sequence after this update of value.
-            self.build_sequence()
-            self._building = False
+        # Here we only flag the sequence for being rebuilt. It will be done when the sequence
+        # is actually used, so that all field values will be taken into account.
+        if (
+            self._initialized
+            and not self._building
+            and key in self._get_parameter_names()
+            and not self._needs_build
+        ):
+            super().__setattr__("_needs_build", True)
 
     def build_sequence(self):
         """
@@ -76,26 +89,67 @@ class MacroSegmentBase(FlightSequence):
         derived classes should overload this method to manage at least targets of intermediate
         segments.
 
-        Note: this method is called each time a dataclass field value is modified.
+        Note: this method is called when the sequence is used after a modification of a
+        dataclass field value.
         """
         self.clear()
 
-        for segment_class in self.cls_sequence:
-            segment_field_names = {
-                f.name for f in fields(segment_class) if not f.name.startswith("_")
-            }
+        segment_field_names = self._segment_field_names or [
+            {f.name for f in fields(segment_class) if not f.name.startswith("_")}
+            for segment_class in self.cls_sequence
+        ]
+        parameter_names = self._get_parameter_names()
+        for segment_class, field_names in zip(self.cls_sequence, segment_field_names):
             segment_kwargs = {
-                name: value
-                for name, value in {
-                    cls_field.name: getattr(self, cls_field.name) for cls_field in fields(self)
-                }.items()
-                if name in segment_field_names
+                name: getattr(self, name) for name in field_names if name in parameter_names
             }
             segment_kwargs["target"] = FlightPoint()
             self.append(segment_class(**segment_kwargs))
 
         self[-1].target = self.target
 
+    def compute_from(self, start: FlightPoint) -> pd.DataFrame:
+        self._build_sequence_if_needed()
+        return super().compute_from(start)
+
+    def _compute_batch(self, starts: Sequence[FlightPoint]) -> list[tuple[pd.DataFrame, float]]:
+        self._build_sequence_if_needed()
+        return super()._compute_batch(starts)
+
+    def index(self, *args, **kwargs):
+        self._build_sequence_if_needed()
+        return super().index(*args, **kwargs)
+
+    def __len__(self):
+        self._build_sequence_if_needed()
+        return super().__len__()
+
+    def __getitem__(self, item):
+        self._build_sequence_if_needed()
+        return super().__getitem__(item)
+
+    def __iter__(self):
+        self._build_sequence_if_needed()
+        return super().__iter__()
+
+    def _build_sequence_if_needed(self):
+        if self._needs_build and not self._building:
+            self._building = True
+            try:
+                self.build_sequence()
+            finally:
+                self._needs_build = False
+                self._building = False
+
+    @classmethod
+    def _get_parameter_names(cls) -> frozenset[str]:
+        """Names of public dataclass fields that are set at instantiation."""
+        if cls not in cls._parameter_names:
+            cls._parameter_names[cls] = frozenset(
+                f.name for f in fields(cls) if f.init and not f.name.startswith("_")
+            )
+        return cls._parameter_names[cls]
+
 
 class MacroSegmentMeta(ABCMeta):
     """
@@ -124,5 +178,9 @@ class MacroSegmentMeta(ABCMeta):
 
         cls = super().__new__(mcs, cls_name, (MacroSegmentBase, base_cls, *bases), attrs)
         cls.cls_sequence = cls_sequence
+        cls._segment_field_names = [
+            frozenset(f.name for f in fields(segment_class) if not f.name.startswith("_"))
+            for segment_class in cls_sequence
+        ]
 
         return cls
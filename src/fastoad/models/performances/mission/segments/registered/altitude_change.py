@@ -233,11 +233,6 @@ class AltitudeChangeSegment(BaseAltitudeChange, AbstractManualThrustSegment):
         gamma = (flight_point.thrust - flight_point.drag) / flight_point.mass / g
         return gamma, 0.0
 
-    def compute_from_start_to_target(self, start: FlightPoint, target: FlightPoint) -> pd.DataFrame:
-        self._handle_target_settings(target, start)
-
-        return super().compute_from_start_to_target(start, target)
-
 
 @RegisterSegment("regulated_altitude_change")
 @dataclass
@@ -266,9 +261,6 @@ class RegulatedAltitudeChangeSegment(BaseAltitudeChange, AbstractRegulatedThrust
         return super().compute_from(start)
 
     def compute_from_start_to_target(self, start: FlightPoint, target: FlightPoint) -> pd.DataFrame:
-
-        self._handle_target_settings(target, start)
-
         # Compute the segment with no limitation on thrust_rate
         flight_points = super().compute_from_start_to_target(start, target)
 
@@ -15,6 +15,7 @@
 import logging
 from copy import deepcopy
 from dataclasses import dataclass
+from typing import ClassVar
 
 import numpy as np
 import pandas as pd
@@ -75,6 +76,11 @@ class CruiseSegment(AbstractRegulatedThrustSegment, AbstractLiftFromWeightSegmen
         current = flight_points[-1]
         return target.ground_distance - current.ground_distance
 
+    def _get_quasi_steady_duration(self, start: FlightPoint, target: FlightPoint) -> float | None:
+        if not start.true_airspeed:
+            return None
+        return (target.ground_distance - start.ground_distance) / start.true_airspeed
+
 
 @RegisterSegment("optimal_cruise")
 @dataclass
@@ -149,6 +155,10 @@ class OptimalCruiseSegment(CruiseSegment):
         self.complete_flight_point(start)
         return super().compute_from_start_to_target(start, target)
 
+    def _get_quasi_steady_duration(self, start: FlightPoint, target: FlightPoint) -> None:
+        # Altitude changes along with mass.
+        return None
+
     def _compute_next_altitude(self, next_point: FlightPoint, previous_point: FlightPoint):
         optimal_altitude = self._get_optimal_altitude(
             next_point.mass, previous_point.mach, altitude_guess=previous_point.altitude
@@ -208,7 +218,13 @@ class ClimbAndCruiseSegment(CruiseSegment):
     #: The maximum allowed flight level (i.e. multiple of 100 feet).
     maximum_flight_level: float = 500.0
 
-    def compute_from_start_to_target(self, start: FlightPoint, target: FlightPoint) -> pd.DataFrame:  # noqa: PLR0912
+    #: Number of integration steps for estimating cruise fuel consumption at a flight level.
+    _ESTIMATE_STEP_COUNT: ClassVar[int] = 4
+
+    #: Number of explored flight levels above the best estimated one.
+    _FLIGHT_LEVEL_PATIENCE: ClassVar[int] = 2
+
+    def compute_from_start_to_target(self, start: FlightPoint, target: FlightPoint) -> pd.DataFrame:
         if self.climb_segment is not None:
             attr_dict = {
                 key: val
@@ -230,6 +246,11 @@ class ClimbAndCruiseSegment(CruiseSegment):
             polar=self.polar,
             name=self.name,
             engine_setting=self.engine_setting,
+            integration_method=self.integration_method,
+            rtol=self.rtol,
+            atol=self.atol,
+            minimum_time_step=self.minimum_time_step,
+            maximum_time_step=self.maximum_time_step,
         )
 
         if self.target.altitude == AltitudeChangeSegment.OPTIMAL_FLIGHT_LEVEL:
@@ -247,33 +268,9 @@ class ClimbAndCruiseSegment(CruiseSegment):
                 return super().compute_from_start_to_target(start, target)
             cruise_segment.target.altitude = None
 
-            # Go to the next flight level, or keep altitude if already at a flight level
-            cruise_altitude = get_closest_flight_level(start.altitude - 1.0e-3)
-            results = self._climb_to_altitude_and_cruise(
-                start, cruise_altitude, climb_segment, cruise_segment
+            results = self._climb_to_optimal_flight_level_and_cruise(
+                start, climb_segment, cruise_segment
             )
-            mass_loss = start.mass - results.mass.iloc[-1]
-
-            go_to_next_level = True
-
-            while go_to_next_level:
-                old_mass_loss = mass_loss
-                cruise_altitude = get_closest_flight_level(cruise_altitude + 1.0e-3)
-                if cruise_altitude > self.maximum_flight_level * 100.0 * foot:
-                    break
-                if self.maximum_CL is not None and self.is_next_flight_level_exceeding_maximum_cl(
-                    cruise_altitude, start
-                ):
-                    break
-
-                new_results = self._climb_to_altitude_and_cruise(
-                    start, cruise_altitude, climb_segment, cruise_segment
-                )
-                mass_loss = start.mass - new_results.mass.iloc[-1]
-
-                go_to_next_level = mass_loss < old_mass_loss
-                if go_to_next_level:
-                    results = new_results
 
         elif target.altitude is not None and isinstance(target.altitude, (int, float)):
             if climb_segment is None:
@@ -303,22 +300,205 @@ class ClimbAndCruiseSegment(CruiseSegment):
             )
         return results
 
+    def _climb_to_optimal_flight_level_and_cruise(
+        self,
+        start: FlightPoint,
+        climb_segment: AltitudeChangeSegment,
+        cruise_segment: CruiseSegment,
+    ) -> pd.DataFrame:
+        """
+        Climbs up to the flight level that ensures minimum mass decrease, and cruise, while
+        ensuring final ground_distance is equal to self.target.ground_distance.
+
+        Flight levels are explored upward. The climb to a flight level is computed from the
+        end of the climb to the previous flight level. The mass decrease for each flight level
+        is estimated by integrating fuel consumption over cruise distance with a few large
+        steps. Exploration stops when the estimate has not improved for
+        :attr:`_FLIGHT_LEVEL_PATIENCE` flight levels.
+
+        Cruise is then actually computed from the best flight level according to this estimate,
+        and from its neighbors, until the actual final mass stops improving.
+
+        :param start:
+        :param climb_segment:
+        :param cruise_segment:
+        :return: flight points of climb and cruise at optimal flight level
+        """
+        # Go to the next flight level, or keep altitude if already at a flight level
+        cruise_altitude = get_closest_flight_level(start.altitude - 1.0e-3)
+        climb_points = self._climb_to_altitude(
+            start, cruise_altitude, climb_segment, cruise_segment
+        )
+
+        climb_points_by_level = []
+        estimated_mass_losses = []
+        while True:
+            climb_points_by_level.append(climb_points)
+            estimated_mass_losses.append(
+                self._estimate_mass_loss(start, climb_points, cruise_segment)
+            )
+            if estimated_mass_losses[-1] is None:
+                # Estimation is not possible, all flight levels are actually computed.
+                return self._climb_to_best_flight_level_and_cruise(
+                    start, climb_segment, cruise_segment
+                )
+            best_index = int(np.argmin(estimated_mass_losses))
+            if len(estimated_mass_losses) - 1 - best_index >= self._FLIGHT_LEVEL_PATIENCE:
+                break
+
+            next_altitude = get_closest_flight_level(cruise_altitude + 1.0e-3)
+            if next_altitude > self.maximum_flight_level * 100.0 * foot:
+                break
+            if self.maximum_CL is not None and self.is_next_flight_level_exceeding_maximum_cl(
+                next_altitude, start
+            ):
+                break
+
+            next_climb_points = self._climb_to_altitude(
+                FlightPoint.create(climb_points.iloc[-1]),
+                next_altitude,
+                climb_segment,
+                cruise_segment,
+            )
+            climb_points = pd.concat([climb_points, next_climb_points.iloc[1:]]).reset_index(
+                drop=True
+            )
+            cruise_altitude = next_altitude
+
+        # Best candidate according to estimation is confirmed by actual computation.
+        results_by_level = {
+            best_index: self._cruise_after_climb(climb_points_by_level[best_index], cruise_segment)
+        }
+        for step in (1, -1):
+            while 0 <= best_index + step < len(climb_points_by_level):
+                index = best_index + step
+                if index not in results_by_level:
+                    results_by_level[index] = self._cruise_after_climb(
+                        climb_points_by_level[index], cruise_segment
+                    )
+                if (
+                    results_by_level[index].mass.iloc[-1]
+                    <= results_by_level[best_index].mass.iloc[-1]
+                ):
+                    break
+                best_index = index
+
+        return results_by_level[best_index]
+
+    def _climb_to_best_flight_level_and_cruise(
+        self,
+        start: FlightPoint,
+        climb_segment: AltitudeChangeSegment,
+        cruise_segment: CruiseSegment,
+    ) -> pd.DataFrame:
+        """
+        Climbs up to the flight level that ensures minimum mass decrease, and cruise, while
+        ensuring final ground_distance is equal to self.target.ground_distance.
+
+        Climb and cruise are fully computed for each explored flight level.
+
+        :param start:
+        :param climb_segment:
+        :param cruise_segment:
+        :return: flight points of climb and cruise at optimal flight level
+        """
+        cruise_altitude = get_closest_flight_level(start.altitude - 1.0e-3)
+        results = self._climb_to_altitude_and_cruise(
+            start, cruise_altitude, climb_segment, cruise_segment
+        )
+        mass_loss = start.mass - results.mass.iloc[-1]
+
+        go_to_next_level = True
+
+        while go_to_next_level:
+            old_mass_loss = mass_loss
+            cruise_altitude = get_closest_flight_level(cruise_altitude + 1.0e-3)
+            if cruise_altitude > self.maximum_flight_level * 100.0 * foot:
+                break
+            if self.maximum_CL is not None and self.is_next_flight_level_exceeding_maximum_cl(
+                cruise_altitude, start
+            ):
+                break
+
+            new_results = self._climb_to_altitude_and_cruise(
+                start, cruise_altitude, climb_segment, cruise_segment
+            )
+            mass_loss = start.mass - new_results.mass.iloc[-1]
+
+            go_to_next_level = mass_loss < old_mass_loss
+            if go_to_next_level:
+                results = new_results
+
+        return results
+
+    @classmethod
+    def _estimate_mass_loss(
+        cls, start: FlightPoint, climb_points: pd.DataFrame, cruise_segment: CruiseSegment
+    ) -> float | None:
+        """
+        Estimates mass decrease for climb and cruise, using actual climb and a Runge-Kutta
+        integration of fuel consumption over cruise distance, with
+        :attr:`_ESTIMATE_STEP_COUNT` steps.
+
+        :param start:
+        :param climb_points:
+        :param cruise_segment:
+        :return: the estimated mass loss, or None if fuel consumption cannot be computed
+                 (e.g. without fuel consumption)
+        """
+        cruise_start = FlightPoint.create(climb_points.iloc[-1])
+        cruise_start.scalarize()
+        cruise_distance = cruise_segment.target.ground_distance - cruise_start.ground_distance
+        step = cruise_distance / cls._ESTIMATE_STEP_COUNT
+
+        mass = cruise_start.mass
+        if not cls._get_mass_rate(cruise_start, mass, cruise_segment) > 0.0:
+            return None
+
+        for _ in range(cls._ESTIMATE_STEP_COUNT):
+            k1 = cls._get_mass_rate(cruise_start, mass, cruise_segment)
+            k2 = cls._get_mass_rate(cruise_start, mass - 0.5 * step * k1, cruise_segment)
+            k3 = cls._get_mass_rate(cruise_start, mass - 0.5 * step * k2, cruise_segment)
+            k4 = cls._get_mass_rate(cruise_start, mass - step * k3, cruise_segment)
+            mass -= step / 6.0 * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+
+        if not np.isfinite(mass):
+            return None
+
+        return start.mass - mass
+
     @staticmethod
-    def _climb_to_altitude_and_cruise(
+    def _get_mass_rate(
+        cruise_start: FlightPoint, mass: float, cruise_segment: CruiseSegment
+    ) -> float:
+        """
+        :param cruise_start: the start point of cruise
+        :param mass: the mass at which fuel consumption is computed
+        :param cruise_segment:
+        :return: the mass decrease per meter in cruise conditions, for provided mass
+        """
+        flight_point = cruise_start.copy()
+        flight_point.mass = mass
+        cruise_segment.complete_flight_point(flight_point)
+        if not flight_point.sfc:
+            return 0.0
+        return flight_point.sfc * flight_point.thrust / flight_point.true_airspeed
+
+    @staticmethod
+    def _climb_to_altitude(
         start: FlightPoint,
         cruise_altitude: float,
         climb_segment: AltitudeChangeSegment,
         cruise_segment: CruiseSegment,
-    ):
+    ) -> pd.DataFrame:
         """
-        Climbs up to cruise_altitude and cruise, while ensuring final ground_distance is
-        equal to self.target.ground_distance.
+        Climbs up to cruise_altitude, with speed settings of cruise segment.
 
         :param start:
         :param cruise_altitude:
         :param climb_segment:
         :param cruise_segment:
-        :return:
+        :return: flight points of climb
         """
         climb_segment.target = FlightPoint(
             altitude=cruise_altitude,
@@ -326,13 +506,43 @@ class ClimbAndCruiseSegment(CruiseSegment):
             true_airspeed=cruise_segment.target.true_airspeed,
             equivalent_airspeed=cruise_segment.target.equivalent_airspeed,
         )
-        climb_points = climb_segment.compute_from(start)
+        return climb_segment.compute_from(start)
 
+    @staticmethod
+    def _cruise_after_climb(
+        climb_points: pd.DataFrame, cruise_segment: CruiseSegment
+    ) -> pd.DataFrame:
+        """
+        :param climb_points:
+        :param cruise_segment:
+        :return: flight points of climb, followed by flight points of cruise
+        """
         cruise_start = FlightPoint.create(climb_points.iloc[-1])
         cruise_points = cruise_segment.compute_from(cruise_start)
 
         return pd.concat([climb_points, cruise_points]).reset_index(drop=True)
 
+    @classmethod
+    def _climb_to_altitude_and_cruise(
+        cls,
+        start: FlightPoint,
+        cruise_altitude: float,
+        climb_segment: AltitudeChangeSegment,
+        cruise_segment: CruiseSegment,
+    ):
+        """
+        Climbs up to cruise_altitude and cruise, while ensuring final ground_distance is
+        equal to self.target.ground_distance.
+
+        :param start:
+        :param cruise_altitude:
+        :param climb_segment:
+        :param cruise_segment:
+        :return:
+        """
+        climb_points = cls._climb_to_altitude(start, cruise_altitude, climb_segment, cruise_segment)
+        return cls._cruise_after_climb(climb_points, cruise_segment)
+
     def is_next_flight_level_exceeding_maximum_cl(
         self, altitude_next_flight_level: float, flight_point: FlightPoint
     ) -> bool:
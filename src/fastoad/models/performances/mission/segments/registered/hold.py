@@ -14,6 +14,7 @@
 
 from dataclasses import dataclass
 
+from fastoad.model_base import FlightPoint
 from fastoad.models.performances.mission.segments.base import (
     RegisterSegment,
 )
@@ -39,3 +40,6 @@ class HoldSegment(
     """
 
     slope_angle: float = 0.0
+
+    def _get_quasi_steady_duration(self, start: FlightPoint, target: FlightPoint) -> float:
+        return target.time - start.time
@@ -54,7 +54,7 @@ class RotationSegment(AbstractGroundSegment):
         # compute lift, including thrust projection, compare with weight
         current = flight_points[-1]
 
-        atm = self._get_atmosphere_point(current.altitude)
+        atm = self._get_atmosphere_state(current.altitude)
         airspeed = current.true_airspeed
         mass = current.mass
         alpha = current.alpha
@@ -48,6 +48,9 @@ class TaxiSegment(
     def get_gamma_and_acceleration(self, flight_point: FlightPoint) -> tuple[float, float]:
         return 0.0, 0.0
 
+    def _get_quasi_steady_duration(self, start: FlightPoint, target: FlightPoint) -> float:
+        return target.time - start.time
+
     def compute_from_start_to_target(self, start: FlightPoint, target: FlightPoint) -> pd.DataFrame:
         start.mach = None
         start.equivalent_airspeed = None
@@ -158,7 +158,7 @@ def test_climb_optimal_altitude_at_fixed_TAS(polar):
 
         last_point = flight_points.iloc[-1]
         # Note: reference values are obtained by running the process with 0.01s as time step
-        assert_allclose(last_point.altitude, 10085.0, atol=0.1)
+        assert_allclose(last_point.altitude, 10085.5, atol=0.1)
         assert_allclose(last_point.true_airspeed, 250.0)
         assert_allclose(last_point.time, 84.1, rtol=1e-2)
         assert_allclose(last_point.mach, 0.8359, rtol=1e-4)
@@ -826,3 +826,55 @@ def test_descent_to_fixed_EAS_at_constant_mach(polar):
 
     # A second call is done to ensure first run did not modify anything (like target definition)
     run()
+
+
+def test_climb_batch(polar):
+    propulsion = FuelEngineSet(DummyEngine(1.0e5, 1.0e-5), 2)
+
+    segment = AltitudeChangeSegment(
+        target=FlightPoint(altitude=AltitudeChangeSegment.OPTIMAL_ALTITUDE, mach="constant"),
+        propulsion=propulsion,
+        reference_area=120.0,
+        polar=polar,
+        thrust_rate=1.0,
+    )
+    starts = [
+        FlightPoint(altitude=5000.0, mass=mass, mach=mach)
+        for mass, mach in [(60000.0, 0.78), (70000.0, 0.78), (80000.0, 0.7)]
+    ]
+
+    batch_flight_points = segment.compute_batch_from(starts)
+
+    assert len(batch_flight_points) == len(starts)
+    for start, flight_points in zip(starts, batch_flight_points):
+        expected_flight_points = segment.compute_from(start)
+        assert len(flight_points) == len(expected_flight_points)
+        for name in ["time", "altitude", "mass", "ground_distance", "mach", "CL", "thrust"]:
+            assert_allclose(flight_points[name], expected_flight_points[name], rtol=1.0e-10)
+
+
+def test_climb_batch_with_start_above_optimal_altitude(polar):
+    propulsion = FuelEngineSet(DummyEngine(1.0e5, 1.0e-5), 2)
+
+    segment = AltitudeChangeSegment(
+        target=FlightPoint(altitude=AltitudeChangeSegment.OPTIMAL_ALTITUDE, mach="constant"),
+        propulsion=propulsion,
+        reference_area=120.0,
+        polar=polar,
+        thrust_rate=1.0,
+    )
+    # Settings of the first start point, which is above optimal altitude, must not be affected
+    # by the ones of the last start point, which is below optimal altitude.
+    starts = [
+        FlightPoint(altitude=12000.0, mass=60000.0, mach=0.78),
+        FlightPoint(altitude=5000.0, mass=70000.0, mach=0.78),
+    ]
+
+    batch_flight_points = segment.compute_batch_from(starts)
+
+    for start, flight_points in zip(starts, batch_flight_points):
+        segment.interrupt_if_getting_further_from_target = True
+        expected_flight_points = segment.compute_from(start)
+        assert len(flight_points) == len(expected_flight_points)
+        for name in ["time", "altitude", "mass", "ground_distance", "mach", "CL", "thrust"]:
+            assert_allclose(flight_points[name], expected_flight_points[name], rtol=1.0e-10)
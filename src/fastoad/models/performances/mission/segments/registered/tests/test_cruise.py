@@ -13,6 +13,7 @@
 
 import logging
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from numpy.testing import assert_allclose
@@ -69,6 +70,72 @@ def test_cruise_at_constant_altitude(polar):
     run()
 
 
+def test_cruise_at_constant_altitude_with_adaptive_time_step(polar):
+    propulsion = FuelEngineSet(DummyEngine(0.5e5, 1.0e-5), 2)
+
+    segment = CruiseSegment(
+        target=FlightPoint(ground_distance=5.0e5),
+        propulsion=propulsion,
+        reference_area=120.0,
+        polar=polar,
+        engine_setting=EngineSetting.CRUISE,  # The engine model does not use this setting
+        time_step=10.0,
+        integration_method="adaptive",
+    )
+
+    def run():
+        flight_points = segment.compute_from(
+            FlightPoint(mass=70000.0, altitude=10000.0, mach=0.78, ground_distance=1000.0)
+        )
+
+        last_point = flight_points.iloc[-1]
+        # Same reference values as with fixed time step
+        assert_allclose(last_point.ground_distance, 501000.0)
+        assert_allclose(last_point.altitude, 10000.0)
+        assert_allclose(last_point.time, 2141.0, rtol=1e-2)
+        assert_allclose(last_point.true_airspeed, 233.6, atol=0.1)
+        assert_allclose(last_point.mass, 69568.0, rtol=1e-4)
+
+        # Time step quickly grows up to maximum time step, so only few points are computed.
+        assert len(flight_points) < 15
+        assert_allclose(flight_points.time.diff().max(), segment.maximum_time_step)
+
+    run()
+
+    # A second call is done to ensure first run did not modify anything (like target definition)
+    run()
+
+    segment.integration_method = "unknown"
+    with pytest.raises(ValueError):
+        segment.compute_from(FlightPoint(mass=70000.0, altitude=10000.0, mach=0.78))
+
+
+def test_cruise_at_constant_altitude_with_quasi_steady_integration(polar):
+    propulsion = FuelEngineSet(DummyEngine(0.5e5, 1.0e-5), 2)
+
+    segment = CruiseSegment(
+        target=FlightPoint(ground_distance=5.0e5),
+        propulsion=propulsion,
+        reference_area=120.0,
+        polar=polar,
+        engine_setting=EngineSetting.CRUISE,  # The engine model does not use this setting
+        integration_method="quasi_steady",
+    )
+
+    flight_points = segment.compute_from(
+        FlightPoint(mass=70000.0, altitude=10000.0, mach=0.78, ground_distance=1000.0)
+    )
+
+    last_point = flight_points.iloc[-1]
+    # Same reference values as with fixed time step
+    assert_allclose(last_point.ground_distance, 501000.0)
+    assert_allclose(last_point.altitude, 10000.0)
+    assert_allclose(last_point.time, 2141.0, rtol=1e-2)
+    assert_allclose(last_point.true_airspeed, 233.6, atol=0.1)
+    assert_allclose(last_point.mass, 69568.0, rtol=1e-4)
+    assert len(flight_points) < 10
+
+
 def test_breguet_cruise(polar):
     propulsion = FuelEngineSet(DummyEngine(0.5e5, 1.0e-5), 2)
 
@@ -195,6 +262,42 @@ def test_climb_and_cruise_at_optimal_flight_level(polar):
     run()
 
 
+def test_climb_and_cruise_at_optimal_flight_level_computes_few_cruises(polar):
+    propulsion = FuelEngineSet(DummyEngine(0.5e5, 3.0e-5), 2)
+    reference_area = 120.0
+
+    segment = ClimbAndCruiseSegment(
+        target=FlightPoint(
+            ground_distance=10.0e6, altitude=AltitudeChangeSegment.OPTIMAL_FLIGHT_LEVEL
+        ),
+        propulsion=propulsion,
+        reference_area=reference_area,
+        polar=polar,
+        engine_setting=EngineSetting.CRUISE,
+        climb_segment=AltitudeChangeSegment(
+            target=FlightPoint(),
+            propulsion=propulsion,
+            reference_area=reference_area,
+            polar=polar,
+            thrust_rate=0.9,
+            engine_setting=EngineSetting.CLIMB,
+        ),
+    )
+
+    with patch.object(
+        CruiseSegment, "compute_from", autospec=True, side_effect=CruiseSegment.compute_from
+    ) as compute_from:
+        flight_points = segment.compute_from(
+            FlightPoint(mass=70000.0, altitude=8000.0, mach=0.78, ground_distance=1.0e6)
+        )
+
+    # Besides the call of the ClimbAndCruiseSegment instance, cruise is fully computed only
+    # for the best estimated flight level and its neighbors.
+    assert compute_from.call_count <= 4
+    assert_allclose(flight_points.iloc[-1].ground_distance, 11.0e6)
+    assert_allclose(flight_points.iloc[-1].altitude, 9753.6)
+
+
 def test_climb_and_cruise_at_optimal_flight_level_with_unpickable(polar, tmp_path):
     # Create temporary folder containing a dummy data file
     d = tmp_path / "sub"
@@ -502,7 +605,7 @@ def test_optimal_cruise_with_maximum_altitude_cap(polar, caplog):
     )
 
     start = FlightPoint(
-        mass=70000.0, time=1000.0, ground_distance=1e5, mach=0.78, altitude=9155.649221719525
+        mass=70000.0, time=1000.0, ground_distance=1e5, mach=0.78, altitude=9156.039749097357
     )
     flight_points = segment.compute_from(start)
 
@@ -510,7 +613,7 @@ def test_optimal_cruise_with_maximum_altitude_cap(polar, caplog):
     last_point = flight_points.iloc[-1]
 
     # Should be capped at maximum_altitude
-    assert_allclose(first_point.altitude, 9155.6492)
+    assert_allclose(first_point.altitude, 9156.0397)
     assert_allclose(last_point.altitude, 9200)
     # CL should be less than optimal since we're capped by maximum altitude
     assert polar.optimal_cl > last_point.CL
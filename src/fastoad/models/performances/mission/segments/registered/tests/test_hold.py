@@ -97,3 +97,53 @@ def test_hold_with_additional_load(polar):
 
     # A second call is done to ensure first run did not modify anything (like target definition)
     run()
+
+
+def test_hold_with_adaptive_time_step(polar):
+    propulsion = FuelEngineSet(DummyEngine(0.5e5, 2.0e-5), 2)
+
+    segment = HoldSegment(
+        target=FlightPoint(time=3000.0),
+        propulsion=propulsion,
+        reference_area=120.0,
+        polar=polar,
+        integration_method="adaptive",
+        maximum_time_step=300.0,
+    )
+
+    flight_points = segment.compute_from(
+        FlightPoint(altitude=500.0, equivalent_airspeed=120.0, mass=60000.0)
+    )
+
+    last_point = flight_points.iloc[-1]
+    assert_allclose(last_point.time, 3000.0)
+    assert_allclose(last_point.altitude, 500.0)
+    assert_allclose(last_point.mass, 58986.5, rtol=1e-4)
+    assert_allclose(last_point.ground_distance, 368795.0, rtol=1.0e-3)
+    assert len(flight_points) < 20
+    assert_allclose(flight_points.time.diff().max(), 300.0)
+
+
+def test_hold_with_quasi_steady_integration(polar):
+    propulsion = FuelEngineSet(DummyEngine(0.5e5, 2.0e-5), 2)
+
+    segment = HoldSegment(
+        target=FlightPoint(time=3000.0),
+        propulsion=propulsion,
+        reference_area=120.0,
+        polar=polar,
+        integration_method="quasi_steady",
+    )
+
+    flight_points = segment.compute_from(
+        FlightPoint(altitude=500.0, equivalent_airspeed=120.0, mass=60000.0)
+    )
+
+    last_point = flight_points.iloc[-1]
+    # Same reference values as with fixed time step
+    assert_allclose(last_point.time, 3000.0)
+    assert_allclose(last_point.altitude, 500.0)
+    assert_allclose(last_point.equivalent_airspeed, 120.0, atol=0.1)
+    assert_allclose(last_point.mass, 58986.5, rtol=1e-4)
+    assert_allclose(last_point.ground_distance, 368795.0, rtol=1.0e-3)
+    assert len(flight_points) < 20
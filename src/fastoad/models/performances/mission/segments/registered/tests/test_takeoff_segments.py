@@ -12,6 +12,7 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import multiprocessing.pool
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -249,17 +250,21 @@ def test_takeoff(polar, polar_modifier):
         thrust_rate=0.0,
         time_step=0.0,
     )
-    segment_2.target = FlightPoint(altitude=12.0)
-    segment_2.propulsion = propulsion
-    segment_2.reference_area = 120.0
-    segment_2.polar = polar
-    segment_2.polar_modifier = polar_modifier
-    segment_2.engine_setting = EngineSetting.CLIMB
-    segment_2.rotation_equivalent_airspeed = 75.0
-    segment_2.rotation_rate = 0.05
-    segment_2.rotation_alpha_limit = 0.1
-    segment_2.thrust_rate = 1.0
-    segment_2.time_step = 0.2
-
-    flight_points_2 = segment_2.compute_from(start_point)
+    with patch.object(segment_2, "build_sequence", wraps=segment_2.build_sequence) as building:
+        segment_2.target = FlightPoint(altitude=12.0)
+        segment_2.propulsion = propulsion
+        segment_2.reference_area = 120.0
+        segment_2.polar = polar
+        segment_2.polar_modifier = polar_modifier
+        segment_2.engine_setting = EngineSetting.CLIMB
+        segment_2.rotation_equivalent_airspeed = 75.0
+        segment_2.rotation_rate = 0.05
+        segment_2.rotation_alpha_limit = 0.1
+        segment_2.thrust_rate = 1.0
+        segment_2.time_step = 0.2
+
+        flight_points_2 = segment_2.compute_from(start_point)
+
+    # Sequence is built only once, when it is used.
+    assert building.call_count == 1
     assert_frame_equal(flight_points_2, ref_flight_points, rtol=1e-6)
@@ -14,32 +14,69 @@
 
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass, field
+from numbers import Real
 
 import numpy as np
 import pandas as pd
 from deprecated import deprecated
 from numpy import cos, sin
 from scipy.constants import g
-from scipy.optimize import root_scalar
+from scipy.optimize import brentq, root_scalar
+from stdatm.state_parameters import GAMMA
 
 from fastoad._utils.arrays import scalarize
 from fastoad.constants import EngineSetting
-from fastoad.model_base import FlightPoint
+from fastoad.model_base import FlightPoint, FlightPointBuffer
 from fastoad.model_base.datacls import MANDATORY_FIELD
 from fastoad.model_base.propulsion import IPropulsion
 
+from .atmosphere import get_altitude_from_pressure
 from .base import AbstractFlightSegment
-from .constants import ThrustRateOutOfBound
+from .constants import IntegrationMethod, ThrustRateOutOfBound
 from ..polar import Polar
 from ..polar_modifier import AbstractPolarModifier, UnchangedPolar
 
 DEFAULT_TIME_STEP = 0.2
 MAX_SEGMENT_DURATION = 90000  # equivalent to 25h
 
+# Step size controller settings for adaptive integration
+STEP_SAFETY_FACTOR = 0.9
+MIN_STEP_FACTOR = 0.2
+MAX_STEP_FACTOR = 5.0
+
+# Tolerance on distance to target. Such accuracy is not needed, but ensures reproducibility
+# of results.
+TARGET_TOLERANCE = 1.0e-5
+
 _LOGGER = logging.getLogger(__name__)  # Logger for this module
 
 
+@dataclass
+class _SegmentIntegration:
+    """State of the time integration of a segment from one start point."""
+
+    #: Computed flight points, starting with the start point.
+    flight_points: FlightPointBuffer
+
+    #: Segment target (will not contain relative values).
+    target: FlightPoint
+
+    #: Time step for next flight point.
+    time_step: float
+
+    #: Distance to target of the last accepted flight point.
+    previous_point_to_target: float
+
+    #: True when target is reached or when computation has been interrupted.
+    is_finished: bool = False
+
+    #: Value of :attr:`~AbstractTimeStepFlightSegment.interrupt_if_getting_further_from_target`
+    #: for this start point.
+    interrupt_if_getting_further_from_target: bool = True
+
+
 @dataclass
 class AbstractTimeStepFlightSegment(
     AbstractFlightSegment,
@@ -92,6 +129,29 @@ class AbstractTimeStepFlightSegment(
     #: propulsion model.
     engine_setting: EngineSetting = EngineSetting.CLIMB
 
+    #: Time integration method, among "fixed_step", "adaptive" and "quasi_steady".
+    #: With "adaptive", :attr:`time_step` is only the initial time step. Next time steps are
+    #: adjusted so that the estimated local error complies with :attr:`rtol` and :attr:`atol`,
+    #: within :attr:`minimum_time_step` and :attr:`maximum_time_step`.
+    #: With "quasi_steady", segments at constant altitude and speed (see
+    #: :meth:`_get_quasi_steady_duration`) are integrated with time steps that are as large as
+    #: :attr:`rtol` and :attr:`atol` allow, and other segments are integrated as with
+    #: "fixed_step".
+    integration_method: str = IntegrationMethod.FIXED_STEP.value
+
+    #: Relative tolerance on local error for adaptive integration.
+    rtol: float = 1.0e-4
+
+    #: Absolute tolerance on local error for adaptive integration (applied to each integrated
+    #: quantity, in SI units).
+    atol: float = 1.0e-2
+
+    #: Minimum time step for adaptive integration, in seconds.
+    minimum_time_step: float = 0.01
+
+    #: Maximum time step for adaptive integration, in seconds.
+    maximum_time_step: float = 600.0
+
     @abstractmethod
     def get_distance_to_target(
         self, flight_points: list[FlightPoint], target: FlightPoint
@@ -168,31 +228,298 @@ class AbstractTimeStepFlightSegment(
         flight_point.scalarize()
 
     def compute_from_start_to_target(self, start: FlightPoint, target: FlightPoint) -> pd.DataFrame:
-        flight_points = [start]
-        previous_point_to_target = self.get_distance_to_target(flight_points, target)
-        tol = 1.0e-5  # Such accuracy is not needed, but ensures reproducibility of results.
-
-        while np.abs(previous_point_to_target) > tol:
-            # Check for unrealistic flight points with exceeding long flight time to avoid
-            # extremely long segment (when the progression towards the target is very slow)
-            current_point = flight_points[-1]
-            if current_point.time - start.time > MAX_SEGMENT_DURATION:
-                _LOGGER.warning(
-                    'Segment time exceeded max_time (%sh) in "%s". Computation interrupted.',
-                    int(MAX_SEGMENT_DURATION / 3600),
-                    self.name,
-                )
-                del flight_points[-1]
+        self._check_integration_method()
+        self._handle_target_settings(target, start)
+
+        if self.integration_method == IntegrationMethod.QUASI_STEADY.value:
+            duration = self._get_quasi_steady_duration(start, target)
+            if duration is not None:
+                return self._compute_quasi_steady(start, duration)
+
+        integration = self._start_integration(start, target)
+        while not integration.is_finished:
+            if self._is_duration_exceeded(integration):
                 break
 
-            self._add_new_flight_point(flight_points, self.time_step)
-            last_point_to_target = self.get_distance_to_target(flight_points, target)
+            used_time_step = integration.time_step
+            self._add_new_flight_point(integration.flight_points, used_time_step)
+            self._process_new_flight_point(integration, used_time_step)
 
-            if (
-                np.abs(last_point_to_target) > tol
-                and last_point_to_target * previous_point_to_target < 0.0
+        return integration.flight_points.to_dataframe()
+
+    def compute_batch_from(self, starts: Sequence[FlightPoint]) -> list[pd.DataFrame]:
+        """
+        Computes the flight path segment from each provided start point.
+
+        All computations are done in lockstep: at each time step, atmosphere, polar and
+        propulsion models are called once for all computations that are not finished yet,
+        with flight points that contain arrays. Each computation ends independently, as it
+        would with :meth:`compute_from`.
+
+        Subclasses that overload :meth:`compute_from` or :meth:`compute_from_start_to_target`
+        are computed one start point at a time. To keep batch computation possible,
+        preprocessing of start and target flight points should rather be done by overloading
+        :meth:`_handle_target_settings`.
+
+        :param starts: the initial flight points
+        :return: a list of pandas DataFrame instances, one per start point
+        """
+        if (
+            type(self).compute_from is not AbstractFlightSegment.compute_from
+            or type(self).compute_from_start_to_target
+            is not AbstractTimeStepFlightSegment.compute_from_start_to_target
+            or self.integration_method == IntegrationMethod.QUASI_STEADY.value
+        ):
+            return super().compute_batch_from(starts)
+
+        self._check_integration_method()
+        integrations = []
+        # _handle_target_settings() may modify this setting, depending on start point.
+        interrupt_if_getting_further_from_target = self.interrupt_if_getting_further_from_target
+        for start in starts:
+            self.interrupt_if_getting_further_from_target = interrupt_if_getting_further_from_target
+            start_copy, target_copy = self._get_start_and_target(start)
+            self._handle_target_settings(target_copy, start_copy)
+            integrations.append(self._start_integration(start_copy, target_copy))
+
+        stacked_start = None
+        active_integrations = []
+        while True:
+            running_integrations = [
+                integration
+                for integration in active_integrations or integrations
+                if not integration.is_finished and not self._is_duration_exceeded(integration)
+            ]
+            if not running_integrations:
+                break
+            if len(running_integrations) != len(active_integrations):
+                active_integrations = running_integrations
+                stacked_start = _stack_flight_points(
+                    [integration.flight_points[0] for integration in active_integrations]
+                )
+
+            time_steps = np.array([integration.time_step for integration in active_integrations])
+            previous_points = [
+                stacked_start,
+                _stack_flight_points(
+                    [integration.flight_points[-1] for integration in active_integrations]
+                ),
+            ]
+            new_point = self.compute_next_flight_point(previous_points, time_steps)
+            self.complete_flight_point(new_point)
+
+            for integration, used_time_step, new_member_point in zip(
+                active_integrations,
+                time_steps,
+                _unstack_flight_point(new_point, len(active_integrations)),
             ):
-                # Target has been exceeded. Let's look for the exact time step using root_scalar.
+                integration.flight_points.append(new_member_point)
+                self._process_new_flight_point(integration, float(used_time_step))
+
+        return [integration.flight_points.to_dataframe() for integration in integrations]
+
+    def _handle_target_settings(self, target: FlightPoint, start: FlightPoint) -> None:
+        """
+        Preprocessing of start and target flight points before time integration.
+
+        Does nothing by default. When overloading, keep in mind that in batch computation
+        (see :meth:`compute_batch_from`), this method is called for each start point before
+        any integration is done. Therefore, modified segment attributes are shared by all
+        start points, except :attr:`interrupt_if_getting_further_from_target`, which is kept
+        for each start point.
+
+        :param target: segment target (will not contain relative values), modified in place
+        :param start: segment start point, modified in place
+        """
+
+    def _get_quasi_steady_duration(self, start: FlightPoint, target: FlightPoint) -> float | None:
+        """
+        Provides the duration of the segment, if it is quasi-steady.
+
+        A segment is quasi-steady if mass is the only evolving state, i.e. altitude, speed
+        and slope angle are constant. Such segment can be computed with "quasi_steady"
+        integration method.
+
+        Returns None by default. Subclasses that are quasi-steady should overload this method.
+
+        :param start: segment start point
+        :param target: segment target (will not contain relative values)
+        :return: duration of the segment in seconds, or None if segment is not quasi-steady
+        """
+        return None
+
+    def _compute_quasi_steady(self, start: FlightPoint, duration: float) -> pd.DataFrame:
+        """
+        Computes a quasi-steady segment, where mass is the only evolving state.
+
+        Mass is integrated using Heun scheme. Computation starts with time steps as large
+        as :attr:`maximum_time_step` allows. The number of time steps is then doubled until
+        the error on final mass, estimated by Richardson extrapolation, complies with
+        :attr:`atol` and :attr:`rtol` (relative to consumed mass), or until time step gets
+        lower than :attr:`minimum_time_step`.
+
+        :param start: segment start point
+        :param duration: segment duration, as provided by :meth:`_get_quasi_steady_duration`
+        :return: a pandas DataFrame with flight points of the finest integration
+        """
+        step_count = max(1, int(np.ceil(duration / self.maximum_time_step)))
+        flight_points = self._integrate_quasi_steady(start, duration, step_count)
+
+        while duration / step_count > self.minimum_time_step:
+            step_count *= 2
+            fine_flight_points = self._integrate_quasi_steady(start, duration, step_count)
+
+            # Heun scheme is second-order accurate.
+            error = np.abs(fine_flight_points[-1].mass - flight_points[-1].mass) / 3.0
+            flight_points = fine_flight_points
+            if error <= self.atol + self.rtol * np.abs(start.mass - flight_points[-1].mass):
+                break
+
+        msg = self._check_values(flight_points[-1])
+        if msg:
+            _LOGGER.warning('%s Segment computation interrupted in "%s".', msg, self.name)
+
+        return FlightPointBuffer(flight_points).to_dataframe()
+
+    def _integrate_quasi_steady(
+        self, start: FlightPoint, duration: float, step_count: int
+    ) -> list[FlightPoint]:
+        """
+        Integrates mass with Heun scheme along a quasi-steady segment.
+
+        :param start: segment start point
+        :param duration: segment duration
+        :param step_count: number of time steps
+        :return: computed flight points, starting with start point
+        """
+        time_step = duration / step_count
+        flight_points = [start]
+        for _ in range(step_count):
+            previous = flight_points[-1]
+            consumed_mass = self.propulsion.get_consumed_mass(previous, time_step)
+            predicted = self._get_quasi_steady_point(
+                previous, time_step, previous.mass - consumed_mass
+            )
+            consumed_mass = 0.5 * (
+                consumed_mass + self.propulsion.get_consumed_mass(predicted, time_step)
+            )
+            flight_points.append(
+                self._get_quasi_steady_point(previous, time_step, previous.mass - consumed_mass)
+            )
+
+        return flight_points
+
+    def _get_quasi_steady_point(
+        self, previous: FlightPoint, time_step: float, mass: float
+    ) -> FlightPoint:
+        """
+        :param previous: flight point at beginning of time step
+        :param time_step: duration of time step
+        :param mass: mass at end of time step
+        :return: the completed flight point at end of time step
+        """
+        next_point = FlightPoint(
+            isa_offset=self.isa_offset,
+            mass=mass,
+            consumed_fuel=previous.consumed_fuel + previous.mass - mass,
+            time=previous.time + time_step,
+            ground_distance=previous.ground_distance + previous.true_airspeed * time_step,
+            altitude=previous.altitude,
+            alpha=self.get_next_alpha(previous, time_step),
+            true_airspeed=previous.true_airspeed,
+        )
+        self._increment_cumulative_quantities(next_point, previous, time_step)
+        next_point.name = self.name
+        self.complete_flight_point(next_point)
+        return next_point
+
+    def _check_integration_method(self):
+        if self.integration_method not in [member.value for member in IntegrationMethod]:
+            raise ValueError(
+                f"The value of option 'integration_method' in segment '{self.name}' is invalid. "
+                f"It must be one of {[member.value for member in IntegrationMethod]}"
+            )
+
+    def _start_integration(self, start: FlightPoint, target: FlightPoint) -> _SegmentIntegration:
+        """
+        :param start: segment start point
+        :param target: segment target (will not contain relative values)
+        :return: the integration state before first time step
+        """
+        distance_to_target = self.get_distance_to_target([start], target)
+        return _SegmentIntegration(
+            flight_points=FlightPointBuffer([start]),
+            target=target,
+            time_step=self.time_step,
+            previous_point_to_target=distance_to_target,
+            is_finished=np.abs(distance_to_target) <= TARGET_TOLERANCE,
+            interrupt_if_getting_further_from_target=self.interrupt_if_getting_further_from_target,
+        )
+
+    def _is_duration_exceeded(self, integration: _SegmentIntegration) -> bool:
+        """
+        Checks for unrealistic flight points with exceeding long flight time to avoid
+        extremely long segment (when the progression towards the target is very slow).
+
+        If so, the integration is interrupted.
+
+        :param integration: the integration state, modified in place
+        :return: True if integration is interrupted
+        """
+        flight_points = integration.flight_points
+        if flight_points[-1].time - flight_points[0].time > MAX_SEGMENT_DURATION:
+            _LOGGER.warning(
+                'Segment time exceeded max_time (%sh) in "%s". Computation interrupted.',
+                int(MAX_SEGMENT_DURATION / 3600),
+                self.name,
+            )
+            del flight_points[-1]
+            integration.is_finished = True
+        return integration.is_finished
+
+    def _process_new_flight_point(self, integration: _SegmentIntegration, used_time_step: float):
+        """
+        Processes the flight point that has just been added to the integration.
+
+        The flight point may be rejected (adaptive integration), replaced so that target is
+        reached, or removed if computation has to be interrupted.
+
+        :param integration: the integration state, modified in place
+        :param used_time_step: the time step used for computing the last flight point
+        """
+        flight_points = integration.flight_points
+        target = integration.target
+        previous_point_to_target = integration.previous_point_to_target
+        tol = TARGET_TOLERANCE
+
+        if self.integration_method == IntegrationMethod.ADAPTIVE.value:
+            error_ratio = self._get_local_error_ratio(
+                flight_points[-2], flight_points[-1], used_time_step
+            )
+            integration.time_step = self._get_next_time_step(used_time_step, error_ratio)
+            if error_ratio > 1.0 and used_time_step > self.minimum_time_step:
+                # Step is rejected and will be done again with the reduced time step.
+                del flight_points[-1]
+                return
+
+        last_point_to_target = self.get_distance_to_target(flight_points, target)
+
+        if (
+            np.abs(last_point_to_target) > tol
+            and last_point_to_target * previous_point_to_target < 0.0
+        ):
+            # Target has been exceeded. The time step that reaches the target is located
+            # on the dense output of last step, then used for computing the last point.
+            overshoot_distance = last_point_to_target
+            target_time_step = self._get_target_time_step(
+                flight_points, target, used_time_step, tol
+            )
+            del flight_points[-1]
+            self._add_new_flight_point(flight_points, target_time_step)
+
+            if np.abs(self.get_distance_to_target(flight_points, target)) > tol:
+                # The dense output is not accurate enough for the distance to target
+                # of this segment. Let's refine the time step using root_scalar.
                 def replace_last_point(time_step, last_point_to_target):
                     """
                     Replaces last point of flight_points.
@@ -214,9 +541,9 @@ class AbstractTimeStepFlightSegment(
 
                 root_results = root_scalar(
                     replace_last_point,
-                    args=(last_point_to_target,),
-                    x0=self.time_step,
-                    x1=self.time_step / 2.0,
+                    args=(overshoot_distance,),
+                    x0=target_time_step,
+                    x1=used_time_step,
                     xtol=tol / 10,
                 )
 
@@ -229,31 +556,32 @@ class AbstractTimeStepFlightSegment(
                         self.name,
                     )
 
-                last_point_to_target = self.get_distance_to_target(flight_points, target)
-
-            elif (
-                np.abs(last_point_to_target) > np.abs(previous_point_to_target)
-                # If self.target.CL is defined, it means that we look for an optimal altitude and
-                # that target altitude can move, so it would be normal to get further from target.
-                and self.interrupt_if_getting_further_from_target
-            ):
-                # We get further from target. Let's stop without this point.
-                _LOGGER.warning(
-                    'Target cannot be reached in "%s". Segment computation interrupted. '
-                    "Please review the segment settings, especially thrust_rate.",
-                    self.name,
-                )
-                del flight_points[-1]
-                break
+            last_point_to_target = self.get_distance_to_target(flight_points, target)
 
-            msg = self._check_values(flight_points[-1])
-            if msg:
-                _LOGGER.warning('%s Segment computation interrupted in "%s".', msg, self.name)
-                break
+        elif (
+            np.abs(last_point_to_target) > np.abs(previous_point_to_target)
+            # If self.target.CL is defined, it means that we look for an optimal altitude and
+            # that target altitude can move, so it would be normal to get further from target.
+            and integration.interrupt_if_getting_further_from_target
+        ):
+            # We get further from target. Let's stop without this point.
+            _LOGGER.warning(
+                'Target cannot be reached in "%s". Segment computation interrupted. '
+                "Please review the segment settings, especially thrust_rate.",
+                self.name,
+            )
+            del flight_points[-1]
+            integration.is_finished = True
+            return
 
-            previous_point_to_target = last_point_to_target
+        msg = self._check_values(flight_points[-1])
+        if msg:
+            _LOGGER.warning('%s Segment computation interrupted in "%s".', msg, self.name)
+            integration.is_finished = True
+            return
 
-        return pd.DataFrame(flight_points)  # flight_points_df
+        integration.previous_point_to_target = last_point_to_target
+        integration.is_finished = np.abs(last_point_to_target) <= tol
 
     def compute_next_flight_point(
         self, flight_points: list[FlightPoint], time_step: float
@@ -300,9 +628,11 @@ class AbstractTimeStepFlightSegment(
         """
         Fills values for `CL`, `CD`, `lift` and `drag` in provided `flight_point`.
         """
-        atm = self._get_atmosphere_point(flight_point.altitude)
+        atm = self._get_atmosphere_state(flight_point.altitude)
         reference_force = 0.5 * atm.density * flight_point.true_airspeed**2 * self.reference_area
-        if self.polar and reference_force:
+        # In batch computation, reference_force is an array. Null speed is then not expected
+        # for only some of the computed flight points.
+        if self.polar and np.any(reference_force):
             modified_polar = self.polar_modifier.modify_polar(self.polar, flight_point)
             self.compute_lift(flight_point, reference_force, modified_polar)
             flight_point.CD = modified_polar.cd(flight_point.CL)
@@ -339,6 +669,159 @@ class AbstractTimeStepFlightSegment(
         self.complete_flight_point(new_point)
         flight_points.append(new_point)
 
+    def _get_target_time_step(
+        self,
+        flight_points: list[FlightPoint],
+        target: FlightPoint,
+        time_step: float,
+        tol: float,
+    ) -> float:
+        """
+        Locates the time, within the last step, where the target is reached.
+
+        The location is done on the dense output of the last step, i.e. on flight points that
+        are interpolated between the two last flight points. Therefore, no additional call to
+        the propulsion model is needed.
+
+        The explicit Euler scheme makes integrated quantities vary linearly along a step, so
+        the interpolation is linear: a flight point computed with the located time step will
+        match the interpolated one for these quantities.
+
+        :param flight_points: list of all currently computed flight points. Target is assumed
+                              to be between the two last ones. This list is left unchanged.
+        :param target: segment target
+        :param time_step: the time step used for computing the last flight point
+        :param tol: tolerance on the distance to target
+        :return: the time step that reaches the target, from the second-to-last flight point
+        """
+        previous_point = flight_points[-2]
+        last_point = flight_points[-1]
+
+        def distance_to_target(ratio):
+            flight_points[-1] = self._interpolate_flight_points(previous_point, last_point, ratio)
+            return self.get_distance_to_target(flight_points, target)
+
+        try:
+            ratio = brentq(distance_to_target, 0.0, 1.0, xtol=tol / 10 / time_step)
+        except ValueError:
+            # No sign change in interpolated distance to target. Next refinement
+            # will rely on the real last point.
+            ratio = 1.0
+        finally:
+            flight_points[-1] = last_point
+
+        return ratio * time_step
+
+    @staticmethod
+    def _interpolate_flight_points(
+        point_1: FlightPoint, point_2: FlightPoint, ratio: float
+    ) -> FlightPoint:
+        """
+        Linear interpolation between two flight points.
+
+        Non-numerical fields get the value of `point_2`.
+
+        :param point_1: flight point for ratio == 0.
+        :param point_2: flight point for ratio == 1.
+        :param ratio:
+        :return: the interpolated flight point
+        """
+        values = {}
+        for name in FlightPoint.get_field_names():
+            value_1 = getattr(point_1, name)
+            value_2 = getattr(point_2, name)
+            if (
+                isinstance(value_1, Real)
+                and isinstance(value_2, Real)
+                and not isinstance(value_2, bool)
+            ):
+                values[name] = value_1 + ratio * (value_2 - value_1)
+            else:
+                values[name] = value_2
+
+        return FlightPoint(**values)
+
+    def _get_local_error_ratio(
+        self, previous_point: FlightPoint, next_point: FlightPoint, time_step: float
+    ) -> float:
+        """
+        Estimates local error of the step between provided flight points.
+
+        The estimate is the difference between the explicit Euler step (actually computed) and
+        the Heun step, that uses the mean of time derivatives at both ends of the step. Since
+        time derivatives at the new point are needed anyway for the next step, this estimate
+        does not need any additional call to the propulsion model.
+
+        :param previous_point: flight point at beginning of step
+        :param next_point: flight point at end of step
+        :param time_step: duration of the step
+        :return: root mean square of local errors divided by their respective tolerance. A value
+                 lower than 1.0 means the step is accurate enough.
+        """
+        previous_values, previous_rates = self._get_integrated_values_and_rates(
+            previous_point, time_step
+        )
+        next_values, next_rates = self._get_integrated_values_and_rates(next_point, time_step)
+
+        local_errors = 0.5 * time_step * np.abs(next_rates - previous_rates)
+        scale = self.atol + self.rtol * np.maximum(np.abs(previous_values), np.abs(next_values))
+        return float(np.sqrt(np.mean((local_errors / scale) ** 2)))
+
+    def _get_integrated_values_and_rates(
+        self, flight_point: FlightPoint, time_step: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Provides the quantities that are integrated along time, and their time derivatives.
+
+        :param flight_point: a completed flight point
+        :param time_step: used for getting fuel flow from the propulsion model
+        :return: arrays of values for mass, ground distance, altitude, true airspeed and slope
+                 angle, and array of their time derivatives
+        """
+        true_airspeed = flight_point.true_airspeed
+        slope_angle = flight_point.slope_angle or 0.0
+        fuel_flow = self.propulsion.get_consumed_mass(flight_point, time_step) / time_step
+
+        values = np.array(
+            [
+                flight_point.mass,
+                flight_point.ground_distance,
+                flight_point.altitude,
+                true_airspeed,
+                slope_angle,
+            ],
+            dtype=float,
+        )
+        rates = np.array(
+            [
+                -fuel_flow,
+                true_airspeed * np.cos(slope_angle),
+                true_airspeed * np.sin(slope_angle),
+                flight_point.acceleration or 0.0,
+                flight_point.slope_angle_derivative or 0.0,
+            ],
+            dtype=float,
+        )
+        return values, rates
+
+    def _get_next_time_step(self, time_step: float, error_ratio: float) -> float:
+        """
+        Computes time step for next iteration of adaptive integration.
+
+        :param time_step: last used time step
+        :param error_ratio: as provided by :meth:`_get_local_error_ratio`
+        :return: the new time step, within :attr:`minimum_time_step` and
+                 :attr:`maximum_time_step`
+        """
+        if error_ratio > 0.0:
+            # Local error of explicit Euler is in time_step**2
+            factor = STEP_SAFETY_FACTOR * error_ratio**-0.5
+            factor = min(MAX_STEP_FACTOR, max(MIN_STEP_FACTOR, factor))
+        else:
+            factor = MAX_STEP_FACTOR
+
+        return min(self.maximum_time_step, max(self.minimum_time_step, time_step * factor))
+
     @staticmethod
     def _compute_next_altitude(next_point: FlightPoint, previous_point: FlightPoint):
         time_step = next_point.time - previous_point.time
@@ -353,49 +836,31 @@ class AbstractTimeStepFlightSegment(
         """
         Computes optimal altitude for provided mass and Mach number.
 
+        At given Mach number, dynamic pressure is proportional to static pressure, so optimal
+        altitude is obtained by inverting the pressure model, without any iteration.
+
         :param mass:
         :param mach:
+        :param altitude_guess: not used anymore, kept for compatibility
         :return: altitude that matches optimal CL
         """
+        if self.maximum_CL is not None:
+            CL_optimal = min(self.polar.optimal_cl, self.maximum_CL)
+        else:
+            CL_optimal = self.polar.optimal_cl
 
-        if altitude_guess is None:
-            altitude_guess = 10000.0
-
-        def distance_to_optimum(altitude):
-            atm = self._get_atmosphere_point(altitude)
-            true_airspeed = mach * atm.speed_of_sound
-            if self.maximum_CL is not None:
-                CL_optimal = min(self.polar.optimal_cl, self.maximum_CL)
-            else:
-                CL_optimal = self.polar.optimal_cl
-            optimal_air_density = (
-                2.0 * mass * g / (self.reference_area * true_airspeed**2 * CL_optimal)
-            )
-            return scalarize((atm.density - optimal_air_density) * 100.0)
+        # Lift = 0.5 * density * TAS**2 * S * CL = 0.5 * GAMMA * pressure * mach**2 * S * CL
+        optimal_pressure = 2.0 * mass * g / (GAMMA * mach**2 * self.reference_area * CL_optimal)
 
-        return scalarize(
-            root_scalar(  # optimal_altitude
-                distance_to_optimum, x0=altitude_guess, x1=altitude_guess - 1000.0
-            ).root
-        )
+        return scalarize(get_altitude_from_pressure(scalarize(optimal_pressure)))
 
     @staticmethod
     def _increment_cumulative_quantities(
         next_point: FlightPoint, previous_point: FlightPoint, time_step
     ):
-        for (
-            integrable_field,
-            integrand_field,
-        ) in FlightPoint.get_time_integrable_quantities().items():
-            if integrand_field:  # To avoid incrementing default cumulative quantity
-                setattr(
-                    next_point,
-                    integrable_field,
-                    getattr(previous_point, integrable_field)
-                    + getattr(previous_point, integrand_field) * time_step,
-                )
-                # If the phenomena that needs to be incremented has a different time constant, this
-                # could cause some issues
+        # If the phenomena that needs to be incremented has a different time constant, this
+        # could cause some issues
+        FlightPoint.get_time_integration_table().integrate(next_point, previous_point, time_step)
 
 
 @dataclass
@@ -565,3 +1030,53 @@ class FlightSegment(AbstractTimeStepFlightSegment, ABC):
     implement abstract methods :meth:`get_get_distance_to_target`,
     :meth:`get_gamma_and_acceleration` and :meth:`compute_propulsion`.
     """
+
+
+def _stack_flight_points(flight_points: Sequence[FlightPoint]) -> FlightPoint:
+    """
+    Gathers provided flight points in one flight point for batch computation.
+
+    Field values that are the same for all flight points are kept as is. Other ones are
+    stored in arrays.
+
+    :param flight_points:
+    :return: a flight point where some fields may be arrays
+    """
+    values = {}
+    for name in FlightPoint.get_field_names():
+        field_values = [getattr(flight_point, name) for flight_point in flight_points]
+        first_value = field_values[0]
+        if all(value == first_value for value in field_values[1:]):
+            values[name] = first_value
+        else:
+            try:
+                values[name] = np.array(field_values, dtype=float)
+            except (TypeError, ValueError):
+                values[name] = np.array(field_values, dtype=object)
+
+    return FlightPoint(**values)
+
+
+def _unstack_flight_point(flight_point: FlightPoint, count: int) -> list[FlightPoint]:
+    """
+    Splits a flight point from batch computation in scalar flight points.
+
+    :param flight_point: a flight point where some fields may be arrays of size `count`
+    :param count: the number of flight points in the batch
+    :return: the list of scalar flight points
+    """
+    values = {name: getattr(flight_point, name) for name in FlightPoint.get_field_names()}
+    flight_points = []
+    for i in range(count):
+        member_point = FlightPoint(
+            **{
+                name: value[i]
+                if isinstance(value, np.ndarray) and value.shape == (count,)
+                else value
+                for name, value in values.items()
+            }
+        )
+        member_point.scalarize()
+        flight_points.append(member_point)
+
+    return flight_points
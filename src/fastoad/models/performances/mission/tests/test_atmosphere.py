@@ -0,0 +1,63 @@
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from stdatm import AtmosphereSI
+from stdatm.state_parameters import TROPOPAUSE
+
+from fastoad.models.performances.mission.segments.atmosphere import (
+    get_altitude_from_pressure,
+    get_atmosphere_state,
+    get_speed_values,
+)
+
+
+@pytest.mark.parametrize("altitude", [0.0, 3000.0, 11000.0, 12500.5])
+@pytest.mark.parametrize("isa_offset", [0.0, 15.0])
+def test_atmosphere_state(altitude, isa_offset):
+    atm = AtmosphereSI(altitude, isa_offset)
+    state = get_atmosphere_state(altitude, isa_offset)
+
+    # Results are expected to be exactly the same as with AtmosphereSI
+    assert state.temperature == atm.temperature
+    assert state.pressure == atm.pressure
+    assert state.density == atm.density
+    assert state.speed_of_sound == atm.speed_of_sound
+    assert get_atmosphere_state(altitude, isa_offset) is state
+
+    for speed_name, value in [
+        ("true_airspeed", 250.0),
+        ("mach", 0.78),
+        ("equivalent_airspeed", 150.0),
+    ]:
+        atm = AtmosphereSI(altitude, isa_offset)
+        setattr(atm, speed_name, value)
+        speeds = get_speed_values(state, **{speed_name: value})
+        assert speeds.true_airspeed == atm.true_airspeed
+        assert speeds.mach == atm.mach
+        assert speeds.equivalent_airspeed == atm.equivalent_airspeed
+        assert speeds.calibrated_airspeed == atm.calibrated_airspeed
+
+
+@pytest.mark.parametrize("isa_offset", [0.0, 15.0])
+def test_get_altitude_from_pressure(isa_offset):
+    # Altitudes cover troposphere and stratosphere, with a refined sampling around tropopause.
+    altitudes = np.concatenate(
+        [np.linspace(-1000.0, 20000.0, 2101), TROPOPAUSE + np.linspace(-1.0, 1.0, 201)]
+    )
+    pressures = AtmosphereSI(altitudes, isa_offset).pressure
+
+    computed_altitudes = [get_altitude_from_pressure(float(pressure)) for pressure in pressures]
+    assert_allclose(computed_altitudes, altitudes, rtol=0.0, atol=1.0e-6)
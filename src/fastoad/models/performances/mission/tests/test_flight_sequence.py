@@ -12,6 +12,8 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 
+import numpy as np
+import pandas as pd
 import pytest
 from numpy.testing import assert_allclose
 
@@ -105,3 +107,81 @@ def test_nested_flight_sequence_with_target_mass(propulsion, taxi_consumption):
     assert_allclose(flight_points.mass.iloc[0] - flight_points.mass.iloc[-1], taxi_consumption * 5)
     assert_allclose(flight_points.mass.iloc[-1], 70000.0 - taxi_consumption * 2)
     assert_allclose(sequence.consumed_mass_before_input_weight, taxi_consumption * 3)
+
+
+def test_nested_flight_sequence_batch(propulsion):
+    sequence = FlightSequence()
+    sequence.extend(get_nested_flight_sequence_with_target_mass(propulsion))
+    starts = [FlightPoint(altitude=0.0, mass=mass) for mass in [50000.0, 60000.0]]
+
+    batch_flight_points = sequence.compute_batch_from(starts)
+
+    assert len(batch_flight_points) == len(starts)
+    for start, flight_points in zip(starts, batch_flight_points):
+        expected_flight_points = sequence.compute_from(start)
+        assert_allclose(flight_points.mass, expected_flight_points.mass)
+        assert_allclose(flight_points.time, expected_flight_points.time)
+
+
+def test_nested_flight_sequence_iteration(propulsion, taxi_consumption):
+    sequence = get_nested_flight_sequence_without_target_mass(propulsion)
+    start = FlightPoint(altitude=0.0, mass=50000.0)
+
+    segment_flight_points = list(sequence.iter_compute_from(start))
+    assert len(segment_flight_points) == 5
+    for flight_points in segment_flight_points:
+        assert_allclose(flight_points.mass.iloc[0] - flight_points.mass.iloc[-1], taxi_consumption)
+    assert_allclose(segment_flight_points[-1].mass.iloc[-1], 50000.0 - taxi_consumption * 5)
+
+    # Iteration can be stopped as soon as a condition is met.
+    segment_count = 0
+    for flight_points in sequence.iter_compute_from(start):
+        segment_count += 1
+        if flight_points.mass.iloc[-1] < 50000.0 - taxi_consumption * 1.5:
+            break
+    assert segment_count == 2
+
+
+def test_part_flight_points_stitching():
+    part_flight_points = [
+        pd.DataFrame({"time": [0.0, 10.0], "mass": [1000.0, 990.0], "name": ["a", None]})
+    ]
+    new_flight_points = pd.DataFrame(
+        {"time": [10.0, 20.0], "mass": [990.0, 980.0], "name": ["b", "b"]}
+    )
+
+    FlightSequence._add_part_flight_points(
+        part_flight_points,
+        new_flight_points,
+        FlightPoint(mass=990.0),
+        part_has_target_mass=False,
+        consumed_mass_before_input_weight=0.0,
+    )
+
+    # Undefined value of previous last point is completed with new first point.
+    assert part_flight_points[0]["name"].tolist() == ["a", "b"]
+    assert len(part_flight_points[1]) == 1
+
+    flight_points = pd.concat(part_flight_points, ignore_index=True)
+    assert_allclose(flight_points.time, [0.0, 10.0, 20.0])
+
+    # Values of new first point may be 1-element arrays (e.g. with Breguet segments).
+    part_flight_points = [
+        pd.DataFrame({"time": [0.0, 10.0], "thrust": [1000.0, 0.0], "thrust_rate": [0.5, 0.0]})
+    ]
+    new_flight_points = pd.DataFrame(
+        {
+            "time": [10.0, 20.0],
+            "thrust": [np.array([900.0]), np.array([800.0])],
+            "thrust_rate": [np.array([0.4]), np.array([0.3])],
+        }
+    )
+    FlightSequence._add_part_flight_points(
+        part_flight_points,
+        new_flight_points,
+        FlightPoint(mass=980.0),
+        part_has_target_mass=False,
+        consumed_mass_before_input_weight=0.0,
+    )
+    assert_allclose(part_flight_points[0]["thrust"].iloc[-1], 900.0)
+    assert_allclose(part_flight_points[0]["thrust_rate"].iloc[-1], 0.4)
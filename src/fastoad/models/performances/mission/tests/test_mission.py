@@ -204,6 +204,43 @@ def test_mission(low_speed_polar, high_speed_polar, propulsion):
         rtol=1e-6,
     )
 
+    # Test with objective fuel, starting from previous solution ----------------
+    mission_5 = Mission(
+        name="mission5",
+        target_fuel_consumption=20100.0,
+        cruise_distance_solution=mission_4.cruise_distance_solution,
+    )
+    mission_5.extend([taxi_out, first_route, second_route])
+
+    flight_points = mission_5.compute_from(start)
+    assert_allclose(
+        flight_points.mass.iloc[0] - flight_points.mass.iloc[-1],
+        20100.0,
+        atol=mission_5.fuel_accuracy,
+    )
+    assert len(mission_5._fuel_evaluations) <= 3
+    assert (
+        mission_5.cruise_distance_solution.cruise_distance
+        > mission_4.cruise_distance_solution.cruise_distance
+    )
+
+    # Warm-started solving is sensitive to a small change of target fuel --------
+    # (as needed for finite differences)
+    ranges = []
+    for delta_fuel in [0.0, 1.0e-2]:
+        mission_6 = Mission(
+            name="mission6",
+            target_fuel_consumption=20100.0 + delta_fuel,
+            cruise_distance_solution=mission_5.cruise_distance_solution,
+        )
+        mission_6.extend([taxi_out, first_route, second_route])
+        ranges.append(mission_6.compute_from(start).ground_distance.iloc[-1])
+    assert_allclose(
+        (ranges[1] - ranges[0]) / 1.0e-2,
+        1.0 / mission_5.cruise_distance_solution.fuel_slope,
+        rtol=1.0e-2,
+    )
+
 
 def test_hybrid_mission(low_speed_polar, high_speed_polar, hybrid_propulsion):
 
@@ -287,7 +324,7 @@ def test_hybrid_mission(low_speed_polar, high_speed_polar, hybrid_propulsion):
         # Check for the final value of the electric energy
         assert_allclose(
             flight_points.electric_energy.iloc[-1],
-            3.890237e9,
+            3.890243e9,
             1e-6,
         )
         # Check that the electric energy consumed since the start has been constructed properly.
@@ -0,0 +1,59 @@
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+from scipy.interpolate import interp1d
+
+from fastoad.models.performances.mission.polar import Polar
+
+
+def test_polar():
+    rng = np.random.default_rng(42)
+    cl = rng.permutation(np.linspace(0.0, 1.5, 31))  # unsorted on purpose
+    cd = 0.05 * cl**2 + 0.01 + 0.001 * rng.standard_normal(31)
+    alpha = cl / 6.0
+    polar = Polar(cl, cd, alpha)
+
+    assert_array_equal(polar.definition_cl, cl)
+    assert_array_equal(polar.definition_cd, cd)
+    assert_array_equal(polar.definition_alpha, alpha)
+
+    # Results are the same as with scipy interpolation, including extrapolation, and for
+    # scalar and array inputs.
+    ref_cd = interp1d(cl, cd, kind="quadratic", fill_value="extrapolate")
+    ref_cl = interp1d(alpha, cl, kind="linear", fill_value="extrapolate")
+    test_values = np.concatenate((np.linspace(-1.0, 3.0, 401), cl))
+    assert_array_equal(polar.cd(test_values), ref_cd(test_values))
+    assert_array_equal([polar.cd(value) for value in test_values], ref_cd(test_values))
+    assert_array_equal(polar.cd(), ref_cd(cl))
+    assert_array_equal(polar.cl(test_values), ref_cl(test_values))
+    assert_array_equal([polar.cl(value) for value in test_values], ref_cl(test_values))
+
+    # Optimal CL is the best one among a fine sampling.
+    cl_samples = np.linspace(0.0, 1.5, 150001)
+    assert_allclose(
+        polar.optimal_cl,
+        cl_samples[np.argmax(cl_samples / polar.cd(cl_samples))],
+        atol=1e-5,
+    )
+
+    with pytest.raises(ValueError):
+        Polar(cl, cd).cl(0.0)
+
+
+def test_optimal_cl_parabolic_polar():
+    cl = np.linspace(0.0, 1.5, 16)
+    polar = Polar(cl, 0.04 * cl**2 + 0.02)
+    assert_allclose(polar.optimal_cl, np.sqrt(0.02 / 0.04))
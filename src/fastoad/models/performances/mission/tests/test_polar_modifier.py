@@ -0,0 +1,54 @@
+#  This file is part of FAST-OAD : A framework for rapid Overall Aircraft Design
+#  Copyright (C) 2026 ONERA & ISAE-SUPAERO
+#  FAST is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+from numpy.testing import assert_allclose
+
+from fastoad.model_base import FlightPoint
+from fastoad.models.performances.mission.polar import IncrementedPolar, Polar
+from fastoad.models.performances.mission.polar_modifier import GroundEffectRaymer
+
+
+def test_ground_effect_raymer():
+    cl = np.arange(0.0, 1.5, 0.01) + 0.5
+    cd = 0.5e-1 * cl**2 + 0.01 + 0.001 * np.sin(10.0 * cl)
+    alpha = np.linspace(-2.2918311, 14.7823111, 150) / 180 * np.pi
+    polar = Polar(cl, cd, alpha)
+
+    polar_modifier = GroundEffectRaymer(
+        span=34.5,
+        landing_gear_height=2.5,
+        induced_drag_coefficient=0.034,
+        k_winglet=1.0,
+        k_cd=1.0,
+    )
+    modified_polar = polar_modifier.modify_polar(polar, FlightPoint(altitude=1.0))
+    assert isinstance(modified_polar, IncrementedPolar)
+    assert modified_polar.base_polar is polar
+
+    # Comparing with a polar that is fully defined with modified drag
+    h_b = (34.5 * 0.1 + 2.5 + 1.0) / 34.5
+    k_ground = 33.0 * h_b**1.5 / (1 + 33.0 * h_b**1.5)
+    cd_ground = 0.034 * cl**2 * (k_ground - 1)
+    ref_polar = Polar(cl, cd + cd_ground, alpha)
+
+    assert_allclose(modified_polar.definition_cl, ref_polar.definition_cl)
+    assert_allclose(modified_polar.definition_cd, ref_polar.definition_cd)
+    assert_allclose(modified_polar.definition_alpha, ref_polar.definition_alpha)
+    assert_allclose(modified_polar.cd(), ref_polar.cd(), rtol=1e-12)
+
+    # Inside and outside definition range
+    test_cl = np.linspace(0.0, 2.5, 51)
+    assert_allclose(modified_polar.cd(test_cl), ref_polar.cd(test_cl), rtol=1e-12)
+    assert_allclose(modified_polar.cl(0.1), ref_polar.cl(0.1))
+    assert_allclose(modified_polar.optimal_cl, ref_polar.optimal_cl, rtol=1e-6)
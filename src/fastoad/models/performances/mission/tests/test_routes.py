@@ -14,6 +14,7 @@
 
 import shutil
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from numpy.testing import assert_allclose
@@ -77,7 +78,11 @@ def test_ranged_route(low_speed_polar, high_speed_polar, propulsion, cleanup):
     start = FlightPoint(
         true_airspeed=150.0 * knot, altitude=100.0 * foot, mass=70000.0, ground_distance=100000.0
     )
-    flight_points = flight_calculator.compute_from(start)
+    with patch.object(climb, "compute_from", wraps=climb.compute_from) as climb_computation:
+        flight_points = flight_calculator.compute_from(start)
+
+    # Climb phases do not depend on cruise distance and are computed only once.
+    assert climb_computation.call_count == 1
 
     # Useful for debugging
     # plot_flight(flight_points, "test_ranged_flight.png", RESULTS_FOLDER_PATH)  # noqa: ERA001